@@ -0,0 +1,184 @@
+"""
+assets.py — Carga centralizada de imágenes y fuentes de Click & Hide.
+
+Todas las pantallas piden sus recursos a este módulo en lugar de construir
+rutas y cargarlos cada vez:
+  - Las rutas relativas (IMAGES_PATH, FONT_PATH...) se resuelven una sola vez
+    respecto a la carpeta del juego.
+  - Las imágenes se guardan ya convertidas al formato de la pantalla
+    (`convert()` o `convert_alpha()`) y, si se piden con tamaño, ya escaladas.
+  - Las fuentes se guardan por (ruta, tamaño); `path=None` es la fuente por
+    defecto de Pygame (la que devolvía `SysFont(None, tamaño)` sin recorrer
+    las fuentes del sistema).
+  - Se anota cuánto tardó cada carga (`report()`).
+
+Las superficies y fuentes devueltas se comparten: no deben modificarse
+(por ejemplo con `set_alpha` o `fill`); para eso, usar una copia.
+Las imágenes solo pueden cargarse después de crear la ventana.
+"""
+
+import os
+import time
+
+import pygame
+
+from config import IMAGES_PATH, FONT_PATH, FONT_MEDIUM
+
+# Carpeta del juego: las rutas de config.py son relativas a ella
+BASE_PATH = os.path.dirname(os.path.abspath(__file__))
+
+
+# --- CLASE PRINCIPAL: ASSETMANAGER ---
+class AssetManager:
+    """
+    Caché de imágenes y fuentes con medición del tiempo de carga.
+
+    Atributos:
+        base_path (str): Carpeta respecto a la que se resuelven las rutas.
+        load_times (dict): Segundos que tardó cada recurso cargado, por clave.
+
+    Métodos:
+        path(relative): Ruta absoluta de un recurso (resuelta una sola vez).
+        image(name, size, alpha): Imagen convertida (y escalada) desde IMAGES_PATH.
+        font(path, size): Fuente por ruta y tamaño.
+        clear(): Vacía la caché.
+        report(): Muestra los tiempos de carga.
+    """
+
+    def __init__(self, base_path=BASE_PATH):
+        """
+        Inicializa la caché vacía.
+
+        Args:
+            base_path (str): Carpeta respecto a la que se resuelven las rutas.
+        """
+        self.base_path = base_path
+        self.load_times = {}
+        self._paths = {}
+        self._images = {}
+        self._fonts = {}
+
+    def path(self, relative):
+        """
+        Devuelve la ruta absoluta de un recurso.
+
+        Args:
+            relative (str): Ruta relativa a la carpeta del juego.
+
+        Returns:
+            str: Ruta absoluta.
+        """
+        resolved = self._paths.get(relative)
+        if resolved is None:
+            resolved = os.path.join(self.base_path, *relative.split("/"))
+            self._paths[relative] = resolved
+        return resolved
+
+    def image(self, name, size=None, alpha=False):
+        """
+        Devuelve una imagen de IMAGES_PATH, cargándola solo la primera vez.
+
+        Args:
+            name (str): Nombre del archivo (por ejemplo "clase.png").
+            size (tuple[int, int], opcional): Tamaño final (se escala con suavizado).
+            alpha (bool): Si se conserva la transparencia (`convert_alpha`).
+
+        Returns:
+            pygame.Surface: Imagen compartida (no modificar).
+        """
+        key = (name, size, alpha)
+        surface = self._images.get(key)
+        if surface is not None:
+            return surface
+
+        if size is None:
+            start = time.perf_counter()
+            surface = pygame.image.load(self.path(f"{IMAGES_PATH}/{name}"))
+            surface = surface.convert_alpha() if alpha else surface.convert()
+        else:
+            # Se escala desde la imagen original ya cargada (con transparencia,
+            # que es el formato que admite `smoothscale`); su carga se anota aparte
+            original = self.image(name, alpha=True)
+            start = time.perf_counter()
+            surface = pygame.transform.smoothscale(original, size)
+            if not alpha:
+                surface = surface.convert()
+        self._images[key] = surface
+        self.load_times[("image",) + key] = time.perf_counter() - start
+        return surface
+
+    def font(self, path=FONT_PATH, size=FONT_MEDIUM):
+        """
+        Devuelve una fuente, creándola solo la primera vez.
+
+        Args:
+            path (str | None): Ruta relativa del archivo TTF, o None para la
+                fuente por defecto de Pygame.
+            size (int): Tamaño en puntos.
+
+        Returns:
+            pygame.font.Font: Fuente compartida.
+        """
+        key = (path, size)
+        font = self._fonts.get(key)
+        if font is not None:
+            return font
+
+        start = time.perf_counter()
+        font = pygame.font.Font(None if path is None else self.path(path), size)
+        self._fonts[key] = font
+        self.load_times[("font",) + key] = time.perf_counter() - start
+        return font
+
+    def clear(self):
+        """Vacía la caché de imágenes y fuentes (por ejemplo, al cambiar de ventana)."""
+        self._images.clear()
+        self._fonts.clear()
+
+    def report(self):
+        """
+        Muestra por consola los recursos cargados y su tiempo de carga.
+
+        Returns:
+            float: Tiempo total de carga en segundos.
+        """
+        total = sum(self.load_times.values())
+        print(f"[ASSETS] {len(self.load_times)} recursos cargados en {total * 1000:.1f} ms")
+        for key, seconds in sorted(self.load_times.items(), key=lambda kv: -kv[1]):
+            kind, name, *rest = key
+            detail = " ".join(str(value) for value in rest if value not in (None, False))
+            print(f"  {seconds * 1000:8.2f} ms  {kind:5} {name or 'default'} {detail}")
+        return total
+
+
+# Instancia compartida por todas las pantallas del juego
+assets = AssetManager()
+
+
+def load_image(name, size=None, alpha=False):
+    """
+    Devuelve una imagen usando la caché compartida del juego.
+
+    Args:
+        name (str): Nombre del archivo en IMAGES_PATH.
+        size (tuple[int, int], opcional): Tamaño final.
+        alpha (bool): Si se conserva la transparencia.
+
+    Returns:
+        pygame.Surface: Imagen compartida (no modificar).
+    """
+    return assets.image(name, size, alpha)
+
+
+def load_font(path=FONT_PATH, size=FONT_MEDIUM):
+    """
+    Devuelve una fuente usando la caché compartida del juego.
+
+    Args:
+        path (str | None): Ruta relativa del archivo TTF, o None para la fuente por defecto.
+        size (int): Tamaño en puntos.
+
+    Returns:
+        pygame.font.Font: Fuente compartida.
+    """
+    return assets.font(path, size)
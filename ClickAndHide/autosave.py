@@ -0,0 +1,251 @@
+"""
+autosave.py — Guardado automático en segundo plano de Click & Hide.
+
+El bucle de juego ya no escribe en disco en cada fotograma. En su lugar:
+  - `AutoSaver` se suscribe a los eventos de la partida (clics, compras e
+    ingresos) y anota que hay cambios; los cambios que no son eventos
+    (reinicio, carga) se marcan con el atributo `dirty` de `Player` y `Shop`.
+  - `AutoSaver` agrupa los cambios y solo guarda cada `AUTOSAVE_INTERVAL`
+    segundos, al volver al menú (ESC) o al cerrar el juego.
+  - La escritura la realiza un hilo en segundo plano, de modo que el bucle
+    de dibujo nunca se bloquea esperando al disco.
+  - Se cuentan las escrituras y los bytes escritos para poder medir el ahorro.
+
+Con un diario (`journal.SaveJournal`), cada evento ya queda registrado en el
+momento y las instantáneas completas solo sirven para compactar el diario.
+"""
+
+import threading
+import time
+
+from config import AUTOSAVE_INTERVAL, JOURNAL_COMPACT_EVERY
+from core.events import CLICKED, PURCHASED, INCOME_APPLIED
+from save import build_save_data, write_save_data
+
+
+# --- CLASE PRINCIPAL: AUTOSAVER ---
+class AutoSaver:
+    """
+    Programador de guardado que agrupa cambios y escribe en un hilo aparte.
+
+    Atributos:
+        player (Player): Jugador cuyo estado se guarda.
+        shop (Shop): Tienda cuyo estado se guarda.
+        interval (float): Segundos mínimos entre escrituras periódicas.
+        journal (SaveJournal | None): Diario que se compacta tras cada instantánea.
+        writes (int): Número de escrituras realizadas en disco.
+        bytes_written (int): Total de bytes escritos en disco.
+        snapshots (int): Número de instantáneas enviadas al hilo de escritura.
+        coalesced (int): Instantáneas descartadas por llegar otra más reciente.
+
+    Métodos:
+        attach(events): Anota como cambios los eventos publicados en un bus.
+        start(): Arranca el hilo de escritura.
+        update(now): Guarda si hay cambios y ya pasó el intervalo.
+        flush(): Envía inmediatamente los cambios pendientes al hilo de escritura.
+        save_now(): Escribe una instantánea en este hilo y compacta el diario.
+        close(): Guarda lo pendiente, detiene el hilo y espera a que termine.
+    """
+
+    def __init__(
+        self, player, shop, interval=AUTOSAVE_INTERVAL, writer=write_save_data, journal=None
+    ):
+        """
+        Inicializa el programador sin arrancar todavía el hilo.
+
+        Args:
+            player (Player): Instancia del jugador.
+            shop (Shop): Instancia de la tienda.
+            interval (float): Segundos entre guardados periódicos.
+            writer (callable): Función que escribe los datos y devuelve los bytes escritos.
+            journal (SaveJournal, opcional): Diario de eventos a compactar.
+        """
+        self.player = player
+        self.shop = shop
+        self.interval = interval
+        self.writer = writer
+        self.journal = journal
+
+        self.writes = 0
+        self.bytes_written = 0
+        self.snapshots = 0
+        self.coalesced = 0
+
+        self._changed = False
+        self._pending = None
+        self._stopping = False
+        self._cond = threading.Condition()
+        self._write_lock = threading.Lock()  # Una escritura (y compactación) a la vez
+        self._thread = None
+        self._last_flush = time.monotonic()
+
+    # --- SUSCRIPCIÓN A LOS EVENTOS ---
+    def attach(self, events):
+        """
+        Suscribe el programador a los eventos que cambian el estado guardable.
+
+        Args:
+            events (EventBus): Bus de eventos de la partida.
+        """
+        for event in (CLICKED, PURCHASED, INCOME_APPLIED):
+            events.subscribe(event, self._mark_changed)
+
+    def _mark_changed(self, *args):
+        """Anota que hay cambios sin guardar (ignora los argumentos del evento)."""
+        self._changed = True
+
+    # --- CICLO DE VIDA DEL HILO ---
+    def start(self):
+        """Arranca el hilo de escritura en segundo plano (si no estaba activo)."""
+        if self._thread is None:
+            self._stopping = False
+            self._thread = threading.Thread(
+                target=self._worker, name="autosave", daemon=True
+            )
+            self._thread.start()
+
+    def close(self):
+        """
+        Guarda los cambios pendientes, detiene el hilo y espera a que termine.
+
+        Tras cerrar, muestra por consola las estadísticas de escritura.
+        """
+        self.flush()
+        if self._thread is not None:
+            with self._cond:
+                self._stopping = True
+                self._cond.notify()
+            self._thread.join()
+            self._thread = None
+        else:
+            # Sin hilo activo, se escribe directamente lo pendiente
+            self._write_pending()
+        if self.journal is not None:
+            self.journal.close()
+        print(
+            f"[SAVE] {self.writes} escrituras, {self.bytes_written} bytes "
+            f"({self.coalesced} guardados agrupados)"
+        )
+
+    # --- PROGRAMACIÓN DE GUARDADOS ---
+    def is_dirty(self):
+        """
+        Indica si el jugador o la tienda tienen cambios sin guardar.
+
+        Returns:
+            bool: True si hay cambios pendientes.
+        """
+        return (
+            self._changed
+            or getattr(self.player, "dirty", True)
+            or getattr(self.shop, "dirty", True)
+        )
+
+    def update(self, now=None):
+        """
+        Comprueba si corresponde un guardado periódico y lo programa.
+
+        Args:
+            now (float, opcional): Tiempo monótono actual. Si no se pasa, se usa time.monotonic().
+
+        Returns:
+            bool: True si se programó un guardado.
+        """
+        if now is None:
+            now = time.monotonic()
+        journal_full = (
+            self.journal is not None and self.journal.pending >= JOURNAL_COMPACT_EVERY
+        )
+        if now - self._last_flush < self.interval and not journal_full:
+            return False
+        return self.flush(now)
+
+    def flush(self, now=None):
+        """
+        Programa el guardado inmediato de los cambios pendientes.
+
+        Si el hilo aún no ha escrito una instantánea anterior, esta se sustituye
+        por la nueva, de modo que nunca se escribe más de una vez lo mismo.
+
+        Args:
+            now (float, opcional): Tiempo monótono actual.
+
+        Returns:
+            bool: True si había cambios y se programó un guardado.
+        """
+        self._last_flush = time.monotonic() if now is None else now
+        if not self.is_dirty():
+            return False
+
+        data = self._snapshot()
+        with self._cond:
+            if self._pending is not None:
+                self.coalesced += 1
+            self._pending = data
+            self.snapshots += 1
+            self._cond.notify()
+        return True
+
+    def save_now(self):
+        """
+        Escribe ya, sin esperar al hilo, una instantánea y compacta el diario.
+
+        Se usa al empezar una partida nueva: si la instantánea en disco fuera
+        aún la de la partida anterior, un cierre forzado la recuperaría con los
+        eventos nuevos del diario encima. Una instantánea pendiente más antigua
+        se descarta, y si el hilo está escribiendo una se espera a que acabe.
+
+        Returns:
+            int: Número de bytes escritos (0 si falló la escritura).
+        """
+        self._last_flush = time.monotonic()
+        data = self._snapshot()
+        with self._cond:
+            if self._pending is not None:
+                self.coalesced += 1
+            self._pending = None
+        return self._write(data)
+
+    def _snapshot(self):
+        """Copia el estado guardable (con la secuencia del diario) y lo marca como guardado."""
+        data = build_save_data(self.player, self.shop)
+        if self.journal is not None:
+            data["journal_seq"] = self.journal.seq
+        self._changed = False
+        self.player.dirty = False
+        self.shop.dirty = False
+        return data
+
+    # --- ESCRITURA EN SEGUNDO PLANO ---
+    def _write_pending(self):
+        """Escribe la instantánea pendiente (si existe)."""
+        with self._cond:
+            data, self._pending = self._pending, None
+        if data is not None:
+            self._write(data)
+
+    def _write(self, data):
+        """
+        Escribe una instantánea, compacta el diario y actualiza los contadores.
+
+        Returns:
+            int: Número de bytes escritos (0 si falló la escritura).
+        """
+        with self._write_lock:
+            written = self.writer(data)
+            if written:
+                self.writes += 1
+                self.bytes_written += written
+                if self.journal is not None:
+                    self.journal.compact(data.get("journal_seq", 0))
+        return written
+
+    def _worker(self):
+        """Bucle del hilo de escritura: espera instantáneas y las guarda en disco."""
+        while True:
+            with self._cond:
+                while self._pending is None and not self._stopping:
+                    self._cond.wait()
+                if self._pending is None and self._stopping:
+                    return
+            self._write_pending()
@@ -2,41 +2,95 @@
 auxiliary.py — Funciones auxiliares para Click & Hide.
 
 Incluye utilidades generales:
-- Lógica simple (control de dinero, cooldowns)
+- Lógica simple (control de dinero, cooldowns), definida en `core/rules.py`
 - Funciones de dibujo (fondo, cabecera, paneles)
+- Caché de capas estáticas (degradados del fondo y de la cabecera)
 """
 
 import pygame
-import time
-from config import *
+from text_cache import render_text
+from core.bignum import format_short
+from core.rules import clamp_money, can_earn  # noqa: F401 (re-exportadas)
 
+try:  # numpy es opcional: solo acelera la creación de los degradados
+    import numpy
+    import pygame.surfarray as surfarray
+except ImportError:
+    numpy = surfarray = None
 
-# --- LÓGICA SIMPLE ---
-def clamp_money(money):
-    """
-    Limita el dinero del jugador a un valor mínimo de 0.
 
-    Args:
-        money (float): Cantidad de dinero actual.
+# --- CACHÉ DE CAPAS ESTÁTICAS ---
+# Superficies ya dibujadas, indexadas por (capa, ancho, alto, pantalla completa)
+_layer_cache = {}
 
-    Returns:
-        float: Dinero corregido (0 si es negativo).
+HEADER_HEIGHT = 60  # Altura de la cabecera del juego
+
+
+def invalidate_layers():
     """
-    return max(0, money)
+    Descarta todas las capas cacheadas.
 
+    Se llama al cambiar el tamaño de la ventana o el modo de pantalla completa (F11);
+    además, las capas se regeneran solas si cambia el tamaño pedido.
+    """
+    _layer_cache.clear()
+
+
+def _is_fullscreen():
+    """Indica si la ventana actual está en modo pantalla completa."""
+    surface = pygame.display.get_surface()
+    return bool(surface and surface.get_flags() & pygame.FULLSCREEN)
 
-def can_earn(last_earn_time):
+
+def _gradient_surface(width, height, row_color):
     """
-    Indica si el jugador puede volver a ganar dinero tras el cooldown.
+    Crea una superficie con un degradado vertical, una fila de color por línea.
+
+    Usa `surfarray` si numpy está disponible; si no, dibuja una sola columna
+    y la escala al ancho total (el resultado es idéntico).
 
     Args:
-        last_earn_time (float): Tiempo del último clic o ganancia.
+        width (int): Ancho de la superficie.
+        height (int): Alto de la superficie.
+        row_color (callable): Función que devuelve el color RGB de la fila `y`.
 
     Returns:
-        bool: True si ya pasó el tiempo de espera.
+        pygame.Surface: Superficie con el degradado.
     """
-    now = time.time()
-    return now - last_earn_time >= EARN_COOLDOWN
+    colors = [row_color(y) for y in range(height)]
+    if surfarray is not None:
+        column = numpy.array(colors, dtype=numpy.uint8)
+        pixels = numpy.broadcast_to(column, (width, height, 3))
+        surface = surfarray.make_surface(pixels)
+    else:
+        column = pygame.Surface((1, height))
+        for y, color in enumerate(colors):
+            column.set_at((0, y), color)
+        surface = pygame.transform.scale(column, (width, height))
+
+    if pygame.display.get_surface() is not None:
+        surface = surface.convert()
+    return surface
+
+
+def _cached_layer(name, width, height, row_color):
+    """Devuelve la capa `name` del tamaño indicado, creándola solo la primera vez."""
+    key = (name, width, height, _is_fullscreen())
+    layer = _layer_cache.get(key)
+    if layer is None:
+        layer = _gradient_surface(width, height, row_color)
+        _layer_cache[key] = layer
+    return layer
+
+
+def _background_color(y):
+    """Color de la fila `y` del fondo degradado."""
+    return (250 - y // 15, 240 - y // 20, 210 - y // 30)
+
+
+def _header_color(y):
+    """Color de la fila `y` del degradado de la cabecera."""
+    return (180 + y // 3, 150 + y // 2, 100 + y // 3)
 
 
 # --- DIBUJO DE INTERFAZ ---
@@ -44,14 +98,14 @@ def draw_gradient_background(screen, width, height):
     """
     Dibuja un fondo degradado vertical con tonos beige.
 
+    El degradado se genera una vez por tamaño de ventana y después solo se copia.
+
     Args:
         screen (pygame.Surface): Superficie donde se dibuja.
         width (int): Ancho total del área de dibujo.
         height (int): Alto total del área de dibujo.
     """
-    for y in range(height):
-        color = (250 - y // 15, 240 - y // 20, 210 - y // 30)
-        pygame.draw.line(screen, color, (0, y), (width, y))
+    screen.blit(_cached_layer("background", width, height, _background_color), (0, 0))
 
 
 def draw_header(screen, font_medium, font_small, player):
@@ -70,23 +124,20 @@ def draw_header(screen, font_medium, font_small, player):
         font_small (pygame.font.Font): Fuente para los textos secundarios.
         player (Player): Instancia del jugador con estadísticas actuales.
     """
-    header_height = 60
     width, _ = screen.get_size()
 
-    # --- Fondo degradado del encabezado ---
-    for y in range(header_height):
-        c = (180 + y // 3, 150 + y // 2, 100 + y // 3)
-        pygame.draw.line(screen, c, (0, y), (width, y))
+    # --- Fondo degradado del encabezado (cacheado) ---
+    screen.blit(_cached_layer("header", width, HEADER_HEIGHT, _header_color), (0, 0))
 
-    # --- Textos ---
-    money_text = font_medium.render(f"${int(player.money)}", True, (255, 255, 255))
-    clicks_text = font_small.render(
-        f"Clicks: {player.total_clicks}", True, (240, 240, 220)
-    )
-    income_text = font_small.render(
-        f"+{player.click_income}/click", True, (240, 255, 200)
+    # --- Textos (cantidades en formato corto: 1.23K, 4.5M...) ---
+    # Dinero y clics cambian con cada clic: no se guardan en la caché de textos,
+    # donde solo expulsarían a las etiquetas fijas
+    money_text = font_medium.render(f"${format_short(player.money)}", True, (255, 255, 255))
+    clicks_text = font_small.render(f"Clicks: {player.total_clicks}", True, (240, 240, 220))
+    income_text = render_text(
+        font_small, f"+{format_short(player.click_income)}/click", (240, 255, 200)
     )
-    auto_text = font_small.render(f"+{player.auto_income:.1f}/s", True, (255, 240, 200))
+    auto_text = render_text(font_small, f"+{format_short(player.auto_income)}/s", (255, 240, 200))
 
     # --- Posiciones ---
     screen.blit(money_text, (20, 15))
@@ -0,0 +1,129 @@
+"""
+benchmarks/bench_save.py
+
+Compara el guardado JSON antiguo con el formato binario de `save_format`.
+
+Para catálogos de distinto tamaño mide el tamaño del guardado y el tiempo de
+una ida y vuelta completa (serializar + deserializar + restaurar la tienda).
+
+Uso (desde la carpeta ClickAndHide):
+    python -m benchmarks.bench_save
+"""
+
+import json
+import timeit
+
+from core.bignum import BigNumber
+from core.catalog import Catalog
+from entities.player import Player
+from entities.shop import Shop
+import save
+import save_format
+
+
+# --- DATOS DE PRUEBA ---
+def make_game(item_count):
+    """
+    Crea un jugador y una tienda con `item_count` ítems y cantidades variadas.
+
+    Args:
+        item_count (int): Número de ítems del catálogo.
+
+    Returns:
+        tuple[Player, Shop]: Jugador y tienda de prueba.
+    """
+    player = Player()
+    player.money = BigNumber(123456789)
+    player.total_clicks = 98765
+    catalog = Catalog.from_definitions(
+        {
+            "name": f"Ítem {i} (+{i}/s)",
+            "cost": 10 + i * 7,
+            "income": i + 1,
+            "tipo": "auto",
+            "color": (230, 200, 150),
+        }
+        for i in range(item_count)
+    )
+    shop = Shop(catalog=catalog)
+    for i, item in enumerate(shop.items):
+        item.amount = i % 50
+    return player, shop
+
+
+# --- FORMATO ANTIGUO (JSON por posición) ---
+def legacy_dump(player, shop):
+    """Serializa como lo hacía `save_game` antes del formato binario."""
+    data = {
+        "player": {
+            "money": float(player.money),
+            "total_clicks": player.total_clicks,
+            "click_income": player.click_income,
+            "auto_income": player.auto_income,
+            "total_money": float(player.money),
+        },
+        "shop": [
+            {
+                "name": item.name,
+                "cost": int(item.cost),
+                "base_income": item.base_income,
+                "tipo": item.tipo,
+                "amount": item.amount,
+            }
+            for item in shop.items
+        ],
+    }
+    return json.dumps(data, indent=4).encode("utf-8")
+
+
+def legacy_load(blob, player, shop):
+    """Restaura como lo hacía `load_game` antes del formato binario."""
+    data = json.loads(blob)
+    player_data = data.get("player", {})
+    player.money = player_data.get("money", player.money)
+    player.total_clicks = player_data.get("total_clicks", player.total_clicks)
+    for item, saved_item in zip(shop.items, data.get("shop", [])):
+        item.amount = saved_item.get("amount", item.amount)
+
+
+# --- FORMATO BINARIO ---
+def binary_dump(player, shop):
+    """Serializa con el formato binario actual."""
+    return save_format.encode(save.build_save_data(player, shop))
+
+
+def binary_load(blob, player, shop):
+    """Restaura con el formato binario actual."""
+    save.apply_save_data(player, shop, save_format.decode(blob))
+
+
+# --- EJECUCIÓN ---
+def run(sizes=(9, 100, 1000, 10000), repeat=5):
+    """
+    Ejecuta la comparación y muestra una tabla con los resultados.
+
+    Args:
+        sizes (tuple[int]): Tamaños de catálogo a probar.
+        repeat (int): Repeticiones por medida (se toma la mejor).
+    """
+    print(f"{'items':>6} {'formato':>8} {'bytes':>10} {'ida+vuelta (ms)':>16}")
+    for size in sizes:
+        player, shop = make_game(size)
+        number = max(1, 2000 // size)
+        for label, dump, load in (
+            ("json", legacy_dump, legacy_load),
+            ("binario", binary_dump, binary_load),
+        ):
+            blob = dump(player, shop)
+            best = min(
+                timeit.repeat(
+                    lambda: load(dump(player, shop), player, shop),
+                    number=number,
+                    repeat=repeat,
+                )
+            )
+            print(f"{size:>6} {label:>8} {len(blob):>10} {best / number * 1000:>16.3f}")
+
+
+if __name__ == "__main__":
+    run()
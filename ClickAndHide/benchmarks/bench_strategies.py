@@ -0,0 +1,65 @@
+"""
+benchmarks/bench_strategies.py
+
+Compara las estrategias de compra del bot (`core.strategy`).
+
+Para cada estrategia simula una partida sin ventana (`core.simulation`)
+con un clic en cuanto lo permite el cooldown y mide el tiempo de juego
+necesario para ganar $1,000,000 en total (dinero actual + dinero gastado).
+
+Uso (desde la carpeta ClickAndHide):
+    python -m benchmarks.bench_strategies
+"""
+
+import time
+
+from config import EARN_COOLDOWN
+from core.simulation import Simulation
+from core.strategy import STRATEGIES, create_strategy
+
+
+# --- SIMULACIÓN ---
+def time_to_target(name, target=1_000_000, dt=EARN_COOLDOWN, max_time=24 * 3600):
+    """
+    Simula una partida con una estrategia hasta ganar `target` en total.
+
+    Args:
+        name (str): Nombre de la estrategia.
+        target (float): Dinero total a ganar.
+        dt (float): Segundos simulados por paso (un clic por paso).
+        max_time (float): Tiempo simulado máximo.
+
+    Returns:
+        tuple[float | None, int]: Segundos de juego hasta el objetivo
+        (None si no se alcanzó) y mejoras compradas.
+    """
+    sim = Simulation()
+    strategy = create_strategy(name)
+    spent = 0
+    while sim.time < max_time:
+        sim.step(dt, click=True)
+        spent += strategy.act(sim.shop, sim.player)
+        if sim.player.money + spent >= target:
+            return sim.time, sim.player.upgrades_bought
+    return None, sim.player.upgrades_bought
+
+
+# --- EJECUCIÓN ---
+def run(target=1_000_000):
+    """
+    Ejecuta la comparación y muestra una tabla con los resultados.
+
+    Args:
+        target (float): Dinero total a ganar.
+    """
+    print(f"{'estrategia':>10} {'tiempo de juego':>16} {'mejoras':>8} {'cálculo (s)':>12}")
+    for name in STRATEGIES:
+        start = time.perf_counter()
+        seconds, upgrades = time_to_target(name, target)
+        elapsed = time.perf_counter() - start
+        result = "no alcanzado" if seconds is None else f"{seconds / 60:.1f} min"
+        print(f"{name:>10} {result:>16} {upgrades:>8} {elapsed:>12.2f}")
+
+
+if __name__ == "__main__":
+    run()
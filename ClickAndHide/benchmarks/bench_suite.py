@@ -0,0 +1,384 @@
+"""
+benchmarks/bench_suite.py
+
+Batería de microbenchmarks de Click & Hide con referencias guardadas.
+
+Cada caso repite una operación concreta del juego un número fijo de veces,
+siempre con los mismos datos (sin reloj real ni azar), y se queda con el
+mejor de varios intentos:
+  - Economía: 1M de `Player.click` y 100k compras con `Shop.handle_click`.
+  - Guardado: ida y vuelta `save_game` + `load_game` con 10 a 10.000 ítems.
+  - Logros: `update_achievements` con 4 a 5.000 logros definidos.
+  - Dibujo: `Shop.draw` y `draw_header` sobre una superficie fuera de pantalla.
+
+Los resultados se comparan con los de `baselines.json`: si algún caso tarda
+más que su referencia multiplicada por (1 + umbral), el programa termina con
+código 1. Las referencias dependen de la máquina; se regeneran con `--update`.
+
+Los casos de guardado esperan a `fsync` y su tiempo varía mucho entre
+ejecuciones, así que se repiten al menos SAVE_MIN_REPEAT veces y toleran
+un umbral mayor (SAVE_THRESHOLD).
+
+Uso (desde la carpeta ClickAndHide):
+    python -m benchmarks.bench_suite                 # Compara con las referencias
+    python -m benchmarks.bench_suite --update        # Guarda los resultados como referencia
+    python -m benchmarks.bench_suite -k save -t 0.5  # Solo casos "save", umbral del 50%
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import math
+import os
+import sys
+import tempfile
+import time
+
+import pygame
+
+from config import WIDTH, HEIGHT, FONT_PATH, FONT_SMALL, FONT_MEDIUM, FONT_BIG
+from assets import load_font
+from auxiliary import draw_header
+from core.achievements import AchievementsModel, METRICS
+from core.bignum import BigNumber
+from core.catalog import Catalog
+from core.clock import FixedStepClock
+from entities.player import Player
+from entities.shop import Shop
+import save
+
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines.json")
+DEFAULT_THRESHOLD = 0.25  # Margen de tiempo tolerado sobre la referencia (25%)
+DEFAULT_REPEAT = 5  # Intentos por caso (se toma el mejor)
+SAVE_THRESHOLD = 0.75  # Margen mínimo de los casos de guardado (dependen de fsync)
+SAVE_MIN_REPEAT = 15  # Intentos mínimos de los casos de guardado
+
+
+# --- DATOS DE PRUEBA ---
+def make_catalog(item_count):
+    """
+    Crea un catálogo de `item_count` ítems con precios e ingresos crecientes.
+
+    Args:
+        item_count (int): Número de ítems.
+
+    Returns:
+        Catalog: Catálogo de prueba.
+    """
+    return Catalog.from_definitions(
+        {
+            "name": f"Ítem {i}",
+            "cost": 10 + i * 7,
+            "income": i + 1,
+            "tipo": "auto",
+            "color": (230, 200, 150),
+        }
+        for i in range(item_count)
+    )
+
+
+def make_definitions(count):
+    """
+    Crea `count` logros repartidos entre las métricas, con umbrales crecientes.
+
+    Args:
+        count (int): Número de logros.
+
+    Returns:
+        list[dict]: Definiciones de logros.
+    """
+    return [
+        {
+            "name": f"LOGRO {i}",
+            "desc": "Prueba.",
+            "metric": METRICS[i % len(METRICS)],
+            "threshold": 10 * (i // len(METRICS) + 1),
+        }
+        for i in range(count)
+    ]
+
+
+def init_display():
+    """Crea la ventana (falsa) necesaria para convertir superficies y usar fuentes."""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")  # Sin ventana real
+    pygame.display.init()
+    pygame.font.init()
+    if pygame.display.get_surface() is None:
+        pygame.display.set_mode((WIDTH, HEIGHT))
+
+
+# --- CASOS ---
+# Cada caso prepara sus datos y devuelve la función que se mide; la
+# preparación no cuenta en el tiempo.
+def case_player_click(count=1_000_000):
+    """`count` clics válidos (cada uno pasado el cooldown)."""
+    player = Player(FixedStepClock(source=lambda: 0.0))  # El reloj empieza (y se queda) en 0
+
+    def run():
+        player.reset()
+        click = player.click
+        for i in range(count):
+            click((i + 1) * 0.25)
+        assert player.total_clicks == count
+
+    return run
+
+
+def case_shop_purchases(count=100_000):
+    """`count` compras de una unidad con clics sobre los ítems visibles de la tienda."""
+    init_display()
+    fonts = (load_font(FONT_PATH, FONT_SMALL), load_font(FONT_PATH, FONT_BIG))
+    surface = pygame.Surface((WIDTH, HEIGHT))
+    player = Player()
+    shop = Shop()
+    shop.draw(surface, fonts[0], fonts[1], player, (0, 0), WIDTH, HEIGHT)  # Calcula la geometría
+    shop.set_buy_mode(1)
+    stride = shop.list_rect.height // 4
+    positions = [(shop.list_rect.centerx, shop.list_rect.y + 5 + i * stride) for i in range(4)]
+    positions = [pos for pos in positions if shop.item_index_at(pos) is not None]
+
+    def run():
+        shop.init_items()
+        player.reset()
+        player.money = BigNumber.from_log(20000.0)  # Suficiente para todas las compras
+        handle_click = shop.handle_click
+        for i in range(count):
+            handle_click(positions[i % len(positions)], player)
+        assert player.upgrades_bought == count
+
+    return run
+
+
+def case_save_load(item_count, count=20):
+    """`count` idas y vueltas `save_game` + `load_game` de una partida con `item_count` ítems."""
+    player = Player()
+    player.money = BigNumber(123456789)
+    player.total_clicks = 98765
+    shop = Shop(catalog=make_catalog(item_count))
+    for i, item in enumerate(shop.items):
+        item.amount = i % 50
+
+    def run():
+        original = save.SAVE_FILE, save.LEGACY_SAVE_FILE
+        with tempfile.TemporaryDirectory(prefix="clickandhide-bench-") as folder:
+            save.SAVE_FILE = os.path.join(folder, "savegame.dat")
+            save.LEGACY_SAVE_FILE = os.path.join(folder, "savegame.json")
+            try:
+                with contextlib.redirect_stdout(io.StringIO()):  # `load_game` informa por consola
+                    for _ in range(count):
+                        save.save_game(player, shop)
+                        save.load_game(player, shop)
+            finally:
+                save.SAVE_FILE, save.LEGACY_SAVE_FILE = original
+
+    return run
+
+
+def case_achievements(achievement_count, count=100_000):
+    """`count` llamadas a `update_achievements` con `achievement_count` logros definidos."""
+    definitions = make_definitions(achievement_count)
+
+    def run():
+        model = AchievementsModel(definitions)
+        update = model.update_achievements
+        for i in range(count):
+            # Las métricas crecen poco a poco: se desbloquea algún logro de vez en cuando
+            update({"money": i, "total_clicks": i // 2, "upgrades_bought": i // 100})
+
+    return run
+
+
+def case_shop_draw(count=2000):
+    """`count` dibujos de la tienda fuera de pantalla, con el cursor recorriendo los ítems."""
+    init_display()
+    font_small = load_font(FONT_PATH, FONT_SMALL)
+    font_big = load_font(FONT_PATH, FONT_BIG)
+    surface = pygame.Surface((WIDTH, HEIGHT)).convert()
+    player = Player()
+    player.money = BigNumber(5000)
+    shop = Shop()
+    shop.draw(surface, font_small, font_big, player, (0, 0), WIDTH, HEIGHT)
+    x = shop.list_rect.centerx
+    ys = range(shop.list_rect.top, shop.list_rect.bottom, 7)
+
+    def run():
+        draw = shop.draw
+        for i in range(count):
+            draw(surface, font_small, font_big, player, (x, ys[i % len(ys)]), WIDTH, HEIGHT)
+
+    return run
+
+
+def case_draw_header(count=2000):
+    """`count` dibujos de la cabecera fuera de pantalla, con el dinero cambiando en cada uno."""
+    init_display()
+    font_small = load_font(FONT_PATH, FONT_SMALL)
+    font_medium = load_font(FONT_PATH, FONT_MEDIUM)
+    surface = pygame.Surface((WIDTH, HEIGHT)).convert()
+    player = Player()
+
+    def run():
+        for i in range(count):
+            player.money = BigNumber(i * 997)
+            player.total_clicks = i
+            draw_header(surface, font_medium, font_small, player)
+
+    return run
+
+
+# Nombre del caso -> función que lo prepara
+CASES = {
+    "player.click x1M": case_player_click,
+    "shop.handle_click x100k": case_shop_purchases,
+    **{f"save+load {n} items x20": (lambda n=n: case_save_load(n)) for n in (10, 100, 1000, 10000)},
+    **{
+        f"update_achievements {n} logros x100k": (lambda n=n: case_achievements(n))
+        for n in (4, 50, 500, 5000)
+    },
+    "shop.draw x2000": case_shop_draw,
+    "draw_header x2000": case_draw_header,
+}
+
+# Casos ruidosos -> (umbral mínimo, intentos mínimos)
+CASE_LIMITS = {name: (SAVE_THRESHOLD, SAVE_MIN_REPEAT) for name in CASES if name.startswith("save")}
+
+
+# --- MEDICIÓN ---
+def measure(prepare, repeat=DEFAULT_REPEAT):
+    """
+    Prepara un caso y devuelve el mejor tiempo de `repeat` ejecuciones.
+
+    Args:
+        prepare (callable): Función que prepara el caso y devuelve la función a medir.
+        repeat (int): Número de ejecuciones.
+
+    Returns:
+        float: Segundos de la ejecución más rápida.
+    """
+    run = prepare()
+    best = math.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def load_baselines(path=BASELINE_FILE):
+    """
+    Lee las referencias guardadas.
+
+    Args:
+        path (str): Ruta del archivo de referencias.
+
+    Returns:
+        dict[str, float]: Segundos de referencia por caso (vacío si no hay archivo).
+    """
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_baselines(results, path=BASELINE_FILE):
+    """
+    Guarda los resultados como nuevas referencias, conservando las de los casos no ejecutados.
+
+    Args:
+        results (dict[str, float]): Segundos por caso.
+        path (str): Ruta del archivo de referencias.
+    """
+    baselines = load_baselines(path)
+    baselines.update(results)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(dict(sorted(baselines.items())), f, indent=2)
+        f.write("\n")
+
+
+# --- EJECUCIÓN ---
+def run(selected=None, threshold=DEFAULT_THRESHOLD, repeat=DEFAULT_REPEAT, update=False):
+    """
+    Ejecuta los casos, muestra la comparación con las referencias y detecta regresiones.
+
+    Args:
+        selected (str, opcional): Solo se ejecutan los casos cuyo nombre contiene este texto.
+        threshold (float): Margen tolerado sobre la referencia (0.25 = 25% más lento);
+            los casos de CASE_LIMITS usan como mínimo el suyo.
+        repeat (int): Ejecuciones por caso (se toma la mejor); los casos de
+            CASE_LIMITS hacen como mínimo las suyas.
+        update (bool): Si es True, guarda los resultados como referencia y no compara.
+
+    Returns:
+        list[str]: Casos que superan su referencia más el margen.
+    """
+    baselines = load_baselines()
+    results = {}
+    regressions = []
+    print(f"{'caso':<38} {'tiempo (s)':>11} {'referencia':>11} {'cambio':>8}")
+    for name, prepare in CASES.items():
+        if selected and selected not in name:
+            continue
+        min_threshold, min_repeat = CASE_LIMITS.get(name, (threshold, repeat))
+        seconds = results[name] = measure(prepare, max(repeat, min_repeat))
+        baseline = baselines.get(name)
+        if baseline is None or update:
+            print(f"{name:<38} {seconds:>11.4f} {'-':>11} {'-':>8}")
+            continue
+        change = seconds / baseline - 1
+        mark = ""
+        if change > max(threshold, min_threshold):
+            regressions.append(name)
+            mark = "  REGRESIÓN"
+        print(f"{name:<38} {seconds:>11.4f} {baseline:>11.4f} {change:>+8.1%}{mark}")
+
+    if update:
+        save_baselines(results)
+        print(f"Referencias guardadas en: {BASELINE_FILE}")
+    elif regressions:
+        print(f"{len(regressions)} caso(s) más lentos que su referencia más el margen.")
+    return regressions
+
+
+def main(argv=None):
+    """
+    Punto de entrada de consola.
+
+    Args:
+        argv (list[str], opcional): Argumentos (por defecto, los de `sys.argv`).
+
+    Returns:
+        int: Código de salida (1 si hay regresiones).
+    """
+    parser = argparse.ArgumentParser(description="Microbenchmarks de Click & Hide.")
+    parser.add_argument(
+        "-k",
+        dest="selected",
+        help="Solo los casos cuyo nombre contiene este texto.",
+    )
+    parser.add_argument(
+        "-t",
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Margen tolerado (0.25 = 25%%).",
+    )
+    parser.add_argument(
+        "-r",
+        "--repeat",
+        type=int,
+        default=DEFAULT_REPEAT,
+        help="Ejecuciones por caso.",
+    )
+    parser.add_argument(
+        "--update",
+        action="store_true",
+        help="Guarda los resultados como referencia.",
+    )
+    args = parser.parse_args(argv)
+    regressions = run(args.selected, args.threshold, args.repeat, args.update)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
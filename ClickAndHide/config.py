@@ -4,10 +4,13 @@ config.py — Configuración global del juego Click & Hide.
 Contiene constantes relacionadas con:
   - Pantalla
   - Jugador
+  - Reloj de simulación
   - Colores
   - Fuentes
   - Rutas de recursos
   - Parámetros de la intro
+  - Guardado automático
+  - Progreso sin conexión
   - Depuración / desarrollo
 """
 
@@ -15,6 +18,9 @@ Contiene constantes relacionadas con:
 WIDTH = 1280  # Ancho de la ventana principal
 HEIGHT = 720  # Alto de la ventana principal
 FPS = 60  # Fotogramas por segundo
+IDLE_FPS = 10  # Fotogramas por segundo sin actividad o con la ventana sin foco
+MINIMIZED_FPS = 2  # Fotogramas por segundo con la ventana minimizada
+IDLE_DELAY = 2.0  # Segundos sin entrada del jugador para bajar a IDLE_FPS
 FULLSCREEN = False  # Si es True, inicia en modo pantalla completa
 
 
@@ -24,6 +30,11 @@ EARN_AMOUNT = 1  # Cantidad de dinero obtenida por clic
 EARN_COOLDOWN = 0.2  # Tiempo mínimo (en segundos) entre clics válidos
 
 
+# --- RELOJ DE SIMULACIÓN ---
+SIM_STEP = 1 / 64  # Paso fijo de la simulación en segundos (potencia de 2: exacto en coma flotante)
+SIM_SPEED = 1.0  # Multiplicador del tiempo de juego (avance rápido si es mayor que 1)
+
+
 # --- COLORES GENERALES (RGB) ---
 COLOR_BG_TOP = (250, 240, 210)  # Color superior del fondo degradado
 COLOR_BG_BOTTOM = (235, 220, 180)  # Color inferior del fondo degradado
@@ -37,6 +48,10 @@ SHOP_PANEL_WIDTH = 380  # Ancho del panel de la tienda
 SHOP_ITEM_HEIGHT = 60  # Altura de cada ítem de la tienda
 SHOP_PADDING_X = 30  # Espaciado horizontal dentro del panel
 SHOP_PADDING_Y = 8  # Espaciado vertical entre ítems
+SHOP_TOOLBAR_HEIGHT = 36  # Altura de la barra de cantidad de compra (x1, x10...)
+SHOP_BUY_MODES = (1, 10, 100, "MAX")  # Cantidades de compra seleccionables
+PRICE_GROWTH = 1.15  # Factor de subida del precio por cada unidad comprada
+PRICE_TABLE_SIZE = 512  # Potencias de PRICE_GROWTH precalculadas (cantidades habituales)
 
 
 # --- CONFIGURACIÓN DE FUENTES ---
@@ -44,6 +59,8 @@ FONT_PATH = "assets/fonts/PressStart2P.ttf"  # Ruta de la fuente principal
 FONT_SMALL = 14  # Tamaño de fuente pequeña
 FONT_MEDIUM = 18  # Tamaño de fuente mediana
 FONT_BIG = 28  # Tamaño de fuente grande
+TEXT_CACHE_SIZE = 512  # Máximo de textos renderizados guardados en caché
+NUMBER_CACHE_SIZE = 1024  # Máximo de cantidades formateadas ("1.23K") guardadas en caché
 
 
 # --- INTRO / PANTALLA DE PRESENTACIÓN ---
@@ -54,6 +71,9 @@ INTRO_LOAD_DURATION = 5.0  # Duración total de la pantalla de carga (s)
 INTRO_FONT_SIZE = 64  # Tamaño del texto principal
 INTRO_TEXT = "CLICK AND HIDE"  # Texto mostrado en la intro
 INTRO_TEXT_COLOR = (255, 255, 255)  # Color del texto principal
+INTRO_PULSE = 0.02  # Amplitud del pulso del texto principal (fracción del tamaño)
+INTRO_LOGO_SPEED = 90  # Velocidad de giro del logo (grados por segundo)
+INTRO_LOGO_FRAMES = 90  # Giros del logo precalculados por vuelta
 
 
 # --- RUTAS Y ARCHIVOS ---
@@ -61,7 +81,32 @@ ASSETS_PATH = "assets"  # Carpeta raíz de los recursos
 IMAGES_PATH = f"{ASSETS_PATH}/images"  # Carpeta de imágenes
 FONTS_PATH = f"{ASSETS_PATH}/fonts"  # Carpeta de fuentes
 SOUNDS_PATH = f"{ASSETS_PATH}/sounds"  # Carpeta de sonidos
+DATA_PATH = "data"  # Carpeta de datos del juego (logros...)
+ACHIEVEMENTS_FILE = f"{DATA_PATH}/achievements.json"  # Definición de los logros
+SHOP_CATALOG_FILE = f"{DATA_PATH}/shop.json"  # Catálogo de ítems de la tienda
+
+
+# --- GUARDADO AUTOMÁTICO ---
+AUTOSAVE_INTERVAL = 5.0  # Segundos mínimos entre escrituras en disco
+SAVE_JOURNAL = True  # Si es True, registra cada evento en un diario de solo-añadido
+JOURNAL_SNAPSHOT_INTERVAL = 60.0  # Segundos entre instantáneas compactadas del diario
+JOURNAL_COMPACT_EVERY = 1000  # Eventos en el diario que fuerzan una compactación
+
+
+# --- PROGRESO SIN CONEXIÓN ---
+OFFLINE_MAX_SECONDS = 8 * 3600  # Máximo de segundos fuera del juego que generan ingresos
+OFFLINE_EFFICIENCY = 0.5  # Fracción del ingreso automático que se gana sin jugar
 
 
 # --- DEBUG / DESARROLLO ---
 DEBUG_MODE = False  # Si es True, activa mensajes de depuración
+
+
+# --- PERFILADOR DE FOTOGRAMAS (F3) ---
+PROFILER_WINDOW = 300  # Fotogramas que guarda el historial de tiempos
+PROFILER_REFRESH = 15  # Fotogramas entre actualizaciones del panel del perfilador
+PROFILER_DROP_FACTOR = 1.5  # Un fotograma se pierde si dura más que este múltiplo de 1/FPS
+
+
+# --- BENCHMARK (main.py --bench) ---
+BENCH_FRAMES = 2000  # Fotogramas que se ejecutan por defecto
@@ -0,0 +1,174 @@
+"""
+core/achievements.py
+
+Modelo de logros de Click & Hide, sin dependencias de Pygame.
+Comprueba las condiciones de cada logro y marca los desbloqueados.
+La vista `entities.achievements.Achievements` añade las notificaciones en pantalla.
+
+Los logros se definen en un archivo de datos (`ACHIEVEMENTS_FILE`) como
+umbrales sobre una métrica del juego:
+
+    {"name": "AHORRADOR", "desc": "Alcanza $1,000.", "metric": "money", "threshold": 1000}
+
+Un logro se desbloquea cuando la métrica llega al umbral. Los logros de
+cada métrica se guardan ordenados por umbral junto con un cursor al
+siguiente pendiente, así que cada actualización solo compara el siguiente
+umbral de cada métrica: el coste depende de los logros que se desbloquean,
+no del total de logros definidos.
+
+Con `attach(events)` los logros se comprueban solo cuando el bus de eventos
+publica un cambio de la métrica correspondiente, sin consultar el estado en
+cada fotograma.
+"""
+
+import json
+import os
+from config import ACHIEVEMENTS_FILE
+from core.events import CLICKED, PURCHASED, MONEY_CHANGED, ACHIEVEMENT_UNLOCKED
+
+# Métricas del estado del juego sobre las que se pueden definir logros
+METRICS = ("money", "total_clicks", "upgrades_bought")
+
+
+# --- CARGA DE LOS DATOS ---
+def load_definitions(path=None):
+    """
+    Lee y valida las definiciones de logros del archivo de datos.
+
+    Args:
+        path (str, opcional): Ruta del archivo; por defecto `ACHIEVEMENTS_FILE`
+            relativo a la carpeta del juego.
+
+    Returns:
+        list[dict]: Definiciones con nombre, descripción, métrica y umbral.
+
+    Raises:
+        ValueError: Si alguna definición está incompleta o usa una métrica desconocida.
+    """
+    if path is None:
+        path = os.path.join(os.path.dirname(os.path.dirname(__file__)), ACHIEVEMENTS_FILE)
+    with open(path, "r", encoding="utf-8") as f:
+        definitions = json.load(f)
+
+    for i, definition in enumerate(definitions):
+        missing = {"name", "desc", "metric", "threshold"} - definition.keys()
+        if missing:
+            raise ValueError(f"Logro {i} sin campos: {', '.join(sorted(missing))}")
+        if definition["metric"] not in METRICS:
+            raise ValueError(
+                f"Logro {definition['name']}: métrica desconocida {definition['metric']}"
+            )
+        if not isinstance(definition["threshold"], (int, float)):
+            raise ValueError(f"Logro {definition['name']}: el umbral debe ser numérico")
+    return definitions
+
+
+# --- CLASE PRINCIPAL: ACHIEVEMENTSMODEL ---
+class AchievementsModel:
+    """
+    Lista de logros y comprobación de sus umbrales.
+
+    Atributos:
+        achievements (list[dict]): Logros con nombre, descripción, métrica, umbral
+            y estado ("completed"), en el orden del archivo de datos.
+        events (EventBus | None): Bus al que está suscrito (tras `attach`).
+
+    Métodos:
+        attach(events): Comprueba los logros cuando el bus publica cambios.
+        update_achievements(state): Desbloquea los logros cuyo umbral se alcanzó.
+        check_metric(metric, value): Desbloquea los logros alcanzados de una métrica.
+        on_unlock(achievement): Se llama al desbloquear un logro (las vistas lo amplían).
+    """
+
+    def __init__(self, definitions=None):
+        """
+        Inicializa los logros y sus índices por métrica.
+
+        Args:
+            definitions (list[dict], opcional): Definiciones de logros; por
+                defecto se leen de `ACHIEVEMENTS_FILE`.
+        """
+        if definitions is None:
+            definitions = load_definitions()
+        self.achievements = [dict(d, completed=False) for d in definitions]
+
+        # Por métrica: logros ordenados por umbral y cursor al siguiente pendiente
+        self._tracks = {}
+        for achievement in self.achievements:
+            self._tracks.setdefault(achievement["metric"], []).append(achievement)
+        for track in self._tracks.values():
+            track.sort(key=lambda a: a["threshold"])
+        self._cursors = dict.fromkeys(self._tracks, 0)
+        self.events = None
+
+    # --- SUSCRIPCIÓN A LOS EVENTOS ---
+    def attach(self, events):
+        """
+        Suscribe los logros a los eventos que cambian sus métricas.
+
+        Los logros desbloqueados se publican como `ACHIEVEMENT_UNLOCKED`.
+
+        Args:
+            events (EventBus): Bus de eventos de la partida.
+        """
+        self.events = events
+        events.subscribe(
+            CLICKED, lambda total_clicks, amount: self.check_metric("total_clicks", total_clicks)
+        )
+        events.subscribe(MONEY_CHANGED, lambda money: self.check_metric("money", money))
+        events.subscribe(
+            PURCHASED,
+            lambda item, count, price, upgrades: self.check_metric("upgrades_bought", upgrades),
+        )
+
+    # --- ACTUALIZACIÓN DE LOGROS ---
+    def update_achievements(self, state):
+        """
+        Comprueba el estado del juego y desbloquea logros nuevos.
+
+        Args:
+            state (dict): Estado actual del juego, con datos como dinero, clics y mejoras compradas.
+
+        Returns:
+            list[dict]: Logros desbloqueados en esta llamada.
+        """
+        unlocked = []
+        for metric in self._tracks:
+            unlocked.extend(self.check_metric(metric, state.get(metric, 0)))
+        return unlocked
+
+    def check_metric(self, metric, value):
+        """
+        Desbloquea los logros de una métrica cuyo umbral es menor o igual que `value`.
+
+        Args:
+            metric (str): Nombre de la métrica.
+            value (float): Valor actual de la métrica.
+
+        Returns:
+            list[dict]: Logros desbloqueados en esta llamada.
+        """
+        track = self._tracks.get(metric)
+        if track is None:
+            return []
+        cursor = self._cursors[metric]
+        unlocked = []
+        while cursor < len(track) and track[cursor]["threshold"] <= value:
+            achievement = track[cursor]
+            cursor += 1
+            if not achievement["completed"]:
+                achievement["completed"] = True
+                unlocked.append(achievement)
+                self.on_unlock(achievement)
+                if self.events is not None:
+                    self.events.emit(ACHIEVEMENT_UNLOCKED, achievement)
+        self._cursors[metric] = cursor
+        return unlocked
+
+    def on_unlock(self, achievement):
+        """
+        Se llama cada vez que se desbloquea un logro.
+
+        Args:
+            achievement (dict): Logro desbloqueado.
+        """
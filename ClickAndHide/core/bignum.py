@@ -0,0 +1,439 @@
+"""
+core/bignum.py
+
+Números grandes para el dinero de Click & Hide, sin dependencias de Pygame.
+
+`BigNumber` guarda un valor como mantisa (float) y exponente binario (int):
+
+    valor == mantissa * 2 ** exponent
+
+Mientras el valor es menor que 2 ** BIG_EXPONENT el exponente es 0 y la
+mantisa es el propio valor, así que las sumas, restas y comparaciones dan
+exactamente el mismo resultado que con un float y cuestan poco más. Por
+encima, la mantisa se normaliza a [0.5, 1) y el exponente crece sin límite,
+de modo que el dinero nunca se desborda a `inf`. Escalar por potencias de 2
+(`math.ldexp`) es exacto: la pareja (mantisa, exponente) se guarda sin
+pérdidas (`save_format`, `to_json`).
+
+`format_short` convierte un número en un texto corto con la escala corta
+(950, 1.23K, 4.5M, 7.8e42) y guarda en caché los resultados, para no
+formatear cifras de decenas de dígitos en cada fotograma.
+"""
+
+import math
+import sys
+from decimal import Decimal, ROUND_FLOOR, localcontext
+from functools import lru_cache
+
+from config import NUMBER_CACHE_SIZE
+
+# Exponente binario a partir del cual se usa la forma mantisa/exponente
+BIG_EXPONENT = 512
+_BIG = 2.0**BIG_EXPONENT
+_LOG10_2 = math.log10(2)
+_LN2 = math.log(2)
+_HASH_MODULUS = sys.hash_info.modulus
+
+# Sufijos de la escala corta: miles, millones, miles de millones...
+SHORT_SCALE = ("K", "M", "B", "T", "Qa", "Qi", "Sx", "Sp", "Oc", "No", "Dc")
+
+
+def _normalize(mantissa, exponent):
+    """Devuelve la forma canónica (mantisa, exponente) de mantissa * 2 ** exponent."""
+    if exponent == 0 and -_BIG < mantissa < _BIG:
+        return mantissa, 0
+    if mantissa == 0 or not math.isfinite(mantissa):
+        return mantissa, 0
+    mantissa, shift = math.frexp(mantissa)
+    exponent += shift
+    if exponent <= BIG_EXPONENT:
+        return math.ldexp(mantissa, exponent), 0
+    return mantissa, exponent
+
+
+def _to_float(value):
+    """
+    Convierte un número en float redondeando hacia cero.
+
+    `float()` redondea al más cercano, así que un entero de más de 53 bits
+    (10 ** 36 - 1) podía convertirse en un float mayor que él (1e36) y
+    mostrarse como más dinero del que es.
+    """
+    result = float(value)
+    if result != value and abs(result) > abs(value):
+        result = math.nextafter(result, 0.0)
+    return result
+
+
+def _split(value):
+    """Devuelve la forma canónica (mantisa, exponente) de un número o BigNumber."""
+    if type(value) is BigNumber:
+        return value.mantissa, value.exponent
+    try:
+        return _normalize(_to_float(value), 0)
+    except OverflowError:
+        # Entero de Python demasiado grande para un float: se conservan sus 64 bits altos
+        shift = abs(value).bit_length() - 64
+        high = value >> shift if value > 0 else -(-value >> shift)
+        return _normalize(_to_float(high), shift)
+
+
+def _add(m1, e1, m2, e2):
+    """Suma dos valores en forma (mantisa, exponente)."""
+    if e1 == e2:
+        return _normalize(m1 + m2, e1)
+    if e1 > e2:
+        return _normalize(m1 + math.ldexp(m2, e2 - e1), e1)
+    return _normalize(math.ldexp(m1, e1 - e2) + m2, e2)
+
+
+def _new(mantissa, exponent):
+    """Crea un BigNumber a partir de una forma ya canónica, sin volver a normalizarla."""
+    number = object.__new__(BigNumber)
+    number.mantissa = mantissa
+    number.exponent = exponent
+    return number
+
+
+# --- CLASE PRINCIPAL: BIGNUMBER ---
+class BigNumber:
+    """
+    Número inmutable sin límite de tamaño, con aritmética y comparación rápidas.
+
+    Se combina con int, float y otros BigNumber en sumas, restas,
+    productos, divisiones y comparaciones; el resultado es siempre un BigNumber.
+
+    Atributos:
+        mantissa (float): Mantisa (el propio valor si `exponent` es 0).
+        exponent (int): Exponente binario (0 o mayor que BIG_EXPONENT).
+
+    Métodos:
+        floor(): Parte entera (hacia abajo).
+        log(): Logaritmo natural.
+        log1p(): Logaritmo natural de 1 + valor.
+        log10(): Logaritmo decimal.
+        from_log(x): Crea el número e ** x (método de clase).
+    """
+
+    __slots__ = ("mantissa", "exponent")
+
+    def __init__(self, value=0, exponent=0):
+        """
+        Crea el número `value * 2 ** exponent`.
+
+        Args:
+            value (int | float | BigNumber): Valor (o mantisa si se pasa `exponent`).
+            exponent (int): Exponente binario que multiplica a `value`.
+        """
+        if exponent:
+            self.mantissa, self.exponent = _normalize(float(value), int(exponent))
+        else:
+            self.mantissa, self.exponent = _split(value)
+
+    @classmethod
+    def from_log(cls, x):
+        """
+        Crea el número e ** x sin desbordar aunque `x` sea muy grande.
+
+        Args:
+            x (float): Logaritmo natural del valor.
+
+        Returns:
+            BigNumber: Número creado.
+        """
+        log2 = x / _LN2
+        exponent = math.floor(log2)
+        return cls(2.0 ** (log2 - exponent), exponent)
+
+    # --- ARITMÉTICA ---
+    def __add__(self, other):
+        if type(other) is not BigNumber and not isinstance(other, (int, float)):
+            return NotImplemented
+        return _new(*_add(self.mantissa, self.exponent, *_split(other)))
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if type(other) is not BigNumber and not isinstance(other, (int, float)):
+            return NotImplemented
+        m2, e2 = _split(other)
+        return _new(*_add(self.mantissa, self.exponent, -m2, e2))
+
+    def __rsub__(self, other):
+        if not isinstance(other, (int, float)):
+            return NotImplemented
+        return _new(*_add(-self.mantissa, self.exponent, *_split(other)))
+
+    def __mul__(self, other):
+        if type(other) is not BigNumber and not isinstance(other, (int, float)):
+            return NotImplemented
+        m1, e1 = self.mantissa, self.exponent
+        m2, e2 = _split(other)
+        product = m1 * m2
+        if e1 == 0 and e2 == 0 and -_BIG < product < _BIG:
+            return _new(product, 0)
+        f1, x1 = math.frexp(m1)
+        f2, x2 = math.frexp(m2)
+        return _new(*_normalize(f1 * f2, e1 + x1 + e2 + x2))
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if type(other) is not BigNumber and not isinstance(other, (int, float)):
+            return NotImplemented
+        return _divide(self.mantissa, self.exponent, *_split(other))
+
+    def __rtruediv__(self, other):
+        if not isinstance(other, (int, float)):
+            return NotImplemented
+        return _divide(*_split(other), self.mantissa, self.exponent)
+
+    def __neg__(self):
+        return _new(-self.mantissa, self.exponent)
+
+    def __abs__(self):
+        return _new(abs(self.mantissa), self.exponent)
+
+    # --- COMPARACIÓN ---
+    def _compare(self, other):
+        """Devuelve -1, 0 o 1 según `self` sea menor, igual o mayor que `other`."""
+        m2, e2 = _split(other)
+        difference, _ = _add(self.mantissa, self.exponent, -m2, e2)
+        return (difference > 0) - (difference < 0)
+
+    def __eq__(self, other):
+        if type(other) is BigNumber:
+            return self.mantissa == other.mantissa and self.exponent == other.exponent
+        if not isinstance(other, (int, float)):
+            return NotImplemented
+        if self.exponent == 0:
+            return self.mantissa == other
+        return self._compare(other) == 0
+
+    def __lt__(self, other):
+        if type(other) is BigNumber:
+            if self.exponent == 0 and other.exponent == 0:
+                return self.mantissa < other.mantissa
+        elif not isinstance(other, (int, float)):
+            return NotImplemented
+        elif self.exponent == 0:
+            return self.mantissa < other
+        return self._compare(other) < 0
+
+    def __le__(self, other):
+        if type(other) is BigNumber:
+            if self.exponent == 0 and other.exponent == 0:
+                return self.mantissa <= other.mantissa
+        elif not isinstance(other, (int, float)):
+            return NotImplemented
+        elif self.exponent == 0:
+            return self.mantissa <= other
+        return self._compare(other) <= 0
+
+    def __gt__(self, other):
+        if type(other) is BigNumber:
+            if self.exponent == 0 and other.exponent == 0:
+                return self.mantissa > other.mantissa
+        elif not isinstance(other, (int, float)):
+            return NotImplemented
+        elif self.exponent == 0:
+            return self.mantissa > other
+        return self._compare(other) > 0
+
+    def __ge__(self, other):
+        if type(other) is BigNumber:
+            if self.exponent == 0 and other.exponent == 0:
+                return self.mantissa >= other.mantissa
+        elif not isinstance(other, (int, float)):
+            return NotImplemented
+        elif self.exponent == 0:
+            return self.mantissa >= other
+        return self._compare(other) >= 0
+
+    def __hash__(self):
+        """Hash igual al del int o float del mismo valor (ver `__eq__`)."""
+        if self.exponent == 0:
+            return hash(self.mantissa)
+        # Valor entero: mismo cálculo modular que hace Python con los int
+        bits = int(math.ldexp(abs(self.mantissa), 53))
+        result = bits * pow(2, self.exponent - 53, _HASH_MODULUS) % _HASH_MODULUS
+        if self.mantissa < 0:
+            result = -result
+        return -2 if result == -1 else result
+
+    # --- CONVERSIONES ---
+    def __bool__(self):
+        return self.mantissa != 0
+
+    def __float__(self):
+        try:
+            return math.ldexp(self.mantissa, self.exponent)
+        except OverflowError:
+            return math.copysign(math.inf, self.mantissa)
+
+    def __int__(self):
+        if self.exponent == 0:
+            return int(self.mantissa)
+        return int(math.ldexp(self.mantissa, 53)) << (self.exponent - 53)
+
+    def __repr__(self):
+        return f"BigNumber({self.mantissa!r}, {self.exponent})"
+
+    def __str__(self):
+        if self.exponent == 0:
+            if self.mantissa.is_integer():
+                return str(int(self.mantissa))
+            return str(self.mantissa)
+        log10 = self.log10()
+        exponent = math.floor(log10)
+        sign = "-" if self.mantissa < 0 else ""
+        return f"{sign}{10 ** (log10 - exponent):.6f}e{exponent}"
+
+    def floor(self):
+        """
+        Devuelve la parte entera del número, redondeando hacia abajo.
+
+        Returns:
+            BigNumber: Número sin decimales.
+        """
+        if self.exponent or not math.isfinite(self.mantissa):
+            return self  # Por encima de 2 ** BIG_EXPONENT todos los valores son enteros
+        return _new(float(math.floor(self.mantissa)), 0)
+
+    def log(self):
+        """
+        Devuelve el logaritmo natural del número (positivo).
+
+        Returns:
+            float: ln(valor).
+        """
+        return math.log(self.mantissa) + self.exponent * _LN2
+
+    def log1p(self):
+        """
+        Devuelve el logaritmo natural de 1 + valor, preciso también para valores pequeños.
+
+        Returns:
+            float: ln(1 + valor).
+        """
+        if self.exponent == 0:
+            return math.log1p(self.mantissa)
+        return self.log()
+
+    def log10(self):
+        """
+        Devuelve el logaritmo decimal del valor absoluto del número.
+
+        Returns:
+            float: log10(|valor|).
+        """
+        return math.log10(abs(self.mantissa)) + self.exponent * _LOG10_2
+
+
+def _divide(m1, e1, m2, e2):
+    """Divide dos valores en forma (mantisa, exponente)."""
+    if e1 == 0 and e2 == 0:
+        quotient = m1 / m2
+        if -_BIG < quotient < _BIG:
+            return _new(quotient, 0)
+    f1, x1 = math.frexp(m1)
+    f2, x2 = math.frexp(m2)
+    return _new(*_normalize(f1 / f2, e1 + x1 - e2 - x2))
+
+
+# --- SERIALIZACIÓN ---
+def to_json(value):
+    """
+    Convierte un número en un valor JSON sin perder precisión.
+
+    Args:
+        value (int | float | BigNumber): Número a convertir.
+
+    Returns:
+        int | float | list: El número si cabe en un float, o [mantisa, exponente].
+    """
+    mantissa, exponent = _split(value)
+    if exponent:
+        return [mantissa, exponent]
+    return int(mantissa) if mantissa.is_integer() else mantissa
+
+
+def from_json(data):
+    """
+    Reconstruye un número guardado con `to_json`.
+
+    Args:
+        data (int | float | list): Valor JSON.
+
+    Returns:
+        BigNumber: Número reconstruido.
+    """
+    if isinstance(data, list):
+        return BigNumber(*data)
+    return BigNumber(data)
+
+
+# --- FORMATO CORTO ---
+def _leading_digits(mantissa, exponent):
+    """
+    Devuelve el exponente decimal y las tres primeras cifras (truncadas) de un valor positivo.
+
+    Las cifras salen de un decimal exacto, no de `log10`, que con valores
+    grandes se queda una unidad corto o se pasa (7.79e42 en vez de 7.8e42).
+
+    Args:
+        mantissa (float): Mantisa (al menos 1000 si `exponent` es 0).
+        exponent (int): Exponente binario.
+
+    Returns:
+        tuple[int, int]: (posición de la primera cifra, entero de tres cifras entre 100 y 999).
+    """
+    with localcontext() as context:
+        context.rounding = ROUND_FLOOR  # Nunca por encima del valor real
+        if exponent == 0:
+            # El decimal más corto que identifica al float (78 * 10 ** 41 → 7.8e42)
+            number = Decimal(repr(mantissa))
+        else:
+            context.prec = 30
+            number = Decimal(mantissa) * Decimal(2) ** exponent
+        digits = number.adjusted()
+        lead = int(number.scaleb(2 - digits))
+    return digits, lead
+
+
+@lru_cache(maxsize=NUMBER_CACHE_SIZE)
+def format_short(value):
+    """
+    Formatea un número con tres cifras significativas y la escala corta.
+
+    Ejemplos: 950 → "950", 1234 → "1.23K", 4500000 → "4.5M", 78 * 10 ** 41 → "7.8e42".
+    Las cifras se truncan (nunca se redondean hacia arriba), para no mostrar
+    más dinero del que hay: 999999 → "999K" y 10 ** 36 - 1 → "999Dc". Los
+    resultados se guardan en caché.
+
+    Args:
+        value (int | float | BigNumber): Número a formatear.
+
+    Returns:
+        str: Texto corto.
+    """
+    mantissa, exponent = _split(value)
+    if mantissa < 0:
+        return "-" + format_short(-value)
+    if exponent == 0 and mantissa < 1000:
+        if mantissa.is_integer():
+            return str(int(mantissa))
+        return f"{math.floor(mantissa * 100) / 100:g}"
+
+    digits, lead = _leading_digits(mantissa, exponent)
+    group = digits // 3
+    if group <= len(SHORT_SCALE):
+        whole = digits % 3 + 1
+        suffix = SHORT_SCALE[group - 1]
+    else:
+        whole = 1
+        suffix = f"e{digits}"
+    text = str(lead)
+    if whole < 3:
+        text = f"{text[:whole]}.{text[whole:]}".rstrip("0").rstrip(".")
+    return text + suffix
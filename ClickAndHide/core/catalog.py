@@ -0,0 +1,171 @@
+"""
+core/catalog.py
+
+Catálogo de la tienda de Click & Hide, sin dependencias de Pygame.
+
+Los ítems se definen en un archivo de datos (`SHOP_CATALOG_FILE`):
+
+    {"name": "Ratón", "cost": 15, "income": 1, "tipo": "click", "color": [230, 200, 150]}
+
+El archivo se lee y se valida una sola vez y se compila en un `Catalog`
+inmutable (tupla de `CatalogEntry` + índice por nombre de solo lectura)
+que comparten todas las tiendas y todas las partidas nuevas.
+
+Las potencias de PRICE_GROWTH para las cantidades habituales se calculan
+una sola vez en `PRICE_POWERS`; la tabla es común a todos los ítems, así
+que no ocupa más ni tarda más en crearse aunque el catálogo crezca.
+Las potencias que no caben en un float se devuelven como `BigNumber`.
+"""
+
+import json
+import math
+import os
+from collections import namedtuple
+from functools import lru_cache
+from types import MappingProxyType
+
+from config import SHOP_CATALOG_FILE, PRICE_GROWTH, PRICE_TABLE_SIZE
+from core.bignum import BigNumber
+
+# Potencias de PRICE_GROWTH precalculadas: PRICE_POWERS[n] == PRICE_GROWTH ** n
+PRICE_POWERS = tuple(PRICE_GROWTH**n for n in range(PRICE_TABLE_SIZE))
+
+# Tipos de ítem admitidos
+ITEM_TYPES = ("click", "auto")
+
+
+def growth_power(n):
+    """
+    Devuelve PRICE_GROWTH elevado a `n`, usando la tabla si es posible.
+
+    Args:
+        n (int): Exponente (cantidad de unidades).
+
+    Returns:
+        float | BigNumber: PRICE_GROWTH ** n (BigNumber si no cabe en un float).
+    """
+    if n < PRICE_TABLE_SIZE:
+        return PRICE_POWERS[n]
+    try:
+        return PRICE_GROWTH**n
+    except OverflowError:
+        return BigNumber.from_log(n * math.log(PRICE_GROWTH))
+
+
+# --- ENTRADA DEL CATÁLOGO ---
+class CatalogEntry(namedtuple("CatalogEntry", "name base_cost base_income tipo color")):
+    """
+    Datos fijos e inmutables de un ítem de la tienda.
+
+    Atributos:
+        name (str): Nombre del ítem (único en el catálogo).
+        base_cost (int): Precio de la primera unidad.
+        base_income (int): Ingreso que aporta cada unidad.
+        tipo (str): Tipo de ítem ('click' o 'auto').
+        color (tuple): Color RGB asociado al ítem.
+    """
+
+    __slots__ = ()
+
+
+# --- CATÁLOGO COMPILADO ---
+class Catalog:
+    """
+    Catálogo de la tienda ya validado.
+
+    Atributos:
+        entries (tuple[CatalogEntry]): Ítems en el orden del archivo.
+        by_name (MappingProxyType): Índice de solo lectura de las entradas por nombre.
+    """
+
+    def __init__(self, entries):
+        """
+        Crea el catálogo a partir de entradas ya validadas.
+
+        Args:
+            entries (iterable[CatalogEntry]): Entradas del catálogo.
+        """
+        self.entries = tuple(entries)
+        self.by_name = MappingProxyType({entry.name: entry for entry in self.entries})
+
+    def __len__(self):
+        """Devuelve el número de ítems del catálogo."""
+        return len(self.entries)
+
+    @classmethod
+    def from_definitions(cls, definitions):
+        """
+        Valida y compila una lista de definiciones de ítems.
+
+        Args:
+            definitions (list[dict]): Ítems con name, cost, income, tipo y color.
+
+        Returns:
+            Catalog: Catálogo compilado.
+
+        Raises:
+            ValueError: Si alguna definición es incorrecta o hay nombres repetidos.
+        """
+        entries = []
+        names = set()
+        for i, definition in enumerate(definitions):
+            entry = _compile_entry(i, definition)
+            if entry.name in names:
+                raise ValueError(f"Ítem repetido en el catálogo: {entry.name}")
+            names.add(entry.name)
+            entries.append(entry)
+        return cls(entries)
+
+
+def _compile_entry(index, definition):
+    """Valida una definición de ítem y la convierte en `CatalogEntry`."""
+    if not isinstance(definition, dict):
+        raise ValueError(f"Ítem {index}: la definición debe ser un objeto")
+    missing = {"name", "cost", "income", "tipo", "color"} - definition.keys()
+    if missing:
+        raise ValueError(f"Ítem {index} sin campos: {', '.join(sorted(missing))}")
+    name = definition["name"]
+    if not isinstance(name, str) or not name or "\n" in name:
+        raise ValueError(f"Ítem {index}: nombre no válido")
+    if not _is_number(definition["cost"]) or definition["cost"] <= 0:
+        raise ValueError(f"Ítem {name}: el coste debe ser un número positivo")
+    if not _is_number(definition["income"]) or definition["income"] < 0:
+        raise ValueError(f"Ítem {name}: el ingreso debe ser un número no negativo")
+    if definition["tipo"] not in ITEM_TYPES:
+        raise ValueError(f"Ítem {name}: tipo desconocido {definition['tipo']}")
+    color = definition["color"]
+    if (
+        not isinstance(color, (list, tuple))
+        or len(color) != 3
+        or not all(isinstance(c, int) and not isinstance(c, bool) and 0 <= c <= 255 for c in color)
+    ):
+        raise ValueError(f"Ítem {name}: el color debe ser RGB (tres enteros 0-255)")
+    return CatalogEntry(
+        name, definition["cost"], definition["income"], definition["tipo"], tuple(color)
+    )
+
+
+def _is_number(value):
+    """Devuelve True si `value` es un int o float finito (True y False no cuentan)."""
+    return (
+        isinstance(value, (int, float)) and not isinstance(value, bool) and math.isfinite(value)
+    )
+
+
+# --- CARGA ---
+@lru_cache(maxsize=None)
+def load_catalog(path=None):
+    """
+    Lee, valida y compila el catálogo de la tienda (una sola vez por ruta).
+
+    Args:
+        path (str, opcional): Ruta del archivo; por defecto `SHOP_CATALOG_FILE`
+            relativo a la carpeta del juego.
+
+    Returns:
+        Catalog: Catálogo compartido (no modificar).
+    """
+    if path is None:
+        path = os.path.join(os.path.dirname(os.path.dirname(__file__)), SHOP_CATALOG_FILE)
+    with open(path, "r", encoding="utf-8") as f:
+        return Catalog.from_definitions(json.load(f))
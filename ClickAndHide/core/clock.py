@@ -0,0 +1,132 @@
+"""
+core/clock.py
+
+Relojes de simulación de Click & Hide, sin dependencias de Pygame.
+
+Las reglas del juego (cooldown de clics, ingresos automáticos) no leen la
+hora del sistema directamente, sino el reloj que se les inyecta:
+  - `SystemClock`: hora real del sistema (comportamiento por defecto).
+  - `FixedStepClock`: tiempo simulado que avanza en pasos fijos usando un
+    acumulador. Puede seguir al tiempo real multiplicado por una velocidad
+    (avance rápido) o avanzarse a mano, de forma determinista.
+"""
+
+import time
+from config import SIM_STEP, SIM_SPEED
+
+
+# --- RELOJ DEL SISTEMA ---
+class SystemClock:
+    """
+    Reloj que devuelve la hora real del sistema.
+
+    Métodos:
+        now(): Devuelve el tiempo actual en segundos.
+    """
+
+    def now(self):
+        """
+        Devuelve el tiempo actual.
+
+        Returns:
+            float: Segundos desde la época (time.time()).
+        """
+        return time.time()
+
+
+# Reloj compartido por los modelos que no reciben uno propio
+system_clock = SystemClock()
+
+
+# --- RELOJ DE PASO FIJO ---
+class FixedStepClock:
+    """
+    Reloj de simulación que avanza en pasos fijos.
+
+    El tiempo real transcurrido (multiplicado por `speed`) se acumula y solo
+    se convierte en tiempo simulado en múltiplos exactos de `step`; el resto
+    queda en el acumulador para el siguiente fotograma, así que no se pierde.
+    El tiempo simulado se calcula como `ticks * step`, sin sumar flotantes.
+
+    Atributos:
+        step (float): Duración de un paso de simulación, en segundos.
+        speed (float): Multiplicador del tiempo real (1 = tiempo real).
+        ticks (int): Pasos simulados desde el inicio.
+        accumulator (float): Tiempo pendiente de simular (menor que `step`).
+
+    Métodos:
+        now(): Devuelve el tiempo simulado actual.
+        tick(): Avanza según el tiempo real transcurrido.
+        advance(seconds): Avanza un tiempo simulado concreto.
+        resync(): Descarta el tiempo real transcurrido desde el último tick.
+        set_speed(speed): Cambia el multiplicador de velocidad.
+    """
+
+    def __init__(self, step=SIM_STEP, speed=SIM_SPEED, start=0.0, source=time.perf_counter):
+        """
+        Inicializa el reloj.
+
+        Args:
+            step (float): Duración de un paso de simulación, en segundos.
+            speed (float): Multiplicador del tiempo real.
+            start (float): Tiempo simulado inicial.
+            source (callable): Función que devuelve el tiempo real (monótono).
+        """
+        self.step = step
+        self.speed = speed
+        self.start = start
+        self.ticks = 0
+        self.accumulator = 0.0
+        self._source = source
+        self._last_real = source()
+
+    def now(self):
+        """
+        Devuelve el tiempo simulado actual.
+
+        Returns:
+            float: Segundos simulados (múltiplo exacto de `step` desde `start`).
+        """
+        return self.start + self.ticks * self.step
+
+    def tick(self):
+        """
+        Avanza el reloj según el tiempo real transcurrido desde el último tick.
+
+        Returns:
+            int: Número de pasos simulados en este tick.
+        """
+        real = self._source()
+        elapsed = real - self._last_real
+        self._last_real = real
+        return self.advance(elapsed * self.speed)
+
+    def advance(self, seconds):
+        """
+        Avanza el reloj un tiempo simulado concreto (avance rápido determinista).
+
+        Args:
+            seconds (float): Segundos simulados a añadir al acumulador.
+
+        Returns:
+            int: Número de pasos simulados.
+        """
+        self.accumulator += seconds
+        steps = int(self.accumulator // self.step)
+        if steps > 0:
+            self.ticks += steps
+            self.accumulator -= steps * self.step
+        return steps
+
+    def resync(self):
+        """Descarta el tiempo real transcurrido (por ejemplo, tras una pausa en el menú)."""
+        self._last_real = self._source()
+
+    def set_speed(self, speed):
+        """
+        Cambia el multiplicador de velocidad a partir del siguiente tick.
+
+        Args:
+            speed (float): Nuevo multiplicador (1 = tiempo real).
+        """
+        self.speed = speed
@@ -0,0 +1,106 @@
+"""
+core/events.py
+
+Bus de eventos de Click & Hide, sin dependencias de Pygame.
+
+El jugador y la tienda publican lo que ocurre en la partida y el resto de
+sistemas (logros, guardado, diario, cabecera) se suscriben, en lugar de
+reconstruir el estado completo en cada fotograma para ver si algo cambió.
+
+Eventos y argumentos con los que se llama a los suscriptores:
+  - CLICKED(total_clicks, amount): clic que generó `amount` de dinero.
+  - PURCHASED(item, count, price, upgrades_bought): compra de `count` unidades.
+  - INCOME_APPLIED(amount): ingreso automático aplicado.
+  - MONEY_CHANGED(money): el dinero del jugador cambió.
+  - ACHIEVEMENT_UNLOCKED(achievement): se desbloqueó un logro.
+"""
+
+CLICKED = "clicked"
+PURCHASED = "purchased"
+INCOME_APPLIED = "income_applied"
+MONEY_CHANGED = "money_changed"
+ACHIEVEMENT_UNLOCKED = "achievement_unlocked"
+
+
+# --- CLASE PRINCIPAL: EVENTBUS ---
+class EventBus:
+    """
+    Publicación/suscripción de eventos síncrona y sin colas.
+
+    Métodos:
+        subscribe(event, handler): Registra una función para un evento.
+        unsubscribe(event, handler): Elimina una función registrada.
+        emit(event, *args): Llama a las funciones registradas para el evento.
+    """
+
+    def __init__(self):
+        """Inicializa el bus sin suscriptores."""
+        self._handlers = {}
+
+    def subscribe(self, event, handler):
+        """
+        Registra una función que se llamará cada vez que se emita `event`.
+
+        Args:
+            event (str): Nombre del evento.
+            handler (callable): Función que recibe los argumentos del evento.
+
+        Returns:
+            callable: La misma función (para poder darla de baja después).
+        """
+        self._handlers.setdefault(event, []).append(handler)
+        return handler
+
+    def unsubscribe(self, event, handler):
+        """
+        Elimina una función registrada para un evento, si lo estaba.
+
+        Args:
+            event (str): Nombre del evento.
+            handler (callable): Función registrada.
+        """
+        handlers = self._handlers.get(event)
+        if handlers and handler in handlers:
+            handlers.remove(handler)
+
+    def emit(self, event, *args):
+        """
+        Llama en orden de registro a las funciones suscritas al evento.
+
+        Args:
+            event (str): Nombre del evento.
+            *args: Argumentos del evento (ver el docstring del módulo).
+        """
+        handlers = self._handlers.get(event)
+        if handlers:
+            for handler in handlers:
+                handler(*args)
+
+
+# --- CONTADOR DE CAMBIOS ---
+class Revision:
+    """
+    Número que aumenta cada vez que se emite alguno de los eventos indicados.
+
+    Sirve como clave de estado barata: quien dibuja algo que depende de esos
+    eventos solo tiene que comparar `value` con el del fotograma anterior.
+
+    Atributos:
+        value (int): Número de eventos recibidos.
+    """
+
+    def __init__(self, events, *names):
+        """
+        Suscribe el contador a los eventos indicados.
+
+        Args:
+            events (EventBus): Bus de eventos.
+            *names (str): Eventos que incrementan el contador.
+        """
+        self.value = 0
+        for name in names:
+            events.subscribe(name, self._bump)
+
+    def _bump(self, *args):
+        """Incrementa el contador (ignora los argumentos del evento)."""
+        self.value += 1
@@ -0,0 +1,161 @@
+"""
+core/player.py
+
+Modelo del jugador de Click & Hide, sin dependencias de Pygame.
+Gestiona el dinero, los clics y los ingresos por clic y automáticos.
+El dinero es un `core.bignum.BigNumber`, que no se desborda por mucho que crezca.
+El tiempo se lee de un reloj inyectable (`core.clock`), de modo que la
+partida puede simularse o acelerarse de forma determinista.
+La vista `entities.player.Player` añade encima el dibujo del botón de clic.
+"""
+
+from config import MONEY_START
+from core.bignum import BigNumber
+from core.clock import system_clock
+from core.events import EventBus, CLICKED, INCOME_APPLIED, MONEY_CHANGED
+from core.rules import clamp_money, can_earn
+
+
+# --- CLASE PRINCIPAL: PLAYERMODEL ---
+class PlayerModel:
+    """
+    Estado y reglas económicas del jugador.
+
+    Atributos:
+        money (BigNumber): Dinero actual del jugador.
+        total_clicks (int): Número total de clics realizados.
+        click_income (int): Dinero ganado por cada clic manual.
+        auto_income (int): Dinero ganado automáticamente por segundo.
+        upgrades_bought (int): Número de mejoras compradas.
+        last_auto_time (float): Marca de tiempo del último ingreso automático.
+        last_click_time (float): Marca de tiempo del último clic.
+        clock (SystemClock | FixedStepClock): Reloj del que se lee el tiempo actual.
+        dirty (bool): True si hay cambios pendientes de guardar que no se
+            publicaron como evento (reinicio, carga...).
+        events (EventBus): Bus donde se publican clics, ingresos y cambios de dinero.
+
+    Métodos:
+        reset(money): Reinicia los valores del jugador.
+        click(now): Agrega dinero al jugador por clic, si no hay cooldown activo.
+        apply_auto_income(now): Aplica los ingresos automáticos de los segundos
+            completos transcurridos.
+        can_afford(amount): Devuelve True si el jugador tiene dinero suficiente.
+        stats(): Devuelve las métricas usadas por los logros.
+    """
+
+    def __init__(self, clock=system_clock, events=None):
+        """
+        Inicializa al jugador con valores por defecto.
+
+        Args:
+            clock (SystemClock | FixedStepClock): Reloj del que se lee el tiempo.
+            events (EventBus, opcional): Bus de eventos; por defecto uno propio.
+        """
+        self.clock = clock
+        self.money = BigNumber(MONEY_START)
+        self.total_clicks = 0
+        self.click_income = 1
+        self.auto_income = 0
+        self.upgrades_bought = 0
+        self.last_auto_time = clock.now()
+        self.last_click_time = clock.now()
+        self.dirty = False
+        self.events = events if events is not None else EventBus()
+
+    # --- REINICIO DEL JUGADOR ---
+    def reset(self, money=MONEY_START):
+        """
+        Reinicia el jugador a su estado inicial.
+
+        Args:
+            money (int | BigNumber): Cantidad de dinero inicial (por defecto, MONEY_START).
+        """
+        self.money = BigNumber(money)
+        self.total_clicks = 0
+        self.click_income = 1
+        self.auto_income = 0
+        self.upgrades_bought = 0
+        self.last_auto_time = self.clock.now()
+        self.last_click_time = self.clock.now()
+        self.dirty = True
+
+    # --- CLIC MANUAL ---
+    def click(self, now=None):
+        """
+        Ejecuta un clic del jugador y agrega dinero si pasó el cooldown.
+
+        Usa la función auxiliar 'can_earn' para verificar si puede ganar dinero
+        según el tiempo transcurrido desde el último clic.
+
+        Args:
+            now (float, opcional): Tiempo actual. Si no se pasa, se lee del reloj.
+
+        Returns:
+            bool: True si el clic generó dinero.
+        """
+        if now is None:
+            now = self.clock.now()
+        if can_earn(self.last_click_time, now):
+            self.money += self.click_income
+            self.total_clicks += 1
+            self.last_click_time = now
+            self.money = clamp_money(self.money)
+            self.events.emit(CLICKED, self.total_clicks, self.click_income)
+            self.events.emit(MONEY_CHANGED, self.money)
+            return True
+        return False
+
+    # --- INGRESO AUTOMÁTICO ---
+    def apply_auto_income(self, now=None):
+        """
+        Aplica el ingreso automático de los segundos completos transcurridos.
+
+        El tiempo sobrante (menos de un segundo) no se descarta: `last_auto_time`
+        avanza solo los segundos pagados, así que el ingreso real coincide con
+        el anunciado ("+X/s") sea cual sea la duración de los fotogramas.
+
+        Args:
+            now (float, opcional): Tiempo actual. Si no se pasa, se lee del reloj.
+
+        Returns:
+            float: Dinero ingresado en esta llamada.
+        """
+        if now is None:
+            now = self.clock.now()
+        seconds = int(now - self.last_auto_time)
+        if seconds < 1:
+            return 0
+        self.last_auto_time += seconds
+        amount = self.auto_income * seconds
+        self.money = clamp_money(self.money + amount)
+        if amount:
+            self.events.emit(INCOME_APPLIED, amount)
+            self.events.emit(MONEY_CHANGED, self.money)
+        return amount
+
+    # --- VERIFICACIÓN DE COMPRA ---
+    def can_afford(self, amount):
+        """
+        Comprueba si el jugador tiene suficiente dinero para una compra.
+
+        Args:
+            amount (int | BigNumber): Precio o cantidad a comprobar.
+
+        Returns:
+            bool: True si el jugador tiene al menos esa cantidad de dinero.
+        """
+        return self.money >= amount
+
+    # --- MÉTRICAS ---
+    def stats(self):
+        """
+        Devuelve las métricas del jugador con el formato que esperan los logros.
+
+        Returns:
+            dict: Dinero, clics totales y mejoras compradas.
+        """
+        return {
+            "money": self.money,
+            "total_clicks": self.total_clicks,
+            "upgrades_bought": self.upgrades_bought,
+        }
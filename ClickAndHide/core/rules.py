@@ -0,0 +1,61 @@
+"""
+core/rules.py
+
+Reglas básicas de la economía de Click & Hide, sin dependencias de Pygame.
+Las usan tanto el modelo de simulación (`core/*`) como las vistas (`entities/*`).
+"""
+
+from config import EARN_COOLDOWN, OFFLINE_MAX_SECONDS, OFFLINE_EFFICIENCY
+from core.bignum import BigNumber
+from core.clock import system_clock
+
+
+# --- LÓGICA SIMPLE ---
+def clamp_money(money):
+    """
+    Limita el dinero del jugador a un valor mínimo de 0.
+
+    Args:
+        money (BigNumber | float): Cantidad de dinero actual.
+
+    Returns:
+        BigNumber | float: Dinero corregido (0 si es negativo).
+    """
+    return money if money >= 0 else BigNumber(0)
+
+
+def can_earn(last_earn_time, now=None, clock=system_clock):
+    """
+    Indica si el jugador puede volver a ganar dinero tras el cooldown.
+
+    Args:
+        last_earn_time (float): Tiempo del último clic o ganancia.
+        now (float, opcional): Tiempo actual. Si no se pasa, se lee de `clock`.
+        clock (SystemClock | FixedStepClock): Reloj usado si no se pasa `now`.
+
+    Returns:
+        bool: True si ya pasó el tiempo de espera.
+    """
+    if now is None:
+        now = clock.now()
+    return now - last_earn_time >= EARN_COOLDOWN
+
+
+def offline_earnings(auto_income, elapsed, cap=OFFLINE_MAX_SECONDS, efficiency=OFFLINE_EFFICIENCY):
+    """
+    Calcula en tiempo constante el dinero ganado mientras no se jugaba.
+
+    Solo cuentan los segundos completos, hasta un máximo de `cap`, y se paga
+    la fracción `efficiency` del ingreso automático.
+
+    Args:
+        auto_income (float): Ingreso automático por segundo al guardar.
+        elapsed (float): Segundos transcurridos desde el guardado.
+        cap (float): Máximo de segundos que se tienen en cuenta.
+        efficiency (float): Fracción del ingreso que se gana sin jugar.
+
+    Returns:
+        tuple[int, int]: Segundos contabilizados y dinero ganado (redondeado hacia abajo).
+    """
+    seconds = int(max(0, min(elapsed, cap)))
+    return seconds, int(auto_income * seconds * efficiency)
@@ -0,0 +1,294 @@
+"""
+core/shop.py
+
+Modelo de la tienda de Click & Hide, sin dependencias de Pygame.
+Define los ítems, su fábrica y las reglas de compra. La vista
+`entities.shop.Shop` añade encima el scroll, el deslizador y el dibujo.
+
+Precios: la unidad número n (empezando en 0) cuesta unos base * G^n, con
+G = PRICE_GROWTH. Lo que cuestan en total las n primeras unidades es la
+suma geométrica redondeada hacia abajo
+
+    C(n) = floor(base * (G^n - 1) / (G - 1))
+
+y comprar k unidades teniendo ya n cuesta C(n + k) - C(n). Así el precio
+en bloque es exactamente la suma de los precios de cada unidad (la suma se
+telescopa), y calcularlo o calcular cuántas unidades se pueden pagar cuesta
+lo mismo sea cual sea la cantidad. Por encima de 2 ** 53 los precios ya no
+tienen decimales que redondear y se calculan con la suma geométrica directa.
+El precio solo depende del coste base y de la cantidad comprada.
+
+Los datos fijos de los ítems vienen del catálogo compilado (`core.catalog`);
+cada `ShopItem` solo añade la cantidad comprada en la partida.
+"""
+
+import math
+from config import PRICE_GROWTH, SHOP_BUY_MODES
+from core.bignum import BigNumber
+from core.catalog import load_catalog, growth_power
+from core.events import EventBus, PURCHASED, MONEY_CHANGED
+
+# A partir de 2 ** 53 todos los float son enteros
+_EXACT_FLOAT = 2.0**53
+
+
+# --- CLASE BASE: SHOPITEM ---
+class ShopItem:
+    """
+    Representa un ítem individual dentro de la tienda.
+
+    Atributos:
+        entry (CatalogEntry): Datos fijos del ítem en el catálogo.
+        name (str): Nombre del ítem.
+        base_cost (int): Precio de la primera unidad.
+        cost (BigNumber): Precio de la siguiente unidad (derivado de `base_cost` y `amount`).
+        base_income (int): Incremento base de ingresos que aporta el ítem.
+        tipo (str): Tipo de ítem ('click' o 'auto').
+        amount (int): Cantidad de unidades compradas.
+        color (tuple): Color RGB asociado al ítem.
+        rect (pygame.Rect | None): Rectángulo de interacción en pantalla (lo asigna la vista).
+
+    Métodos:
+        total_cost(n): Precio total de las `n` primeras unidades.
+        price(count): Precio de las siguientes `count` unidades.
+        max_affordable(money): Máximo de unidades que se pueden pagar con `money`.
+    """
+
+    __slots__ = ("entry", "name", "base_cost", "base_income", "tipo", "color", "amount", "rect")
+
+    def __init__(self, entry):
+        """
+        Inicializa un ítem sin unidades compradas.
+
+        Args:
+            entry (CatalogEntry): Datos fijos del ítem.
+        """
+        self.entry = entry
+        self.name, self.base_cost, self.base_income, self.tipo, self.color = entry
+        self.amount = 0
+        self.rect = None
+
+    @property
+    def cost(self):
+        """BigNumber: Precio de la siguiente unidad."""
+        return self.price(1)
+
+    # --- PRECIOS ---
+    def total_cost(self, n):
+        """
+        Calcula en tiempo constante el precio total de las `n` primeras unidades.
+
+        Args:
+            n (int): Número de unidades.
+
+        Returns:
+            BigNumber: C(n), sin decimales (0 si `n` no es positivo).
+        """
+        if n <= 0:
+            return BigNumber(0)
+        return (BigNumber(self.base_cost) * (growth_power(n) - 1) / (PRICE_GROWTH - 1)).floor()
+
+    def price(self, count=1):
+        """
+        Calcula en tiempo constante el precio de las siguientes `count` unidades.
+
+        Es la diferencia de dos `total_cost`, así que coincide con la suma de
+        los precios de comprarlas de una en una. Cuando la siguiente unidad ya
+        cuesta más de 2 ** 53, todos los float son enteros y el redondeo no
+        cambia nada: se usa directamente la suma geométrica.
+
+        Args:
+            count (int): Número de unidades.
+
+        Returns:
+            BigNumber: Precio total, sin decimales (0 si `count` no es positivo).
+        """
+        if count <= 0:
+            return BigNumber(0)
+        first = BigNumber(self.base_cost) * growth_power(self.amount)
+        if first < _EXACT_FLOAT:
+            return self.total_cost(self.amount + count) - self.total_cost(self.amount)
+        if count == 1:
+            return first
+        return first * (growth_power(count) - 1) / (PRICE_GROWTH - 1)
+
+    def max_affordable(self, money):
+        """
+        Calcula cuántas unidades se pueden pagar con `money`.
+
+        Despeja k de la suma geométrica con un logaritmo y corrige el
+        redondeo comprobando con `price`, sin recorrer las unidades.
+
+        Args:
+            money (BigNumber | float): Dinero disponible.
+
+        Returns:
+            int: Número máximo de unidades asequibles.
+        """
+        if money < self.price(1):
+            return 0
+        first = BigNumber(self.base_cost) * growth_power(self.amount)
+        ratio = BigNumber(money) * (PRICE_GROWTH - 1) / first
+        count = int(ratio.log1p() / math.log(PRICE_GROWTH))
+        count = max(1, count)
+        while self.price(count + 1) <= money:
+            count += 1
+        while count > 1 and self.price(count) > money:
+            count -= 1
+        return count
+
+
+# --- FÁBRICA DE ÍTEMS ---
+class ShopItemFactory:
+    """
+    Crea instancias de ítems de la tienda mediante un método de fábrica.
+    Actualmente todos los ítems son de tipo ShopItem, pero este patrón permite
+    ampliar el sistema con otros tipos en el futuro (por ejemplo, ítems especiales).
+    """
+
+    @staticmethod
+    def create_item(entry):
+        """
+        Crea un nuevo ítem de la tienda.
+
+        Args:
+            entry (CatalogEntry): Datos fijos del ítem en el catálogo.
+
+        Returns:
+            ShopItem: Nueva instancia de ítem creada.
+        """
+        return ShopItem(entry)
+
+
+# --- CLASE PRINCIPAL: SHOPMODEL ---
+class ShopModel:
+    """
+    Catálogo de la tienda y reglas de compra.
+
+    Atributos:
+        catalog (Catalog): Catálogo compilado (compartido entre tiendas y partidas).
+        items (list[ShopItem]): Lista de ítems creados.
+        items_by_name (dict[str, ShopItem]): Índice de los ítems por nombre.
+        dirty (bool): True si la tienda se reinició y no se ha guardado.
+        generation (int): Aumenta cada vez que se reinicia la tienda.
+        events (EventBus): Bus donde se publican las compras.
+        buy_mode (int | str): Cantidad que se compra con cada clic (1, 10, 100 o "MAX").
+
+    Métodos:
+        init_items(): Crea o reinicia todos los ítems.
+        set_buy_mode(mode): Cambia la cantidad que se compra con cada clic.
+        quote(item, money): Unidades y precio de la compra según `buy_mode`.
+        buy(item, player, count): Compra unidades si el jugador puede pagarlas.
+        apply_purchase(item, player, price, count): Aplica los efectos de una compra.
+    """
+
+    def __init__(self, events=None, catalog=None):
+        """
+        Inicializa la tienda con los ítems del catálogo.
+
+        Args:
+            events (EventBus, opcional): Bus de eventos; por defecto uno propio.
+            catalog (Catalog, opcional): Catálogo; por defecto el de `SHOP_CATALOG_FILE`.
+        """
+        self.catalog = catalog if catalog is not None else load_catalog()
+        self.items = []
+        self.generation = 0
+        self.init_items()
+        self.dirty = False
+        self.events = events if events is not None else EventBus()
+        self.buy_mode = SHOP_BUY_MODES[0]
+
+    # --- INICIALIZACIÓN ---
+    def init_items(self):
+        """
+        Crea los ítems del catálogo o, si ya existen, los deja sin unidades compradas.
+
+        Los ítems se crean una sola vez; al empezar una partida nueva solo
+        se reinician sus cantidades.
+        """
+        if len(self.items) != len(self.catalog):
+            self.items = [ShopItemFactory.create_item(entry) for entry in self.catalog.entries]
+            self.items_by_name = {item.name: item for item in self.items}
+        else:
+            for item in self.items:
+                item.amount = 0
+        self.generation += 1
+        self.dirty = True
+
+    # --- CANTIDAD DE COMPRA ---
+    def set_buy_mode(self, mode):
+        """
+        Cambia la cantidad que se compra con cada clic.
+
+        Args:
+            mode (int | str): Una de las opciones de `SHOP_BUY_MODES`.
+        """
+        if mode not in SHOP_BUY_MODES:
+            raise ValueError(f"Modo de compra desconocido: {mode}")
+        self.buy_mode = mode
+
+    def quote(self, item, money):
+        """
+        Devuelve cuántas unidades se comprarían con el modo actual y su precio.
+
+        En modo "MAX" son todas las que se pueden pagar (al menos una, para
+        mostrar el precio aunque no se pueda pagar ninguna).
+
+        Args:
+            item (ShopItem): Ítem a comprar.
+            money (BigNumber | float): Dinero disponible.
+
+        Returns:
+            tuple[int, BigNumber]: Unidades y precio total.
+        """
+        if self.buy_mode == "MAX":
+            count = max(1, item.max_affordable(money))
+        else:
+            count = self.buy_mode
+        return count, item.price(count)
+
+    # --- COMPRAS ---
+    def buy(self, item, player, count=1):
+        """
+        Compra `count` unidades del ítem si el jugador puede pagarlas.
+
+        Args:
+            item (ShopItem): Ítem a comprar.
+            player (PlayerModel): Instancia del jugador.
+            count (int): Número de unidades.
+
+        Returns:
+            BigNumber | None: Precio pagado, o None si no había dinero suficiente.
+        """
+        if count <= 0:
+            return None
+        price = item.price(count)
+        if not player.can_afford(price):
+            return None
+        self.apply_purchase(item, player, price, count)
+        self.events.emit(PURCHASED, item, count, price, player.upgrades_bought)
+        self.events.emit(MONEY_CHANGED, player.money)
+        return price
+
+    def apply_purchase(self, item, player, price, count=1):
+        """
+        Aplica los efectos de comprar unidades del ítem, sin comprobar el dinero.
+
+        El ingreso se suma de una vez para todas las unidades.
+        También se usa al reproducir el diario de guardado, por lo que no
+        publica eventos (eso lo hace `buy`).
+
+        Args:
+            item (ShopItem): Ítem comprado.
+            player (PlayerModel): Instancia del jugador.
+            price (BigNumber): Precio total pagado.
+            count (int): Número de unidades compradas.
+        """
+        player.money -= price
+        item.amount += count
+
+        if item.tipo == "click":
+            player.click_income += item.base_income * count
+        else:
+            player.auto_income += item.base_income * count
+        player.upgrades_bought += count
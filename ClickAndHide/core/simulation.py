@@ -0,0 +1,132 @@
+"""
+core/simulation.py
+
+Simulación sin ventana de la economía de Click & Hide.
+
+Reúne los modelos del jugador, la tienda y los logros y los hace avanzar con
+un reloj de paso fijo (`core.clock.FixedStepClock`) que se avanza a mano en
+lugar del reloj real, de modo que se pueden ejecutar partidas completas
+(equilibrado, pruebas de regresión, bots) sin Pygame, de forma determinista
+y mucho más rápido que en tiempo real.
+
+Ejemplo:
+    sim = Simulation()
+    for _ in range(1_000_000):
+        sim.step(0.2, click=True)
+    print(sim.player.money)
+"""
+
+from config import SIM_STEP
+from core.clock import FixedStepClock
+from core.events import EventBus, ACHIEVEMENT_UNLOCKED
+from core.player import PlayerModel
+from core.shop import ShopModel
+from core.achievements import AchievementsModel
+
+
+# --- CLASE PRINCIPAL: SIMULATION ---
+class Simulation:
+    """
+    Partida simulada con tiempo controlado.
+
+    Atributos:
+        player (PlayerModel): Jugador simulado.
+        shop (ShopModel): Tienda simulada.
+        achievements (AchievementsModel): Logros simulados.
+        clock (FixedStepClock): Reloj simulado compartido con el jugador.
+        events (EventBus): Bus de eventos compartido por el jugador, la tienda y los logros.
+        time (float): Tiempo simulado actual, en segundos.
+
+    Métodos:
+        state(): Devuelve el estado usado por los logros.
+        step(dt, click): Avanza el tiempo y aplica clic, ingresos y logros.
+        fast_forward(seconds): Avanza un periodo largo sin clics, en tiempo constante.
+        buy(name, count): Compra unidades de un ítem por nombre.
+    """
+
+    def __init__(self, player=None, shop=None, achievements=None, start_time=0.0, step=SIM_STEP):
+        """
+        Inicializa la simulación.
+
+        Args:
+            player (PlayerModel, opcional): Jugador; por defecto uno nuevo.
+            shop (ShopModel, opcional): Tienda; por defecto una nueva.
+            achievements (AchievementsModel, opcional): Logros; por defecto nuevos.
+            start_time (float): Tiempo simulado inicial.
+            step (float): Paso fijo del reloj simulado, en segundos.
+        """
+        self.clock = FixedStepClock(step=step, start=start_time)
+        self.events = EventBus()
+        self.player = player if player is not None else PlayerModel()
+        self.player.clock = self.clock
+        self.shop = shop if shop is not None else ShopModel()
+        self.player.events = self.shop.events = self.events
+        self.achievements = achievements if achievements is not None else AchievementsModel()
+        self.achievements.attach(self.events)
+        self._unlocked = []
+        self.events.subscribe(ACHIEVEMENT_UNLOCKED, self._unlocked.append)
+        self.player.last_auto_time = start_time
+        self.player.last_click_time = start_time - 1e9  # Primer clic sin cooldown
+
+    @property
+    def time(self):
+        """float: Tiempo simulado actual, en segundos."""
+        return self.clock.now()
+
+    # --- ESTADO ---
+    def state(self):
+        """
+        Devuelve el estado del juego con el formato que esperan los logros.
+
+        Returns:
+            dict: Dinero, clics totales y mejoras compradas.
+        """
+        return self.player.stats()
+
+    # --- AVANCE DEL TIEMPO ---
+    def step(self, dt, click=False):
+        """
+        Avanza el tiempo simulado y aplica las reglas del juego.
+
+        Args:
+            dt (float): Segundos simulados que avanza el paso.
+            click (bool): Si el jugador hace clic en este paso.
+
+        Returns:
+            list[dict]: Logros desbloqueados en este paso (los publica el bus de eventos).
+        """
+        self._unlocked.clear()
+        self.clock.advance(dt)
+        if click:
+            self.player.click()
+        self.player.apply_auto_income()
+        return list(self._unlocked)
+
+    def fast_forward(self, seconds):
+        """
+        Avanza un periodo largo sin clics.
+
+        El ingreso automático se paga de una vez por todos los segundos
+        completos, así que el coste no depende de la duración.
+
+        Args:
+            seconds (float): Segundos simulados que se avanzan.
+
+        Returns:
+            list[dict]: Logros desbloqueados al final del periodo.
+        """
+        return self.step(seconds)
+
+    # --- COMPRAS ---
+    def buy(self, name, count=1):
+        """
+        Compra unidades de un ítem identificado por su nombre.
+
+        Args:
+            name (str): Nombre del ítem.
+            count (int): Número de unidades.
+
+        Returns:
+            int | None: Precio pagado, o None si no se pudo comprar.
+        """
+        return self.shop.buy(self.shop.items_by_name[name], self.player, count)
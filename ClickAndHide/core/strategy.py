@@ -0,0 +1,149 @@
+"""
+core/strategy.py
+
+Estrategias de compra para el bot del modo demo, sin dependencias de Pygame.
+
+  - `GreedyStrategy`: recorre la tienda en orden y compra todo lo que puede
+    pagar (el comportamiento original de la demo).
+  - `RoiStrategy`: compra siempre el ítem que antes se amortiza, es decir,
+    el de menor tiempo de retorno precio / ingreso extra por segundo.
+    Si no puede pagarlo, ahorra en lugar de gastar en otro peor.
+
+`RoiStrategy` mantiene los ítems en una cola de prioridad. Comprar una
+unidad solo cambia el tiempo de retorno de ese ítem (su precio sube un
+factor PRICE_GROWTH), así que tras cada compra basta con volver a insertar
+ese ítem: O(log n) por compra en lugar de recalcular toda la tienda.
+"""
+
+import heapq
+from config import EARN_COOLDOWN
+
+
+# --- ESTRATEGIA VORAZ ---
+class GreedyStrategy:
+    """
+    Compra, en el orden de la tienda, todas las unidades que se puedan pagar.
+
+    Métodos:
+        act(shop, player): Realiza las compras de este paso.
+    """
+
+    name = "greedy"
+
+    def act(self, shop, player):
+        """
+        Compra el máximo asequible de cada ítem, en orden.
+
+        Args:
+            shop (ShopModel): Tienda.
+            player (PlayerModel): Jugador.
+
+        Returns:
+            int: Dinero gastado en este paso.
+        """
+        spent = 0
+        for item in shop.items:
+            price = shop.buy(item, player, item.max_affordable(player.money))
+            if price is not None:
+                spent += price
+        return spent
+
+
+# --- ESTRATEGIA POR RETORNO DE LA INVERSIÓN ---
+class RoiStrategy:
+    """
+    Compra siempre el ítem con menor tiempo de retorno.
+
+    Atributos:
+        clicks_per_second (float): Clics por segundo que se suponen para valorar
+            los ítems de tipo 'click'.
+
+    Métodos:
+        payback(item): Segundos que tarda en amortizarse la siguiente unidad.
+        rebuild(shop): Reconstruye la cola de prioridad.
+        act(shop, player): Realiza las compras de este paso.
+    """
+
+    name = "roi"
+
+    def __init__(self, clicks_per_second=1 / EARN_COOLDOWN):
+        """
+        Inicializa la estrategia con la cola vacía (se construye en el primer paso).
+
+        Args:
+            clicks_per_second (float): Clics por segundo del jugador o del bot.
+        """
+        self.clicks_per_second = clicks_per_second
+        self._heap = []
+        self._generation = None
+
+    def payback(self, item):
+        """
+        Calcula el tiempo de retorno de la siguiente unidad de un ítem.
+
+        Args:
+            item (ShopItem): Ítem de la tienda.
+
+        Returns:
+            float: Precio dividido entre el ingreso extra por segundo.
+        """
+        gain = item.base_income
+        if item.tipo == "click":
+            gain *= self.clicks_per_second
+        return item.cost / gain if gain > 0 else float("inf")
+
+    def rebuild(self, shop):
+        """
+        Reconstruye la cola de prioridad con todos los ítems de la tienda.
+
+        Args:
+            shop (ShopModel): Tienda.
+        """
+        self._generation = shop.generation
+        self._heap = [(self.payback(item), i) for i, item in enumerate(shop.items)]
+        heapq.heapify(self._heap)
+
+    def act(self, shop, player):
+        """
+        Compra el mejor ítem mientras se pueda pagar.
+
+        Args:
+            shop (ShopModel): Tienda.
+            player (PlayerModel): Jugador.
+
+        Returns:
+            int: Dinero gastado en este paso.
+        """
+        if self._generation != shop.generation:
+            self.rebuild(shop)
+
+        spent = 0
+        while self._heap:
+            _, index = self._heap[0]
+            item = shop.items[index]
+            price = shop.buy(item, player)
+            if price is None:
+                break
+            spent += price
+            heapq.heapreplace(self._heap, (self.payback(item), index))
+        return spent
+
+
+# Estrategias disponibles por nombre (opción --strategy de main.py)
+STRATEGIES = {
+    GreedyStrategy.name: GreedyStrategy,
+    RoiStrategy.name: RoiStrategy,
+}
+
+
+def create_strategy(name):
+    """
+    Crea una estrategia a partir de su nombre.
+
+    Args:
+        name (str): Nombre de la estrategia ("greedy" o "roi").
+
+    Returns:
+        GreedyStrategy | RoiStrategy: Estrategia creada.
+    """
+    return STRATEGIES[name]()
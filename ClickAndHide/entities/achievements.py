@@ -4,73 +4,81 @@ entities/achievements.py
 Sistema de logros del juego Click & Hide.
 Define las clases Achievements y AchievementNotification
 para gestionar los logros desbloqueados y sus notificaciones visuales.
+Las condiciones de los logros están en `core.achievements.AchievementsModel`.
 """
 
 import pygame
 import time
+from core.achievements import AchievementsModel
+from text_cache import render_text
 
 
 # --- CLASE PRINCIPAL: GESTIÓN DE LOGROS ---
-class Achievements:
+class Achievements(AchievementsModel):
     """
     Clase para gestionar los logros del jugador y sus notificaciones en pantalla.
 
+    Hereda de `AchievementsModel` la lista de logros y `update_achievements(state)`.
+
     Atributos:
-        achievements (list[dict]): Lista de logros disponibles con nombre, descripción, condición y estado.
-        active_notifications (list[AchievementNotification]): Lista de notificaciones de logros activas.
+        active_notifications (list[AchievementNotification]): Notificaciones activas.
 
     Métodos:
-        update_achievements(state): Comprueba si se cumplen condiciones y desbloquea logros.
+        on_unlock(achievement): Crea la notificación de un logro desbloqueado.
+        update_notifications(): Elimina las notificaciones expiradas.
+        draw_notifications(screen, font): Dibuja las notificaciones activas.
+        notifications_rect(screen_height): Devuelve el área que ocupan las notificaciones.
         manage_notifications(screen, font): Dibuja y gestiona las notificaciones activas.
     """
 
     def __init__(self):
         """Inicializa la lista de logros y la lista de notificaciones activas."""
-        self.achievements = [
-            {
-                "name": "PRIMER CLICK",
-                "desc": "Haz tu primer click.",
-                "check": lambda s: s.get("total_clicks", 0) >= 1,
-                "completed": False,
-            },
-            {
-                "name": "AHORRADOR",
-                "desc": "Alcanza $1,000.",
-                "check": lambda s: s.get("money", 0) >= 1000,
-                "completed": False,
-            },
-            {
-                "name": "MILLONARIO",
-                "desc": "Alcanza $1,000,000.",
-                "check": lambda s: s.get("money", 0) >= 1_000_000,
-                "completed": False,
-            },
-            {
-                "name": "PRIMERA MEJORA",
-                "desc": "Compra al menos una mejora.",
-                "check": lambda s: s.get("upgrades_bought", 0) > 0,
-                "completed": False,
-            },
-        ]
+        super().__init__()
         self.active_notifications = []
 
-    # --- ACTUALIZACIÓN DE LOGROS ---
-    def update_achievements(self, state):
+    # --- DESBLOQUEO DE LOGROS ---
+    def on_unlock(self, achievement):
         """
-        Comprueba el estado del juego y desbloquea logros nuevos.
+        Genera una notificación visual al desbloquear un logro.
 
         Args:
-            state (dict): Estado actual del juego, con datos como dinero, clics y mejoras compradas.
-
-        Si se cumple la condición de un logro aún no completado,
-        lo marca como desbloqueado y genera una notificación visual.
+            achievement (dict): Logro desbloqueado.
         """
-        for a in self.achievements:
-            if not a["completed"] and a["check"](state):
-                a["completed"] = True
-                self.active_notifications.append(AchievementNotification(a))
+        self.active_notifications.append(AchievementNotification(achievement))
 
     # --- GESTIÓN DE NOTIFICACIONES ---
+    def update_notifications(self):
+        """Elimina de la lista las notificaciones que ya han expirado."""
+        self.active_notifications = [
+            n for n in self.active_notifications if n.is_active_notification()
+        ]
+
+    def draw_notifications(self, screen, font):
+        """
+        Dibuja las notificaciones activas sin modificar la lista.
+
+        Args:
+            screen (pygame.Surface): Superficie donde se dibujan las notificaciones.
+            font (pygame.font.Font): Fuente usada para renderizar el texto.
+        """
+        for n in self.active_notifications:
+            n.draw_notification(screen, font)
+
+    def notifications_rect(self, screen_height):
+        """
+        Devuelve el área que ocupan ahora todas las notificaciones activas.
+
+        Args:
+            screen_height (int): Alto de la pantalla.
+
+        Returns:
+            pygame.Rect | None: Unión de las áreas, o None si no hay notificaciones.
+        """
+        rects = [n.get_rect(screen_height) for n in self.active_notifications]
+        if not rects:
+            return None
+        return rects[0].unionall(rects[1:])
+
     def manage_notifications(self, screen, font):
         """
         Actualiza y muestra todas las notificaciones activas en pantalla.
@@ -81,10 +89,8 @@ class Achievements:
 
         Dibuja cada notificación, elimina las expiradas y mantiene las activas visibles.
         """
-        for n in self.active_notifications[:]:
-            n.draw_notification(screen, font)
-            if not n.is_active_notification():
-                self.active_notifications.remove(n)
+        self.draw_notifications(screen, font)
+        self.update_notifications()
 
 
 # --- CLASE DE NOTIFICACIÓN DE LOGROS ---
@@ -100,6 +106,7 @@ class AchievementNotification:
 
     Métodos:
         is_active_notification(): Indica si la notificación sigue activa.
+        get_rect(screen_height): Calcula la posición actual de la notificación.
         draw_notification(screen, font): Dibuja la notificación en pantalla.
     """
 
@@ -114,6 +121,8 @@ class AchievementNotification:
         self.start_time = time.time()
         self.duration = 3  # Duración total en segundos
         self.slide_time = 0.4  # Tiempo de animación de entrada/salida
+        self.size = (300, 80)  # Ancho y alto de la notificación
+        self._surface = None  # Superficie ya dibujada (se crea al mostrarla)
 
     # --- ESTADO DE LA NOTIFICACIÓN ---
     def is_active_notification(self):
@@ -125,19 +134,20 @@ class AchievementNotification:
         """
         return time.time() - self.start_time < self.duration
 
-    # --- DIBUJO EN PANTALLA ---
-    def draw_notification(self, screen, font):
+    # --- POSICIÓN EN PANTALLA ---
+    def get_rect(self, screen_height):
         """
-        Dibuja una notificación visual del logro en pantalla.
+        Calcula el área de la notificación según el punto de su animación.
+
+        Crea una animación deslizante desde la izquierda.
 
         Args:
-            screen (pygame.Surface): Superficie donde se mostrará la notificación.
-            font (pygame.font.Font): Fuente utilizada para renderizar el texto.
+            screen_height (int): Alto de la pantalla.
 
-        Crea una animación deslizante desde la izquierda, con el nombre del logro
-        y el texto "LOGRO DESBLOQUEADO!".
+        Returns:
+            pygame.Rect: Área que ocupa la notificación en este momento.
         """
-        notif_width, notif_height = 300, 80
+        notif_width, notif_height = self.size
         elapsed = time.time() - self.start_time
 
         # --- Animación de entrada y salida ---
@@ -150,7 +160,28 @@ class AchievementNotification:
             progress = (elapsed - (self.duration - self.slide_time)) / self.slide_time
             x = 20 - (progress * 50)
 
-        y = screen.get_height() - notif_height - 20
+        y = screen_height - notif_height - 20
+        return pygame.Rect(int(x), y, notif_width, notif_height)
+
+    # --- DIBUJO EN PANTALLA ---
+    def draw_notification(self, screen, font):
+        """
+        Dibuja una notificación visual del logro en pantalla.
+
+        Args:
+            screen (pygame.Surface): Superficie donde se mostrará la notificación.
+            font (pygame.font.Font): Fuente utilizada para renderizar el texto.
+
+        Muestra el nombre del logro y el texto "LOGRO DESBLOQUEADO!". La superficie
+        se crea la primera vez y después solo se mueve.
+        """
+        if self._surface is None:
+            self._surface = self._build_surface(font)
+        screen.blit(self._surface, self.get_rect(screen.get_height()))
+
+    def _build_surface(self, font):
+        """Crea la superficie de la notificación con su fondo, borde y textos."""
+        notif_width, notif_height = self.size
 
         # --- Creación de superficie ---
         surf = pygame.Surface((notif_width, notif_height), pygame.SRCALPHA)
@@ -166,10 +197,8 @@ class AchievementNotification:
         )
 
         # --- Renderizado de texto ---
-        title_surf = font.render("LOGRO DESBLOQUEADO!", True, (255, 255, 255))
-        name_surf = font.render(self.achievement["name"], True, (200, 200, 200))
+        title_surf = render_text(font, "LOGRO DESBLOQUEADO!", (255, 255, 255))
+        name_surf = render_text(font, self.achievement["name"], (200, 200, 200))
         surf.blit(title_surf, (10, 10))
         surf.blit(name_surf, (10, 40))
-
-        # --- Mostrar en pantalla ---
-        screen.blit(surf, (x, y))
+        return surf
@@ -2,101 +2,76 @@
 entities/player.py
 
 Define la clase Player del juego Click & Hide.
-Gestiona el dinero, los ingresos por clic y automáticos,
-así como el dibujo del botón de clic principal.
+Es la vista del jugador: las reglas de dinero, clics e ingresos están en
+`core.player.PlayerModel`, y aquí solo se añade el dibujo del botón de clic principal.
 """
 
-import time
 import pygame
-from config import MONEY_START, EARN_COOLDOWN
-from auxiliary import clamp_money, can_earn
+from config import WIDTH, HEIGHT
+from core.clock import system_clock
+from core.player import PlayerModel
+from text_cache import render_text
 
 
 # --- CLASE PRINCIPAL: PLAYER ---
-class Player:
+class Player(PlayerModel):
     """
-    Representa al jugador y su progreso dentro del juego.
+    Representa al jugador y su progreso dentro del juego, con su botón de clic.
+
+    Hereda de `PlayerModel` el dinero, los clics, los ingresos y las reglas
+    (reset, click, apply_auto_income, can_afford, stats).
 
     Atributos:
-        money (int): Dinero actual del jugador.
-        total_clicks (int): Número total de clics realizados.
-        click_income (int): Dinero ganado por cada clic manual.
-        auto_income (int): Dinero ganado automáticamente por segundo.
-        last_auto_time (float): Marca de tiempo del último ingreso automático.
-        last_click_time (float): Marca de tiempo del último clic.
+        click_rect (pygame.Rect): Área del botón de clic en pantalla.
 
     Métodos:
-        reset(money): Reinicia los valores del jugador.
-        click(): Agrega dinero al jugador por clic, si no hay cooldown activo.
-        apply_auto_income(now): Aplica ingresos automáticos cada segundo.
-        can_afford(amount): Devuelve True si el jugador tiene dinero suficiente.
+        button_rect(WIDTH, HEIGHT): Calcula el área del botón de clic.
+        button_state(mouse_pos): Devuelve la clave de dibujo del botón.
         draw_click_button(screen, font, mouse_pos, WIDTH, HEIGHT): Dibuja el botón de clic.
     """
 
-    def __init__(self):
-        """Inicializa al jugador con valores por defecto."""
-        self.money = MONEY_START
-        self.total_clicks = 0
-        self.click_income = 1
-        self.auto_income = 0
-        self.last_auto_time = time.time()
-        self.last_click_time = time.time()
-
-    # --- REINICIO DEL JUGADOR ---
-    def reset(self, money=MONEY_START):
+    def __init__(self, clock=system_clock, events=None):
         """
-        Reinicia el jugador a su estado inicial.
+        Inicializa al jugador con valores por defecto y el área del botón.
 
         Args:
-            money (int): Cantidad de dinero inicial (por defecto, MONEY_START).
-        """
-        self.money = money
-        self.total_clicks = 0
-        self.click_income = 1
-        self.auto_income = 0
-        self.last_auto_time = time.time()
-        self.last_click_time = time.time()
-
-    # --- CLIC MANUAL ---
-    def click(self):
+            clock (SystemClock | FixedStepClock): Reloj del que se lee el tiempo.
+            events (EventBus, opcional): Bus de eventos; por defecto uno propio.
         """
-        Ejecuta un clic del jugador y agrega dinero si pasó el cooldown.
+        super().__init__(clock, events)
+        self.click_rect = self.button_rect(WIDTH, HEIGHT)
 
-        Usa la función auxiliar 'can_earn' para verificar si puede ganar dinero
-        según el tiempo transcurrido desde el último clic.
-        """
-        if can_earn(self.last_click_time):
-            self.money += self.click_income
-            self.total_clicks += 1
-            self.last_click_time = time.time()
-            self.money = clamp_money(self.money)
-
-    # --- INGRESO AUTOMÁTICO ---
-    def apply_auto_income(self, now=None):
+    # --- ÁREA Y ESTADO DEL BOTÓN DE CLIC ---
+    def button_rect(self, WIDTH, HEIGHT):
         """
-        Aplica el ingreso automático cada segundo.
+        Calcula el rectángulo del botón central de clic.
 
         Args:
-            now (float, opcional): Tiempo actual. Si no se pasa, se usa time.time().
+            WIDTH (int): Ancho de la ventana del juego.
+            HEIGHT (int): Alto de la ventana del juego.
+
+        Returns:
+            pygame.Rect: Área del botón.
         """
-        now = now or time.time()
-        if now - self.last_auto_time >= 1:
-            self.money += self.auto_income
-            self.last_auto_time = now
-            self.money = clamp_money(self.money)
-
-    # --- VERIFICACIÓN DE COMPRA ---
-    def can_afford(self, amount):
+        square_size = 180
+        return pygame.Rect(
+            WIDTH // 2 - square_size // 2 - 180,
+            HEIGHT // 2 - square_size // 2,
+            square_size,
+            square_size,
+        )
+
+    def button_state(self, mouse_pos):
         """
-        Comprueba si el jugador tiene suficiente dinero para una compra.
+        Devuelve la clave que determina el aspecto del botón (para el renderizado parcial).
 
         Args:
-            amount (int): Precio o cantidad a comprobar.
+            mouse_pos (tuple[int, int]): Posición actual del ratón.
 
         Returns:
-            bool: True si el jugador tiene al menos esa cantidad de dinero.
+            bool: True si el cursor está sobre el botón.
         """
-        return self.money >= amount
+        return self.click_rect.collidepoint(mouse_pos)
 
     # --- DIBUJO DEL BOTÓN DE CLIC ---
     def draw_click_button(self, screen, font, mouse_pos, WIDTH, HEIGHT):
@@ -113,13 +88,7 @@ class Player:
         El botón cambia de color al pasar el cursor sobre él,
         y su área se guarda en 'self.click_rect' para detectar clics.
         """
-        square_size = 180
-        self.click_rect = pygame.Rect(
-            WIDTH // 2 - square_size // 2 - 180,
-            HEIGHT // 2 - square_size // 2,
-            square_size,
-            square_size,
-        )
+        self.click_rect = self.button_rect(WIDTH, HEIGHT)
 
         color_click = (
             (235, 200, 120)
@@ -130,6 +99,6 @@ class Player:
         pygame.draw.rect(screen, color_click, self.click_rect, border_radius=25)
         pygame.draw.rect(screen, (90, 70, 40), self.click_rect, 3, border_radius=25)
 
-        label_surface = font.render("CLICK", True, (60, 40, 20))
+        label_surface = render_text(font, "CLICK", (60, 40, 20))
         label_rect = label_surface.get_rect(center=self.click_rect.center)
         screen.blit(label_surface, label_rect)
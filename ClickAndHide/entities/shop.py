@@ -3,149 +3,139 @@ entities/shop.py
 
 Clases relacionadas con la tienda para Click & Hide.
 Gestiona la tienda, los ítems, las compras, el scroll y el deslizador lateral.
+
+La lista de ítems está virtualizada: solo se recorren los ítems visibles y
+cada tarjeta se guarda ya dibujada hasta que cambia su coste, cantidad,
+si se puede pagar o si el cursor está encima. Así el coste por fotograma
+no depende del tamaño del catálogo.
+
+Sobre la lista hay una barra para elegir cuántas unidades se compran con
+cada clic (x1, x10, x100 o MAX); el precio mostrado es el de esa cantidad.
 """
 
 import pygame
 from auxiliary import draw_shop_panel
+from core.shop import ShopItem, ShopItemFactory, ShopModel  # noqa: F401 (re-exportadas)
+from core.bignum import format_short
+from config import (
+    SHOP_PANEL_WIDTH,
+    SHOP_ITEM_HEIGHT,
+    SHOP_PADDING_X,
+    SHOP_PADDING_Y,
+    SHOP_TOOLBAR_HEIGHT,
+    SHOP_BUY_MODES,
+)
+from text_cache import render_text
 
-
-# --- CLASE BASE: SHOPITEM ---
-class ShopItem:
-    """
-    Representa un ítem individual dentro de la tienda.
-
-    Atributos:
-        name (str): Nombre del ítem.
-        cost (int): Costo actual del ítem.
-        base_income (int): Incremento base de ingresos que aporta el ítem.
-        tipo (str): Tipo de ítem ('click' o 'auto').
-        amount (int): Cantidad de unidades compradas.
-        color (tuple): Color RGB asociado al ítem.
-        rect (pygame.Rect): Rectángulo de interacción en pantalla.
-    """
-
-    def __init__(self, name, cost, income, tipo, color):
-        """Inicializa un ítem con sus atributos básicos."""
-        self.name = name
-        self.cost = cost
-        self.base_income = income
-        self.tipo = tipo
-        self.amount = 0
-        self.color = color
-        self.rect = None
-
-
-# --- FÁBRICA DE ÍTEMS ---
-class ShopItemFactory:
-    """
-    Crea instancias de ítems de la tienda mediante un método de fábrica.
-    Actualmente todos los ítems son de tipo ShopItem, pero este patrón permite
-    ampliar el sistema con otros tipos en el futuro (por ejemplo, ítems especiales).
-    """
-
-    @staticmethod
-    def create_item(name, cost, income, tipo, color):
-        """
-        Crea un nuevo ítem de la tienda.
-
-        Args:
-            name (str): Nombre del ítem.
-            cost (int): Precio inicial del ítem.
-            income (int): Ingreso que genera el ítem.
-            tipo (str): Tipo ('click' o 'auto').
-            color (tuple): Color RGB.
-
-        Returns:
-            ShopItem: Nueva instancia de ítem creada.
-        """
-        return ShopItem(name, cost, income, tipo, color)
+LIST_TOP = 60 + SHOP_TOOLBAR_HEIGHT  # Distancia del borde superior del panel a la lista
 
 
 # --- CLASE PRINCIPAL: SHOP ---
-class Shop:
+class Shop(ShopModel):
     """
     Representa la tienda del juego y gestiona la lógica de interacción.
 
+    Hereda de `ShopModel` el catálogo y las reglas de compra (init_items, buy,
+    apply_purchase); aquí se añaden el scroll, el deslizador y el dibujo.
+
     Atributos:
-        shop_data (list): Datos base de los ítems disponibles.
-        items (list[ShopItem]): Lista de ítems creados.
         scroll_offset (int): Desplazamiento actual del scroll.
         scroll_speed (int): Velocidad de desplazamiento.
         max_scroll (int): Máximo desplazamiento posible.
         dragging_slider (bool): Indica si el deslizador está siendo arrastrado.
         slider_rect (pygame.Rect): Área del deslizador lateral.
+        list_rect (pygame.Rect | None): Zona visible de la lista (tras el primer dibujo).
+        mode_rects (list[tuple[pygame.Rect, int | str]]): Botones de cantidad de compra.
     """
 
-    def __init__(self):
-        """Inicializa la tienda con ítems base y parámetros de scroll."""
-        self.shop_data = [
-            ("Ratón", 15, 1, "click", (230, 200, 150)),
-            ("Apuntes (+1/s)", 50, 1, "auto", (245, 222, 100)),
-            ("Libro (+5/s)", 100, 5, "auto", (230, 200, 150)),
-            ("Pizarra (+10/s)", 200, 10, "auto", (230, 200, 150)),
-            ("Móbil (+25/s)", 500, 25, "auto", (215, 190, 140)),
-            ("Tablet (+50/s)", 1000, 50, "auto", (200, 180, 130)),
-            ("Ordenador (+100/s)", 2500, 100, "auto", (220, 190, 140)),
-            ("Fibra Óptica (+200/s)", 7500, 200, "auto", (240, 200, 150)),
-            ("Servidor (+500/s)", 10000, 500, "auto", (230, 210, 160)),
-        ]
-
-        self.items = []
-        self.init_items()
+    def __init__(self, events=None, catalog=None):
+        """
+        Inicializa la tienda con ítems base y parámetros de scroll.
+
+        Args:
+            events (EventBus, opcional): Bus de eventos; por defecto uno propio.
+            catalog (Catalog, opcional): Catálogo; por defecto el de `SHOP_CATALOG_FILE`.
+        """
+        super().__init__(events, catalog)
 
         self.scroll_offset = 0
         self.scroll_speed = 20
         self.max_scroll = 0
         self.dragging_slider = False
         self.slider_rect = None
+        self.list_rect = None
+        self.mode_rects = []
 
     # --- INICIALIZACIÓN ---
     def init_items(self):
-        """Crea o reinicia todos los ítems usando la clase fábrica."""
-        self.items = []
-        for name, cost, income, tipo, color in self.shop_data:
-            item = ShopItemFactory.create_item(name, cost, income, tipo, color)
-            self.items.append(item)
+        """Crea o reinicia todos los ítems y descarta las tarjetas dibujadas."""
+        super().init_items()
+        self._cards = {}  # índice -> (clave de dibujo, superficie de la tarjeta)
 
     # --- GESTIÓN DE CLICS / COMPRAS ---
-    def handle_click(self, mouse_pos, player, achievements_manager=None):
+    def handle_click(self, mouse_pos, player):
         """
         Gestiona las compras cuando el jugador hace clic sobre un ítem.
 
+        Un clic sobre la barra de cantidad cambia el modo de compra; un clic
+        sobre un ítem compra la cantidad seleccionada de una sola vez.
+
         Args:
             mouse_pos (tuple[int, int]): Posición actual del ratón.
             player (Player): Instancia del jugador.
-            achievements_manager (Achievements, opcional): Sistema de logros.
 
         Efectos:
             - Resta dinero al jugador al comprar.
             - Aumenta la cantidad del ítem.
             - Incrementa el ingreso del jugador.
-            - Actualiza los logros si aplica.
+            - Publica la compra en el bus de eventos (logros, guardado...).
+        """
+        for rect, mode in self.mode_rects:
+            if rect.collidepoint(mouse_pos):
+                self.set_buy_mode(mode)
+                return
+
+        index = self.item_index_at(mouse_pos)
+        if index is None:
+            return
+        item = self.items[index]
+        count, _ = self.quote(item, player.money)
+        self.buy(item, player, count)
+
+    # --- GEOMETRÍA DE LA LISTA ---
+    def visible_range(self):
+        """
+        Calcula qué ítems caen dentro de la zona visible de la lista.
+
+        Returns:
+            range: Índices de los ítems visibles (vacío antes del primer dibujo).
+        """
+        if self.list_rect is None:
+            return range(0)
+        stride = SHOP_ITEM_HEIGHT + SHOP_PADDING_Y
+        offset = int(self.scroll_offset)
+        first = offset // stride
+        last = (offset + self.list_rect.height) // stride + 1
+        return range(first, min(last, len(self.items)))
+
+    def item_index_at(self, pos):
         """
-        for item in self.items:
-            if item.rect and item.rect.collidepoint(mouse_pos):
-                if player.money >= item.cost:
-                    player.money -= item.cost
-                    item.amount += 1
-                    item.cost = int(item.cost * 1.15)
-
-                    if item.tipo == "click":
-                        player.click_income += item.base_income
-                    else:
-                        player.auto_income += item.base_income
-
-                    if not hasattr(player, "upgrades_bought"):
-                        player.upgrades_bought = 0
-                    player.upgrades_bought += 1
-
-                    if achievements_manager:
-                        game_state = {
-                            "money": player.money,
-                            "total_clicks": player.total_clicks,
-                            "upgrades_bought": player.upgrades_bought,
-                        }
-                        achievements_manager.update_achievements(game_state)
+        Devuelve el índice del ítem que hay bajo una posición, en tiempo constante.
+
+        Args:
+            pos (tuple[int, int]): Posición en pantalla.
+
+        Returns:
+            int | None: Índice del ítem, o None si no hay ningún ítem visible ahí.
+        """
+        if self.list_rect is None or not self.list_rect.collidepoint(pos):
+            return None
+        stride = SHOP_ITEM_HEIGHT + SHOP_PADDING_Y
+        local_y = pos[1] - self.list_rect.y + int(self.scroll_offset)
+        index, inside = divmod(local_y, stride)
+        if inside >= SHOP_ITEM_HEIGHT or index >= len(self.items):
+            return None
+        return index
 
     # --- CONTROL DE SCROLL ---
     def handle_scroll(self, event):
@@ -182,7 +172,7 @@ class Shop:
             and self.dragging_slider
             and self.max_scroll > 0
         ):
-            slider_area_height = panel_h - 60
+            slider_area_height = panel_h - LIST_TOP
             slider_height = self.slider_rect.height
             delta_y = mouse_pos[1] - self.drag_start_y
             scroll_range = self.max_scroll
@@ -192,11 +182,120 @@ class Shop:
             )
             self.scroll_offset = max(0, min(self.scroll_offset, self.max_scroll))
 
+    # --- ÁREA Y ESTADO DE DIBUJO ---
+    def panel_rect(self, WIDTH, HEIGHT):
+        """
+        Calcula el área de pantalla que ocupa la tienda (incluida la sombra).
+
+        Args:
+            WIDTH (int): Ancho de la ventana.
+            HEIGHT (int): Alto de la ventana.
+
+        Returns:
+            pygame.Rect: Área ocupada por el panel de la tienda.
+        """
+        header_height, panel_width = 60, 380
+        return pygame.Rect(
+            WIDTH - panel_width - 5, header_height, panel_width + 5, HEIGHT - header_height
+        )
+
+    def render_state(self, player, mouse_pos):
+        """
+        Devuelve una clave que cambia cuando cambia el aspecto de la tienda.
+
+        Solo tiene en cuenta los ítems visibles.
+
+        Args:
+            player (Player): Instancia del jugador (para saber qué puede pagar).
+            mouse_pos (tuple[int, int]): Posición actual del ratón.
+
+        Returns:
+            tuple: Modo de compra, scroll, ítem bajo el cursor y
+            (unidades, precio, cantidad, asequible) de cada ítem visible.
+        """
+        items = self.items
+        money = player.money
+        visible = []
+        for i in self.visible_range():
+            count, price = self.quote(items[i], money)
+            visible.append((count, price, items[i].amount, player.can_afford(price)))
+        return (
+            self.buy_mode,
+            self.scroll_offset,
+            self.item_index_at(mouse_pos),
+            tuple(visible),
+        )
+
+    # --- TARJETAS DE ÍTEM CACHEADAS ---
+    def _card(self, index, font_small, count, price, affordable, hovered):
+        """
+        Devuelve la tarjeta dibujada de un ítem, redibujándola solo si cambió.
+
+        Args:
+            index (int): Índice del ítem.
+            font_small (pygame.font.Font): Fuente de los textos de la tarjeta.
+            count (int): Unidades que se comprarían con el modo actual.
+            price (BigNumber): Precio de esas unidades.
+            affordable (bool): Si el jugador puede pagar el precio.
+            hovered (bool): Si el cursor está sobre el ítem.
+
+        Returns:
+            pygame.Surface: Superficie con la tarjeta completa.
+        """
+        item = self.items[index]
+        key = (count, price, item.amount, affordable, hovered, font_small)
+        cached = self._cards.get(index)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        color = item.color
+        if not affordable:
+            color = tuple(max(130, c - 70) for c in color)
+        elif hovered:
+            color = tuple(min(255, c + 25) for c in color)
+
+        width = SHOP_PANEL_WIDTH - 2 * SHOP_PADDING_X
+        card = pygame.Surface((width, SHOP_ITEM_HEIGHT), pygame.SRCALPHA)
+        rect = card.get_rect()
+        pygame.draw.rect(card, color, rect, border_radius=10)
+        pygame.draw.rect(card, (90, 70, 40), rect, 2, border_radius=10)
+        card.blit(render_text(font_small, item.name, (50, 35, 20)), (10, 6))
+        price_text = f"${format_short(price)}"
+        if count != 1:
+            price_text = f"+{count} {price_text}"
+        card.blit(render_text(font_small, price_text, (60, 45, 30)), (10, 30))
+        card.blit(
+            render_text(font_small, f"x{item.amount}", (50, 35, 20)), (rect.right - 50, 18)
+        )
+
+        self._cards[index] = (key, card)
+        return card
+
+    # --- BARRA DE CANTIDAD DE COMPRA ---
+    def _draw_toolbar(self, screen, font_small, x, y, width):
+        """Dibuja los botones x1/x10/x100/MAX y guarda sus áreas para los clics."""
+        gap = 8
+        button_w = (width - gap * (len(SHOP_BUY_MODES) - 1)) // len(SHOP_BUY_MODES)
+        self.mode_rects = []
+        for i, mode in enumerate(SHOP_BUY_MODES):
+            rect = pygame.Rect(x + i * (button_w + gap), y, button_w, SHOP_TOOLBAR_HEIGHT - 10)
+            selected = mode == self.buy_mode
+            pygame.draw.rect(
+                screen, (200, 160, 90) if selected else (235, 215, 170), rect, border_radius=6
+            )
+            pygame.draw.rect(screen, (90, 70, 40), rect, 2, border_radius=6)
+            label = render_text(font_small, mode if mode == "MAX" else f"x{mode}", (50, 35, 20))
+            screen.blit(label, label.get_rect(center=rect.center))
+            self.mode_rects.append((rect, mode))
+
     # --- DIBUJO DE LA TIENDA ---
     def draw(self, screen, font_small, font_big, player, mouse_pos, WIDTH, HEIGHT):
         """
         Dibuja la tienda completa con su panel, ítems y deslizador lateral.
 
+        Solo se recorren los ítems visibles; sus tarjetas se reutilizan
+        mientras no cambie su aspecto.
+
         Args:
             screen (pygame.Surface): Superficie donde se dibuja.
             font_small (pygame.font.Font): Fuente pequeña para texto.
@@ -207,13 +306,13 @@ class Shop:
             HEIGHT (int): Alto de la ventana.
         """
         header_height = 60
-        panel_width = 380
+        panel_width = SHOP_PANEL_WIDTH
         panel_x, panel_y = WIDTH - panel_width, header_height
         panel_h = HEIGHT - header_height
 
         draw_shop_panel(screen, panel_x, panel_y, panel_width, panel_h)
 
-        title = font_big.render("TIENDA", True, (80, 60, 40))
+        title = render_text(font_big, "TIENDA", (80, 60, 40))
         screen.blit(title, (panel_x + 100, header_height + 8))
         pygame.draw.line(
             screen,
@@ -223,48 +322,53 @@ class Shop:
             2,
         )
 
-        item_height, spacing = 60, 8
-        total_height = len(self.items) * (item_height + spacing)
-        self.max_scroll = max(0, total_height - (panel_h - 60))
+        self._draw_toolbar(
+            screen,
+            font_small,
+            panel_x + SHOP_PADDING_X,
+            panel_y + 60,
+            panel_width - 2 * SHOP_PADDING_X,
+        )
+
+        stride = SHOP_ITEM_HEIGHT + SHOP_PADDING_Y
+        total_height = len(self.items) * stride
+        self.max_scroll = max(0, total_height - (panel_h - LIST_TOP))
         self.scroll_offset = max(0, min(self.scroll_offset, self.max_scroll))
+        self.list_rect = pygame.Rect(
+            panel_x + SHOP_PADDING_X,
+            panel_y + LIST_TOP,
+            panel_width - 2 * SHOP_PADDING_X,
+            panel_h - LIST_TOP,
+        )
+
+        # --- ÍTEMS VISIBLES (recortados a la zona de la lista) ---
+        previous_clip = screen.get_clip()
+        screen.set_clip(previous_clip.clip(self.list_rect))
+        hovered_index = self.item_index_at(mouse_pos)
+        visible = self.visible_range()
+        top = self.list_rect.y - int(self.scroll_offset)
+        for index in visible:
+            count, price = self.quote(self.items[index], player.money)
+            card = self._card(
+                index, font_small, count, price, player.can_afford(price), index == hovered_index
+            )
+            item = self.items[index]
+            item.rect = card.get_rect(topleft=(self.list_rect.x, top + index * stride))
+            screen.blit(card, item.rect)
+        screen.set_clip(previous_clip)
 
-        y_offset = header_height + 60 - self.scroll_offset
-        for item in self.items:
-            can_afford = player.can_afford(item.cost)
-            rect = pygame.Rect(panel_x + 30, y_offset, panel_width - 60, item_height)
-            color = item.color
-            if not can_afford:
-                color = tuple(max(130, c - 70) for c in color)
-            elif rect.collidepoint(mouse_pos):
-                color = tuple(min(255, c + 25) for c in color)
-
-            if rect.bottom >= panel_y and rect.y <= panel_y + panel_h:
-                pygame.draw.rect(screen, color, rect, border_radius=10)
-                pygame.draw.rect(screen, (90, 70, 40), rect, 2, border_radius=10)
-                screen.blit(
-                    font_small.render(item.name, True, (50, 35, 20)),
-                    (rect.x + 10, rect.y + 6),
-                )
-                screen.blit(
-                    font_small.render(f"${item.cost}", True, (60, 45, 30)),
-                    (rect.x + 10, rect.y + 30),
-                )
-                screen.blit(
-                    font_small.render(f"x{item.amount}", True, (50, 35, 20)),
-                    (rect.right - 50, rect.y + 18),
-                )
-
-            item.rect = rect
-            y_offset += item_height + spacing
+        # Las tarjetas que ya no se ven se descartan para limitar la memoria
+        if len(self._cards) > len(visible):
+            self._cards = {i: self._cards[i] for i in visible if i in self._cards}
 
         # --- DESLIZADOR LATERAL ---
         self.slider_rect = None
-        if total_height > panel_h - 60:
-            slider_height = max(40, (panel_h - 60) * (panel_h - 60) / total_height)
+        if total_height > panel_h - LIST_TOP:
+            slider_height = max(40, (panel_h - LIST_TOP) * (panel_h - LIST_TOP) / total_height)
             slider_y = (
                 panel_y
-                + 60
-                + (panel_h - 60 - slider_height) * self.scroll_offset / self.max_scroll
+                + LIST_TOP
+                + (panel_h - LIST_TOP - slider_height) * self.scroll_offset / self.max_scroll
             )
             self.slider_rect = pygame.Rect(
                 panel_x + panel_width - 15, slider_y, 10, slider_height
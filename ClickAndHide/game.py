@@ -2,25 +2,221 @@
 game.py — Lógica principal del juego Click & Hide.
 
 Contiene tanto el modo normal (con menú, intro y guardado)
-como el modo demo (automático, sin menú ni intro).
+como el modo demo (automático, sin menú ni intro) y el modo benchmark
+(la demo sin ventana durante un número fijo de fotogramas).
 """
 
+import json
 import pygame
-import os
 import time
 
-from config import WIDTH, HEIGHT, FPS, MONEY_START
-from auxiliary import draw_gradient_background, draw_header
+from config import (
+    WIDTH,
+    HEIGHT,
+    FPS,
+    MONEY_START,
+    AUTOSAVE_INTERVAL,
+    SAVE_JOURNAL,
+    JOURNAL_SNAPSHOT_INTERVAL,
+    SIM_SPEED,
+    FONT_PATH,
+    FONT_SMALL,
+    FONT_MEDIUM,
+    FONT_BIG,
+    DEBUG_MODE,
+    BENCH_FRAMES,
+)
+from assets import assets, load_font
+from auxiliary import draw_gradient_background, draw_header, invalidate_layers
 from entities.player import Player
 from entities.shop import Shop
 from entities.achievements import Achievements
-from intro import play_intro
-from menu.main_menu import show_main_menu
-from save import save_game, load_game
+from screens import Screen, ScreenManager
+from startup import startup_trace
+from profiler import profiler
+from save import load_game
+from autosave import AutoSaver
+from journal import SaveJournal
+from render import DirtyRenderer
+from core.clock import FixedStepClock
+from core.events import (
+    EventBus,
+    Revision,
+    CLICKED,
+    PURCHASED,
+    INCOME_APPLIED,
+    MONEY_CHANGED,
+)
+from core.strategy import create_strategy
+from core.bignum import format_short
+
+
+# --- RENDERIZADO PARCIAL ---
+def build_game_renderer(screen, fonts, player, shop, achievements_manager):
+    """
+    Crea el compositor de rectángulos sucios con los elementos de la partida.
+
+    Cada elemento indica su área y una clave de estado; solo se redibuja
+    (y se envía a la pantalla) cuando esa clave o su área cambian.
+
+    Args:
+        screen (pygame.Surface): Superficie de la ventana.
+        fonts (tuple[pygame.font.Font]): Fuentes pequeña, mediana y grande.
+        player (Player): Instancia del jugador.
+        shop (Shop): Instancia de la tienda.
+        achievements_manager (Achievements): Gestor de logros (para las notificaciones).
+
+    Returns:
+        DirtyRenderer: Compositor listo para llamar a `render(mouse_pos)` cada fotograma.
+    """
+    font_small, font_medium, font_big = fonts
+    renderer = DirtyRenderer(
+        screen, lambda surface: draw_gradient_background(surface, WIDTH, HEIGHT)
+    )
+    header_rect = pygame.Rect(0, 0, WIDTH, 60)
+    shop_rect = shop.panel_rect(WIDTH, HEIGHT)
+    # La cabecera solo cambia con los eventos que modifican dinero, clics o ingresos
+    header_revision = Revision(player.events, CLICKED, PURCHASED, INCOME_APPLIED, MONEY_CHANGED)
+
+    renderer.add(
+        "header",
+        lambda surface, mouse_pos: draw_header(surface, font_medium, font_small, player),
+        lambda: header_rect,
+        lambda mouse_pos: header_revision.value,
+    )
+    renderer.add(
+        "click_button",
+        lambda surface, mouse_pos: player.draw_click_button(
+            surface, font_medium, mouse_pos, WIDTH, HEIGHT
+        ),
+        lambda: player.click_rect,
+        player.button_state,
+    )
+    renderer.add(
+        "shop",
+        lambda surface, mouse_pos: shop.draw(
+            surface, font_small, font_big, player, mouse_pos, WIDTH, HEIGHT
+        ),
+        lambda: shop_rect,
+        lambda mouse_pos: shop.render_state(player, mouse_pos),
+    )
+    renderer.add(
+        "notifications",
+        lambda surface, mouse_pos: achievements_manager.draw_notifications(
+            surface, font_small
+        ),
+        lambda: achievements_manager.notifications_rect(HEIGHT),
+        lambda mouse_pos: achievements_manager.notifications_rect(HEIGHT),
+    )
+    return renderer
+
+
+# --- PANTALLA DE LA PARTIDA ---
+class GameScreen(Screen):
+    """
+    Pantalla de la partida (clics, tienda, ingresos y logros).
+
+    Se apila encima del menú principal; `ESC` la quita y vuelve al menú.
+
+    Atributos:
+        player (Player): Instancia del jugador.
+        shop (Shop): Instancia de la tienda.
+        achievements_manager (Achievements): Gestor de logros.
+        sim_clock (FixedStepClock): Reloj de juego.
+        renderer (DirtyRenderer): Compositor de la partida.
+        autosaver (AutoSaver): Guardado en segundo plano.
+    """
+
+    header_height = 60
+    # Además de teclas y clics: soltar el botón, arrastrar el deslizador y la rueda
+    handled_events = Screen.handled_events | frozenset(
+        (pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION, pygame.MOUSEWHEEL)
+    )
+
+    def __init__(self, player, shop, achievements_manager, sim_clock, renderer, autosaver):
+        """
+        Args:
+            player (Player): Instancia del jugador.
+            shop (Shop): Instancia de la tienda.
+            achievements_manager (Achievements): Gestor de logros.
+            sim_clock (FixedStepClock): Reloj de juego.
+            renderer (DirtyRenderer): Compositor de la partida.
+            autosaver (AutoSaver): Guardado en segundo plano.
+        """
+        self.player = player
+        self.shop = shop
+        self.achievements_manager = achievements_manager
+        self.sim_clock = sim_clock
+        self.renderer = renderer
+        self.autosaver = autosaver
+
+    def enter(self):
+        """Redibuja todo (el menú ha dibujado encima) y descarta el tiempo pasado en el menú."""
+        self.renderer.invalidate()
+        self.sim_clock.resync()  # El tiempo en el menú no genera ingresos
+
+    def handle_event(self, event, mouse_pos):
+        """
+        Procesa teclado, clics, deslizador y rueda del ratón de la partida.
+
+        Cada tipo de evento va solo a quien lo usa: la rueda a `handle_scroll`
+        y los movimientos, mientras se arrastra, al deslizador.
+
+        Args:
+            event (pygame.event.Event): Evento recibido.
+            mouse_pos (tuple[int, int]): Posición del ratón en el evento.
+        """
+        if event.type == pygame.VIDEOEXPOSE:
+            self.renderer.invalidate()
+        elif event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_ESCAPE:
+                self.autosaver.flush()
+                self.manager.pop()
+            elif event.key == pygame.K_F11:
+                pygame.display.toggle_fullscreen()
+                invalidate_layers()
+                self.renderer.invalidate()
+            elif event.key == pygame.K_F4:
+                self.renderer.toggle_debug()
+        elif event.type == pygame.MOUSEWHEEL:
+            self.shop.handle_scroll(event)
+        elif event.type != pygame.MOUSEMOTION or self.shop.dragging_slider:
+            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                if self.player.click_rect.collidepoint(mouse_pos):
+                    self.player.click()
+                self.shop.handle_click(mouse_pos, self.player)
+            self.shop.handle_mouse_events(
+                event, mouse_pos, self.header_height, HEIGHT - self.header_height
+            )
+
+    def update(self, dt):
+        """
+        Avanza el reloj de juego, aplica el dinero pasivo y el guardado.
+
+        Args:
+            dt (float): Segundos reales desde el fotograma anterior.
+        """
+        self.sim_clock.tick()
+        profiler.mark("reloj")
+        # Dinero pasivo (los logros se comprueban con los eventos)
+        self.player.apply_auto_income()
+        profiler.mark("ingresos")
+        self.autosaver.update()
+        profiler.mark("guardado")
+        self.achievements_manager.update_notifications()
+        profiler.mark("logros")
+
+    def draw(self, mouse_pos):
+        """Solo se redibujan y actualizan las zonas que han cambiado."""
+        self.renderer.render(mouse_pos)
+
+    def animating(self):
+        """Las notificaciones de logros se deslizan: necesitan FPS completos."""
+        return bool(self.achievements_manager.active_notifications)
 
 
 # --- MODO NORMAL DEL JUEGO ---
-def run_game():
+def run_game(speed=SIM_SPEED, intro=True):
     """
     Ejecuta el bucle principal del juego Click & Hide.
 
@@ -31,200 +227,383 @@ def run_game():
       - Gestión de clics, compras y logros.
 
     Comportamiento:
+      - El menú, sus paneles y la partida son pantallas que se construyen una
+        vez y se apilan en un `ScreenManager` (un solo bucle y un solo reloj).
       - Usa `ESC` para volver al menú.
-      - Guarda el progreso automáticamente tras cada acción.
-      - Dibuja interfaz principal (fondo, cabecera, tienda, etc.).
-
+      - Guarda el progreso en segundo plano cada `AUTOSAVE_INTERVAL` segundos,
+        al volver al menú y al salir (ver `autosave.AutoSaver`).
+      - Dibuja interfaz principal (fondo, cabecera, tienda, etc.), actualizando
+        solo las zonas que cambian (`F4` muestra esas zonas, `F3` el tiempo
+        de cada fase del fotograma).
+      - El tiempo de juego lo marca un reloj de paso fijo; el tiempo pasado
+        en el menú no cuenta.
+      - Sin actividad el bucle baja el ritmo de fotogramas (ver `screens`);
+        los ingresos y el guardado siguen al reloj real.
+      - La intro y el menú se importan aquí y los paneles al abrirse por
+        primera vez, para que el primer fotograma llegue antes.
+
+    Args:
+        speed (float): Multiplicador del tiempo de juego (avance rápido).
+        intro (bool): Si se reproduce la intro (False con `--fast-start`).
     """
     # --- Configuración de pantalla ---
     screen = pygame.display.set_mode((WIDTH, HEIGHT))
     pygame.display.set_caption("CLICK AND HIDE")
-    clock = pygame.time.Clock()
+    startup_trace.mark("ventana")
 
     # --- Fuentes ---
-    base_font_path = os.path.join(
-        os.path.dirname(__file__), "assets", "fonts", "PressStart2P.ttf"
-    )
-    font_small = pygame.font.Font(base_font_path, 14)
-    font_medium = pygame.font.Font(base_font_path, 18)
-    font_big = pygame.font.Font(base_font_path, 28)
+    font_small = load_font(FONT_PATH, FONT_SMALL)
+    font_medium = load_font(FONT_PATH, FONT_MEDIUM)
+    font_big = load_font(FONT_PATH, FONT_BIG)
+    startup_trace.mark("fuentes")
 
     # --- Estado inicial ---
-    player = Player()
-    shop = Shop()
+    sim_clock = FixedStepClock(speed=speed)
+    events = EventBus()
+    player = Player(sim_clock, events)
+    shop = Shop(events)
     achievements_manager = Achievements()
-    load_game(player, shop)  # Carga el progreso anterior (si existe)
+    journal = SaveJournal() if SAVE_JOURNAL else None
+    offline_summary = load_game(player, shop, journal)  # Progreso anterior (si existe)
+    startup_trace.mark("partida cargada")
+    autosaver = AutoSaver(
+        player,
+        shop,
+        interval=JOURNAL_SNAPSHOT_INTERVAL if journal else AUTOSAVE_INTERVAL,
+        journal=journal,
+    )
 
-    running = True
-    state = "menu"
-    header_height = 60
-    game_started = player.total_clicks > 0 or player.money != MONEY_START
+    # Logros, diario y guardado reaccionan a los eventos del jugador y la tienda
+    achievements_manager.attach(events)
+    if journal is not None:
+        journal.attach(events)
+    autosaver.attach(events)
+    autosaver.start()
+
+    renderer = build_game_renderer(
+        screen, (font_small, font_medium, font_big), player, shop, achievements_manager
+    )
 
     # --- Intro inicial ---
-    play_intro(screen, "clase.png")
+    if intro:
+        from intro import play_intro
+
+        play_intro(screen, "clase.png")
+        startup_trace.mark("intro")
+    if DEBUG_MODE:
+        assets.report()
+
+    from menu.main_menu import MainMenu
+
+    # --- Pantallas (se construyen una sola vez) ---
+    manager = ScreenManager(screen)
+    game_screen = GameScreen(player, shop, achievements_manager, sim_clock, renderer, autosaver)
+
+    def on_play(choice):
+        """Empieza una partida nueva (JUGAR) o continúa la actual (CONTINUAR)."""
+        if choice == "JUGAR" and not menu.game_started:
+            player.reset(MONEY_START)
+            shop.init_items()
+            # En disco antes de aceptar clics: el diario no debe quedar sobre la partida anterior
+            autosaver.save_now()
+            menu.game_started = True
+        # Los cambios sin eventos (carga, reinicio) se comprueban una vez
+        achievements_manager.update_achievements(player.stats())
+        manager.push(game_screen)
+
+    menu = MainMenu(
+        screen,
+        font_small,
+        player,
+        achievements_manager,
+        on_play,
+        game_started=player.total_clicks > 0 or player.money != MONEY_START,
+        offline_summary=offline_summary,  # El resumen solo se muestra al iniciar
+    )
+    manager.push(menu)
+    startup_trace.mark("menú")
 
     # --- Bucle principal ---
-    while running:
-        dt = clock.tick(FPS) / 1000.0
-        mouse_pos = pygame.mouse.get_pos()
-
-        # --- Menú principal ---
-        if state == "menu":
-            choice = show_main_menu(
-                screen, font_small, font_big, game_started, player, achievements_manager
-            )
-            if choice in ["EXIT", "SALIR"]:
-                running = False
-                continue
-            elif choice in ["PLAY", "JUGAR"]:
-                state = "playing"
-                if not game_started:
-                    player.reset(MONEY_START)
-                    shop.init_items()
-                    game_started = True
-                continue
-            elif choice in ["CONTINUE", "CONTINUAR"]:
-                state = "playing"
-                continue
-            elif choice in ["ACHIEVEMENTS", "LOGROS", "CREDITS", "CRÉDITOS"]:
-                continue  # Futuras implementaciones
-
-        # --- Gestión de eventos ---
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    state = "menu"
-                elif event.key == pygame.K_F11:
-                    pygame.display.toggle_fullscreen()
-            elif state == "playing":
-                if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                    if player.click_rect.collidepoint(mouse_pos):
-                        player.click()
-                        save_game(player, shop)
-                    shop.handle_click(mouse_pos, player, achievements_manager)
-                    save_game(player, shop)
-                shop.handle_scroll(event)
-                shop.handle_mouse_events(
-                    event, mouse_pos, header_height, HEIGHT - header_height
-                )
-
-        # --- Actualización y dibujo ---
-        if state == "playing":
-            draw_gradient_background(screen, WIDTH, HEIGHT)
-            draw_header(screen, font_medium, font_small, player)
-            player.draw_click_button(screen, font_medium, mouse_pos, WIDTH, HEIGHT)
-            shop.draw(screen, font_small, font_big, player, mouse_pos, WIDTH, HEIGHT)
-
-            # Dinero pasivo
-            player.apply_auto_income()
-            save_game(player, shop)
-
-            # Actualización de logros
-            game_state = {
-                "money": player.money,
-                "total_clicks": player.total_clicks,
-                "upgrades_bought": sum(item.amount for item in shop.items),
-            }
-            achievements_manager.update_achievements(game_state)
-            achievements_manager.manage_notifications(screen, font_small)
-
-        pygame.display.flip()
+    try:
+        manager.run()
+    finally:
+        autosaver.close()
 
 
-# --- MODO DEMO AUTOMÁTICO ---
-def run_game_demo():
+# --- PANTALLA DE LA DEMO ---
+class DemoScreen(Screen):
+    """
+    Partida jugada por el bot de la demo.
+
+    Atributos:
+        player (Player): Instancia del jugador.
+        shop (Shop): Instancia de la tienda.
+        achievements_manager (Achievements): Gestor de logros.
+        sim_clock (FixedStepClock): Reloj de juego.
+        renderer (DirtyRenderer): Compositor de la partida.
+        strategy (Strategy): Estrategia de compra del bot.
+        max_duration (float | None): Segundos reales que dura la demo (None: sin límite).
+        max_frames (int | None): Fotogramas que dura la demo (None: sin límite).
+        frames (int): Fotogramas jugados.
     """
-    Ejecuta una versión automática del juego (modo demostración).
 
-    Este modo no incluye menú ni intro, y funciona sin interacción del jugador.
+    def __init__(
+        self,
+        player,
+        shop,
+        achievements_manager,
+        sim_clock,
+        renderer,
+        strategy,
+        max_duration=30,
+        max_frames=None,
+    ):
+        """
+        Args:
+            player (Player): Instancia del jugador.
+            shop (Shop): Instancia de la tienda.
+            achievements_manager (Achievements): Gestor de logros.
+            sim_clock (FixedStepClock): Reloj de juego.
+            renderer (DirtyRenderer): Compositor de la partida.
+            strategy (Strategy): Estrategia de compra del bot.
+            max_duration (float | None): Segundos reales que dura la demo (None: sin límite).
+            max_frames (int | None): Fotogramas que dura la demo (None: sin límite).
+        """
+        self.player = player
+        self.shop = shop
+        self.achievements_manager = achievements_manager
+        self.sim_clock = sim_clock
+        self.renderer = renderer
+        self.strategy = strategy
+        self.max_duration = max_duration
+        self.max_frames = max_frames
+        self.frames = 0
+        self.spent = 0  # Dinero gastado por el bot (para medir el dinero total ganado)
+        self.million_time = None
+        self.start_time = None
+
+    def enter(self):
+        """Empieza a contar el límite de tiempo de la demo."""
+        self.start_time = time.time()
+        self.renderer.invalidate()
+
+    def handle_event(self, event, mouse_pos):
+        """
+        `ESC` termina la demo y `F4` muestra las zonas redibujadas.
+
+        Args:
+            event (pygame.event.Event): Evento recibido.
+            mouse_pos (tuple[int, int]): Posición del ratón.
+        """
+        if event.type == pygame.VIDEOEXPOSE:
+            self.renderer.invalidate()
+        elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            self.manager.quit()
+        elif event.type == pygame.KEYDOWN and event.key == pygame.K_F4:
+            self.renderer.toggle_debug()
+
+    def update(self, dt):
+        """
+        Juega un fotograma: clic, compras del bot, dinero pasivo y notificaciones.
+
+        Args:
+            dt (float): Segundos reales desde el fotograma anterior.
+        """
+        self.sim_clock.tick()
+        profiler.mark("reloj")
 
-    Características:
-      - Realiza clics automáticos periódicos.
-      - Compra ítems de la tienda según el dinero disponible.
-      - Se cierra automáticamente después de 30 segundos.
+        # Salida automática tras el límite
+        self.frames += 1
+        if self.max_duration is not None and time.time() - self.start_time > self.max_duration:
+            print("Demo finalizada automáticamente.")
+            self.manager.quit()
+        elif self.max_frames is not None and self.frames >= self.max_frames:
+            self.manager.quit()
 
-    Ideal para pruebas rápidas o capturas de pantalla.
+        # --- IA: clics y compras automáticas ---
+        player = self.player
+        player.click()
+        self.spent += self.strategy.act(self.shop, player)
+        if self.million_time is None and player.money + self.spent >= 1_000_000:
+            self.million_time = self.sim_clock.now()
+            print(f"[DEMO] {self.strategy.name}: $1M ganado en {self.million_time:.0f} s de juego")
+        profiler.mark("bot")
+
+        # Dinero pasivo (los logros se comprueban con los eventos)
+        player.apply_auto_income()
+        profiler.mark("ingresos")
+        self.achievements_manager.update_notifications()
+        profiler.mark("logros")
+
+    def draw(self, mouse_pos):
+        """Solo se redibujan las zonas que cambian."""
+        self.renderer.render(mouse_pos)
+
+    def animating(self):
+        """El bot juega en cada fotograma: la demo siempre va a FPS completos."""
+        return True
 
+
+# --- MODO DEMO AUTOMÁTICO ---
+def build_demo(screen, sim_clock, strategy_name="greedy", **limits):
     """
-    # --- Configuración de pantalla ---
-    screen = pygame.display.set_mode((WIDTH, HEIGHT))
-    pygame.display.set_caption("CLICK AND HIDE — DEMO")
-    clock = pygame.time.Clock()
+    Crea una partida nueva jugada por el bot, lista para apilarla.
 
+    Args:
+        screen (pygame.Surface): Ventana del juego.
+        sim_clock (FixedStepClock): Reloj de juego.
+        strategy_name (str): Estrategia de compra del bot ("greedy" o "roi").
+        **limits: `max_duration` y/o `max_frames` de `DemoScreen`.
+
+    Returns:
+        DemoScreen: Pantalla de la demo.
+    """
     # --- Fuentes ---
-    base_font_path = os.path.join(
-        os.path.dirname(__file__), "assets", "fonts", "PressStart2P.ttf"
-    )
-    font_small = pygame.font.Font(base_font_path, 14)
-    font_medium = pygame.font.Font(base_font_path, 18)
-    font_big = pygame.font.Font(base_font_path, 28)
+    font_small = load_font(FONT_PATH, FONT_SMALL)
+    font_medium = load_font(FONT_PATH, FONT_MEDIUM)
+    font_big = load_font(FONT_PATH, FONT_BIG)
+    startup_trace.mark("fuentes")
 
     # --- Estado inicial ---
-    player = Player()
-    shop = Shop()
+    events = EventBus()
+    player = Player(sim_clock, events)
+    shop = Shop(events)
     achievements_manager = Achievements()
-    header_height = 60
+    achievements_manager.attach(events)
 
     player.reset(MONEY_START)
     shop.init_items()
+    startup_trace.mark("partida creada")
+    renderer = build_game_renderer(
+        screen, (font_small, font_medium, font_big), player, shop, achievements_manager
+    )
+    return DemoScreen(
+        player,
+        shop,
+        achievements_manager,
+        sim_clock,
+        renderer,
+        create_strategy(strategy_name),
+        **limits,
+    )
 
-    # --- Límite temporal de la demo ---
-    start_time = time.time()
-    max_duration = 30  # segundos
 
-    running = True
-    while running:
-        dt = clock.tick(FPS) / 1000.0
-        mouse_pos = pygame.mouse.get_pos()
+def run_game_demo(speed=SIM_SPEED, strategy_name="greedy"):
+    """
+    Ejecuta una versión automática del juego (modo demostración).
 
-        # Salida automática tras el límite
-        if time.time() - start_time > max_duration:
-            print("Demo finalizada automáticamente.")
-            running = False
+    Este modo no incluye menú ni intro, y funciona sin interacción del jugador.
 
-        # --- Eventos ---
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
-            elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
-                running = False
+    Características:
+      - Realiza clics automáticos periódicos.
+      - Compra ítems de la tienda según la estrategia elegida (`core.strategy`).
+      - Se cierra automáticamente después de 30 segundos reales.
+      - `F3` muestra el perfilador de fotogramas, como en el modo normal.
 
-        # --- IA: clics y compras automáticas ---
-        player.click()
-        for item in shop.items:
-            while player.money >= item.cost:
-                player.money -= item.cost
-                item.amount += 1
-                item.cost = int(item.cost * 1.15)
-                if item.tipo == "click":
-                    player.click_income += item.base_income
-                else:
-                    player.auto_income += item.base_income
-                player.upgrades_bought = getattr(player, "upgrades_bought", 0) + 1
-
-                game_state = {
-                    "money": player.money,
-                    "total_clicks": player.total_clicks,
-                    "upgrades_bought": player.upgrades_bought,
-                }
-                achievements_manager.update_achievements(game_state)
-
-        # --- Dibujo ---
-        draw_gradient_background(screen, WIDTH, HEIGHT)
-        draw_header(screen, font_medium, font_small, player)
-        player.draw_click_button(screen, font_medium, mouse_pos, WIDTH, HEIGHT)
-        shop.draw(screen, font_small, font_big, player, mouse_pos, WIDTH, HEIGHT)
-
-        # Dinero pasivo + logros
-        player.apply_auto_income()
-        game_state = {
-            "money": player.money,
-            "total_clicks": player.total_clicks,
-            "upgrades_bought": sum(item.amount for item in shop.items),
-        }
-        achievements_manager.update_achievements(game_state)
-        achievements_manager.manage_notifications(screen, font_small)
-
-        pygame.display.flip()
+    Ideal para pruebas rápidas o capturas de pantalla.
+
+    Args:
+        speed (float): Multiplicador del tiempo de juego (avance rápido).
+        strategy_name (str): Estrategia de compra del bot ("greedy" o "roi").
+    """
+    # --- Configuración de pantalla ---
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    pygame.display.set_caption("CLICK AND HIDE — DEMO")
+    startup_trace.mark("ventana")
+
+    manager = ScreenManager(screen)
+    manager.push(build_demo(screen, FixedStepClock(speed=speed), strategy_name))
+    manager.run()
+
+
+# --- MODO BENCHMARK (SIN VENTANA) ---
+def run_game_bench(frames=BENCH_FRAMES, speed=SIM_SPEED, strategy_name="greedy", json_path=None):
+    """
+    Mide el rendimiento del bucle de la demo durante un número fijo de fotogramas.
+
+    Pensado para comparar versiones en máquinas sin pantalla: `main.py --bench`
+    usa el controlador de vídeo `dummy` de SDL. El bucle no se limita a FPS y
+    el reloj de juego avanza exactamente 1/FPS segundos (por `speed`) en cada
+    fotograma, así que todas las ejecuciones simulan la misma partida y solo
+    cambia lo que tarda.
+
+    Mide con el perfilador (`profiler.py`):
+      - Fotogramas por segundo conseguidos y tiempo total.
+      - Distribución de la duración de los fotogramas (media, p50, p95, p99, máximo).
+      - Coste medio de cada fase (eventos, bot, ingresos, logros, cada elemento dibujado...).
+
+    Args:
+        frames (int): Fotogramas que se ejecutan.
+        speed (float): Multiplicador del tiempo de juego.
+        strategy_name (str): Estrategia de compra del bot.
+        json_path (str | None): Si se indica, guarda además el resultado en JSON
+            en ese archivo.
+
+    Returns:
+        dict: Resultado del benchmark (el mismo que se escribe en JSON).
+    """
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    pygame.display.set_caption("CLICK AND HIDE — BENCH")
+
+    manager = ScreenManager(screen, fps=0)  # 0: sin límite de fotogramas por segundo
+    # Tiempo de juego según los fotogramas jugados, no según el reloj real
+    sim_clock = FixedStepClock(speed=speed, source=lambda: manager.frames / FPS)
+    demo = build_demo(screen, sim_clock, strategy_name, max_duration=None, max_frames=frames)
+    manager.push(demo)
+
+    profiler.reset(window=frames)
+    profiler.enable()
+    start = time.perf_counter()
+    manager.run()
+    profiler.begin_frame()  # Cierra el último fotograma
+    elapsed = time.perf_counter() - start
+    profiler.disable()
+
+    stats = profiler.summary()
+    result = {
+        "frames": demo.frames,
+        "seconds": elapsed,
+        "fps": demo.frames / elapsed if elapsed else 0.0,
+        "frame_ms": stats["frame_ms"],
+        "dropped": stats["dropped"],
+        "phases": stats["phases"],
+        "game": {
+            "strategy": demo.strategy.name,
+            "sim_seconds": sim_clock.now(),
+            "money": float(demo.player.money),
+            "spent": float(demo.spent),
+            "items": sum(item.amount for item in demo.shop.items),
+            "million_time": demo.million_time,
+        },
+    }
+
+    _print_bench_report(result, FPS)
+    if json_path is not None:
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2)
+        print(f"[BENCH] Resultado guardado en: {json_path}")
+    return result
+
+
+def _print_bench_report(result, fps):
+    """Muestra por consola el resultado de `run_game_bench` en forma de tabla."""
+    frame = result["frame_ms"]
+    game = result["game"]
+    print(
+        f"[BENCH] {result['frames']} fotogramas en {result['seconds']:.2f} s "
+        f"({result['fps']:.0f} fps; objetivo {fps})"
+    )
+    print(
+        f"[BENCH] fotograma (ms): media {frame['mean']:.3f}  p50 {frame['p50']:.3f}  "
+        f"p95 {frame['p95']:.3f}  p99 {frame['p99']:.3f}  máx {frame['max']:.3f}"
+    )
+    print(
+        f"[BENCH] partida: {game['strategy']}, {game['sim_seconds']:.0f} s de juego, "
+        f"{game['items']} ítems, ${format_short(game['money'])}"
+    )
+    print("[BENCH] fase              ms/fot     máx  bloques")
+    for name, phase in result["phases"].items():
+        print(
+            f"[BENCH] {name[:16]:<16} {phase['ms']:7.4f} {phase['max']:7.3f} "
+            f"{phase['blocks']:+8.2f}"
+        )
@@ -7,12 +7,82 @@ Muestra una breve secuencia animada antes del inicio del juego, incluyendo:
   - Logotipo girando
   - Texto de carga animado ("Cargando...")
   - Posibilidad de saltar la intro con clic o tecla
+
+Todo lo que se dibuja se prepara antes del bucle (`prepare_intro`), con las
+imágenes y fuentes de la caché compartida (`assets`): el fondo
+se escala una vez, el texto principal y su brillo se renderizan para cada
+tamaño del pulso, el logo se gira de antemano en INTRO_LOGO_FRAMES ángulos y
+los textos de carga se renderizan una vez. Cada fotograma solo hace blits,
+sin crear fuentes ni superficies nuevas.
 """
 
 import pygame
-import os
 import math
 
+from assets import load_image, load_font
+from config import (
+    FPS,
+    FONT_PATH,
+    LOGO_SIZE,
+    INTRO_MOVE_DURATION,
+    INTRO_LOAD_DURATION,
+    INTRO_FONT_SIZE,
+    INTRO_TEXT,
+    INTRO_TEXT_COLOR,
+    INTRO_LOGO_FRAMES,
+    INTRO_LOGO_SPEED,
+    INTRO_PULSE,
+)
+
+LOAD_FONT_SIZE = 28  # Tamaño del texto "Cargando..."
+GLOW_COLOR = (150, 150, 150)  # Color del brillo del texto principal
+GLOW_ALPHA = 80  # Transparencia del brillo
+
+
+# --- PREPARACIÓN DE LOS RECURSOS ---
+def prepare_intro(screen, background_image_name="inicio.png"):
+    """
+    Carga y prepara todas las superficies que usa la intro.
+
+    Args:
+        screen (pygame.Surface): Ventana principal (define el tamaño del fondo).
+        background_image_name (str): Nombre de la imagen de fondo.
+
+    Returns:
+        dict: Superficies preparadas:
+            - "background": fondo ya escalado a la ventana.
+            - "pulse": {tamaño de fuente: (texto, brillo)} para cada tamaño del pulso.
+            - "logo": lista de INTRO_LOGO_FRAMES giros del logo (de 0 a 360°).
+            - "loading": textos "Cargando", "Cargando."... con 0 a 3 puntos.
+    """
+    # --- Fondo (escalado una sola vez, sin transparencia: blit más rápido) ---
+    background = load_image(background_image_name, screen.get_size())
+
+    # --- Texto principal para cada tamaño del pulso ---
+    pulse = {}
+    for font_size in range(
+        int(INTRO_FONT_SIZE * (1 - INTRO_PULSE)), int(INTRO_FONT_SIZE * (1 + INTRO_PULSE)) + 1
+    ):
+        font = load_font(FONT_PATH, font_size)
+        text_surf = font.render(INTRO_TEXT, True, INTRO_TEXT_COLOR)
+        glow = font.render(INTRO_TEXT, True, GLOW_COLOR)
+        glow.set_alpha(GLOW_ALPHA)
+        pulse[font_size] = (text_surf, glow)
+
+    # --- Logo girado de antemano ---
+    logo_image = load_image("logo.png", LOGO_SIZE, alpha=True)
+    step = 360 / INTRO_LOGO_FRAMES
+    logo = [pygame.transform.rotate(logo_image, i * step) for i in range(INTRO_LOGO_FRAMES)]
+
+    # --- Textos de carga ---
+    loading_font = load_font(FONT_PATH, LOAD_FONT_SIZE)
+    loading = [
+        loading_font.render("Cargando" + "." * dots, True, (255, 255, 255))
+        for dots in range(4)
+    ]
+
+    return {"background": background, "pulse": pulse, "logo": logo, "loading": loading}
+
 
 # --- REPRODUCIR INTRO ---
 def play_intro(screen, background_image_name="inicio.png"):
@@ -33,36 +103,23 @@ def play_intro(screen, background_image_name="inicio.png"):
     """
     clock = pygame.time.Clock()
     width, height = screen.get_size()
-
-    # --- Cargar imágenes y fuentes ---
-    base_path = os.path.dirname(__file__)
-    bg_image = pygame.image.load(
-        os.path.join(base_path, "assets", "images", background_image_name)
-    ).convert_alpha()
-    logo_image = pygame.image.load(
-        os.path.join(base_path, "assets", "images", "logo.png")
-    ).convert_alpha()
-    logo_image = pygame.transform.smoothscale(logo_image, (100, 100))
-    font_path = os.path.join(base_path, "assets", "fonts", "PressStart2P.ttf")
-
-    main_font_size = 64
-    main_text = "CLICK AND HIDE"
-    main_font = pygame.font.Font(font_path, main_font_size)
+    assets = prepare_intro(screen, background_image_name)
+    background = assets["background"]
+    pulse = assets["pulse"]
+    logo = assets["logo"]
+    loading = assets["loading"]
 
     # --- Variables de animación ---
-    move_duration = 3.0  # Segundos que tarda el texto en caer
-    load_duration = 5.0  # Duración total del texto de carga
-    start_ticks = pygame.time.get_ticks()
-    text_y_start = -main_font_size
+    elapsed = 0.0  # Se acumula con el reloj (no depende de `pygame.init()`)
+    text_y_start = -INTRO_FONT_SIZE
     text_y_end = height // 2 - 100
-    text_color = (255, 255, 255)
-    logo_angle = 0
+    logo_center = (width // 2, height - 120)
+    loading_rects = [surf.get_rect(center=(width // 2, height - 40)) for surf in loading]
     running = True
 
     # --- Bucle principal ---
     while running:
-        dt = clock.tick(60) / 1000.0
-        elapsed = (pygame.time.get_ticks() - start_ticks) / 1000.0
+        elapsed += clock.tick(FPS) / 1000.0
 
         # --- Eventos ---
         for event in pygame.event.get():
@@ -73,43 +130,37 @@ def play_intro(screen, background_image_name="inicio.png"):
                 running = False  # Saltar intro
 
         # --- Fondo ---
-        screen.blit(pygame.transform.smoothscale(bg_image, (width, height)), (0, 0))
+        screen.blit(background, (0, 0))
 
         # --- Texto principal animado ---
-        progress = min(1, elapsed / move_duration)
+        progress = min(1, elapsed / INTRO_MOVE_DURATION)
         smooth = 1 - (1 - progress) ** 3  # Movimiento con suavizado cúbico
         text_y = text_y_start + (text_y_end - text_y_start) * smooth
 
-        pulse_scale = 1 + 0.02 * math.sin(elapsed * 6)
-        font_size = int(main_font_size * pulse_scale)
-        pulse_font = pygame.font.Font(font_path, font_size)
-        text_surf = pulse_font.render(main_text, True, text_color)
+        pulse_scale = 1 + INTRO_PULSE * math.sin(elapsed * 6)
+        text_surf, glow = pulse[int(INTRO_FONT_SIZE * pulse_scale)]
         text_rect = text_surf.get_rect(center=(width // 2, int(text_y)))
 
         # --- Efecto de brillo/sombra ---
         for offset in range(2, 0, -1):
-            glow = pulse_font.render(main_text, True, (150, 150, 150))
-            glow.set_alpha(80)
             screen.blit(glow, (text_rect.x - offset, text_rect.y - offset))
             screen.blit(glow, (text_rect.x + offset, text_rect.y + offset))
 
         screen.blit(text_surf, text_rect)
 
         # --- Logo girando + texto de carga ---
-        if elapsed >= move_duration:
-            logo_angle += 90 * dt
-            rotated_logo = pygame.transform.rotate(logo_image, logo_angle)
-            logo_rect = rotated_logo.get_rect(center=(width // 2, height - 120))
-            screen.blit(rotated_logo, logo_rect)
-
-            load_font = pygame.font.Font(font_path, 28)
-            dots = int((elapsed - move_duration) * 2) % 4
-            load_text = "Cargando" + "." * dots
-            load_surf = load_font.render(load_text, True, (255, 255, 255))
-            screen.blit(load_surf, load_surf.get_rect(center=(width // 2, height - 40)))
+        if elapsed >= INTRO_MOVE_DURATION:
+            load_elapsed = elapsed - INTRO_MOVE_DURATION
+            turns = load_elapsed * INTRO_LOGO_SPEED / 360  # Vueltas completadas
+            frame = int(turns * INTRO_LOGO_FRAMES) % INTRO_LOGO_FRAMES
+            rotated_logo = logo[frame]
+            screen.blit(rotated_logo, rotated_logo.get_rect(center=logo_center))
+
+            dots = int(load_elapsed * 2) % 4
+            screen.blit(loading[dots], loading_rects[dots])
 
         pygame.display.flip()
 
         # --- Fin automático ---
-        if elapsed >= move_duration + load_duration:
+        if elapsed >= INTRO_MOVE_DURATION + INTRO_LOAD_DURATION:
             running = False
@@ -0,0 +1,286 @@
+"""
+journal.py — Diario de guardado de solo-añadido para Click & Hide.
+
+En lugar de reescribir la partida entera por cada clic o compra, cada evento
+se añade como una línea JSON corta al final de `savegame.log`:
+  - {"s": 1, "e": "click", "m": 1}        → clic que ganó 1$
+  - {"s": 2, "e": "buy", "n": "Ratón", "p": 15}  → compra de "Ratón" por 15$
+  - {"s": 3, "e": "buy", "n": "Ratón", "p": 350, "k": 10}  → compra de 10 unidades
+  - {"s": 4, "e": "income", "m": 10}      → ingreso automático de 10$
+
+Los precios que no caben en un float se escriben como [mantisa, exponente]
+(`core.bignum.to_json`).
+
+`s` es un número de secuencia creciente. Las instantáneas completas
+(`save.write_save_data`) guardan el último número de secuencia incluido, de
+modo que al cargar solo se aplican los eventos posteriores. Tras cada
+instantánea el diario se compacta eliminando los eventos ya incluidos.
+
+El diario se suscribe a los eventos de la partida (`attach`), así que el
+jugador y la tienda no necesitan conocerlo.
+
+Cada evento se vuelca al sistema operativo en cuanto se escribe, por lo que
+sobrevive a un cierre forzado del juego. Una última línea incompleta (corte
+durante la escritura) se descarta al cargar.
+
+Al abrir el archivo para añadir, la secuencia continúa desde el último
+evento que ya contiene, aunque la instantánea no se haya podido cargar: así
+los eventos nuevos nunca repiten números de eventos antiguos.
+"""
+
+import json
+import os
+import threading
+
+from core.bignum import to_json, from_json
+from core.events import CLICKED, PURCHASED, INCOME_APPLIED
+
+# Diario de eventos junto al archivo de guardado
+JOURNAL_FILE = os.path.join(os.getcwd(), "savegame.log")
+
+
+# --- CLASE PRINCIPAL: SAVEJOURNAL ---
+class SaveJournal:
+    """
+    Diario de eventos de la partida con reproducción y compactación.
+
+    Atributos:
+        path (str): Ruta del archivo de diario.
+        seq (int): Número de secuencia del último evento registrado.
+        pending (int): Eventos registrados desde la última compactación.
+        records_written (int): Total de eventos añadidos en esta sesión.
+        bytes_written (int): Total de bytes añadidos en esta sesión.
+
+    Métodos:
+        attach(events): Registra en el diario los eventos publicados en un bus.
+        resume(): Continúa la secuencia desde el último evento del archivo.
+        record_click(amount): Registra un clic con el dinero ganado.
+        record_purchase(name, price, count): Registra la compra de un ítem.
+        record_income(amount): Registra un ingreso automático.
+        replay(player, shop, after_seq): Aplica los eventos posteriores a una instantánea.
+        compact(seq): Elimina del diario los eventos ya incluidos en una instantánea.
+        close(): Cierra el archivo del diario.
+    """
+
+    def __init__(self, path=JOURNAL_FILE):
+        """
+        Inicializa el diario sin abrir todavía el archivo.
+
+        Args:
+            path (str): Ruta del archivo de diario.
+        """
+        self.path = path
+        self.seq = 0
+        self.pending = 0
+        self.records_written = 0
+        self.bytes_written = 0
+        self._file = None
+        self._resumed = False
+        self._lock = threading.Lock()
+
+    # --- SUSCRIPCIÓN A LOS EVENTOS ---
+    def attach(self, events):
+        """
+        Suscribe el diario a los clics, compras e ingresos publicados en `events`.
+
+        Args:
+            events (EventBus): Bus de eventos de la partida.
+        """
+        events.subscribe(CLICKED, lambda total_clicks, amount: self.record_click(amount))
+        events.subscribe(
+            PURCHASED,
+            lambda item, count, price, upgrades: self.record_purchase(item.name, price, count),
+        )
+        events.subscribe(INCOME_APPLIED, self.record_income)
+
+    # --- REGISTRO DE EVENTOS ---
+    def record_click(self, amount):
+        """
+        Registra un clic que generó dinero.
+
+        Args:
+            amount (float): Dinero ganado con el clic.
+        """
+        self._append({"e": "click", "m": amount})
+
+    def record_purchase(self, name, price, count=1):
+        """
+        Registra la compra de una o varias unidades de un ítem de la tienda.
+
+        Args:
+            name (str): Nombre del ítem comprado.
+            price (BigNumber): Precio total pagado.
+            count (int): Número de unidades (solo se escribe si no es 1).
+        """
+        record = {"e": "buy", "n": name, "p": to_json(price)}
+        if count != 1:
+            record["k"] = count
+        self._append(record)
+
+    def record_income(self, amount):
+        """
+        Registra un ingreso automático.
+
+        Args:
+            amount (float): Dinero recibido.
+        """
+        self._append({"e": "income", "m": amount})
+
+    def _append(self, record):
+        """Añade un evento al final del diario y lo vuelca al sistema operativo."""
+        with self._lock:
+            try:
+                if self._file is None:
+                    self._open()
+                self.seq += 1
+                record["s"] = self.seq
+                line = json.dumps(record, separators=(",", ":"), ensure_ascii=False) + "\n"
+                self._file.write(line)
+                self._file.flush()
+            except Exception as e:
+                print(f"[ERROR] No se pudo escribir en el diario: {e}")
+                return
+            self.pending += 1
+            self.records_written += 1
+            self.bytes_written += len(line.encode("utf-8"))
+
+    def _open(self):
+        """Abre el diario para añadir eventos, continuando su secuencia."""
+        if not self._resumed:
+            self._resume()
+        self._file = open(self.path, "a", encoding="utf-8")
+
+    # --- LECTURA Y REPRODUCCIÓN ---
+    def resume(self):
+        """
+        Continúa la secuencia desde el último evento del archivo.
+
+        Se llama al cargar, antes de leer la instantánea: si esta no se puede
+        aplicar y no se llega a reproducir el diario, los eventos nuevos y las
+        instantáneas siguen numerándose después de los antiguos (y la
+        compactación los elimina todos). También descarta una última línea
+        cortada, que estropearía la siguiente.
+        """
+        with self._lock:
+            self._resume()
+
+    def _resume(self):
+        """Lee el diario y ajusta `seq` y `pending` (sin tomar el cerrojo)."""
+        records, torn = self._read_records()
+        self.seq = max([self.seq] + [record.get("s", 0) for record in records])
+        self.pending = len(records)
+        if torn:
+            self._rewrite(records)
+        self._resumed = True
+
+    def _read_records(self):
+        """
+        Lee los eventos válidos del diario.
+
+        Returns:
+            tuple[list[dict], bool]: Eventos leídos y True si la última línea estaba incompleta.
+        """
+        records = []
+        torn = False
+        if not os.path.exists(self.path):
+            return records, torn
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    torn = True
+                    break
+        return records, torn
+
+    def replay(self, player, shop, after_seq=0):
+        """
+        Aplica sobre el jugador y la tienda los eventos posteriores a `after_seq`.
+
+        Args:
+            player (Player): Jugador restaurado desde la última instantánea.
+            shop (Shop): Tienda restaurada desde la última instantánea.
+            after_seq (int): Último número de secuencia incluido en la instantánea.
+
+        Returns:
+            int: Número de eventos aplicados.
+        """
+        with self._lock:
+            records, torn = self._read_records()
+            items = shop.items_by_name
+            applied = 0
+            self.seq = max(self.seq, after_seq)
+
+            for record in records:
+                seq = record.get("s", 0)
+                self.seq = max(self.seq, seq)
+                if seq <= after_seq:
+                    continue
+
+                event = record.get("e")
+                if event == "click":
+                    player.money += record.get("m", 0)
+                    player.total_clicks += 1
+                elif event == "income":
+                    player.money += record.get("m", 0)
+                elif event == "buy" and record.get("n") in items:
+                    shop.apply_purchase(
+                        items[record["n"]],
+                        player,
+                        from_json(record.get("p", 0)),
+                        record.get("k", 1),
+                    )
+                applied += 1
+
+            self.pending = len(records)
+            if torn:
+                # Se reescribe sin la línea cortada para poder seguir añadiendo
+                self._rewrite(records)
+            self._resumed = True
+            return applied
+
+    # --- COMPACTACIÓN ---
+    def compact(self, seq):
+        """
+        Elimina del diario los eventos con secuencia menor o igual a `seq`.
+
+        Se llama después de escribir una instantánea que ya los incluye.
+        La reescritura es atómica (archivo temporal + fsync + rename).
+
+        Args:
+            seq (int): Último número de secuencia incluido en la instantánea.
+        """
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            records, _ = self._read_records()
+            remaining = [r for r in records if r.get("s", 0) > seq]
+            self._rewrite(remaining)
+            self.pending = len(remaining)
+
+    def _rewrite(self, records):
+        """Sustituye el contenido del diario por `records` de forma atómica."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        tmp_path = self.path + ".tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                for record in records:
+                    f.write(
+                        json.dumps(record, separators=(",", ":"), ensure_ascii=False)
+                        + "\n"
+                    )
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            print(f"[ERROR] No se pudo compactar el diario: {e}")
+
+    def close(self):
+        """Cierra el archivo del diario si estaba abierto."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
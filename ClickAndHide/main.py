@@ -6,11 +6,22 @@ Inicializa Pygame y ejecuta el modo de juego normal o demo según los argumentos
 Uso:
     python main.py         # Ejecuta el juego normalmente
     python main.py --demo  # Ejecuta el modo demostración automático
+    python main.py --speed 10  # Acelera el tiempo de juego x10
+    python main.py --demo --strategy roi  # Demo con compras por retorno de la inversión
+    python main.py --fast-start  # Arranca sin la intro
+    python main.py --startup-trace  # Muestra cuánto tarda cada fase del arranque
+    python main.py --bench --frames 5000 --json bench.json  # Benchmark sin ventana
 """
 
+from startup import startup_trace  # Primero: marca el inicio del arranque
+
 import argparse
+import os
 import pygame
 
+from config import SIM_SPEED, BENCH_FRAMES
+from core.strategy import STRATEGIES
+
 
 class Main:
     """Clase principal que inicializa y ejecuta el juego Click & Hide."""
@@ -18,18 +29,36 @@ class Main:
     def __init__(self):
         """Inicializa Pygame, lee los argumentos y lanza el juego o la demo."""
         self.read_args()
-        pygame.init()
+        if self.args.startup_trace:
+            startup_trace.enable()
+        startup_trace.mark("importaciones")
+
+        if self.args.bench:
+            # Sin ventana real (salvo que se elija otro controlador a mano)
+            os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
 
-        if not self.args.demo:
+        # Solo los módulos que usa el juego: no hay sonido, así que no se
+        # inicia el mezclador de audio (lo más lento de `pygame.init()`)
+        pygame.display.init()
+        pygame.font.init()
+        startup_trace.mark("pygame (pantalla + fuentes)")
+
+        if self.args.bench:
+            from game import run_game_bench
+
+            run_game_bench(self.args.frames, self.args.speed, self.args.strategy, self.args.json)
+        elif not self.args.demo:
             print("Demo OFF — iniciando modo normal.")
             from game import run_game
 
-            run_game()
+            startup_trace.mark("importar game")
+            run_game(self.args.speed, intro=not self.args.fast_start)
         else:
             print("Demo ON — iniciando modo demostración.")
             from game import run_game_demo
 
-            run_game_demo()
+            startup_trace.mark("importar game")
+            run_game_demo(self.args.speed, self.args.strategy)
 
         pygame.quit()
 
@@ -44,6 +73,44 @@ class Main:
             action="store_true",
             help="Ejecuta el modo demo automático (sin menú ni intro).",
         )
+        parser.add_argument(
+            "--speed",
+            type=float,
+            default=SIM_SPEED,
+            help="Multiplicador del tiempo de juego (por defecto, tiempo real).",
+        )
+        parser.add_argument(
+            "--strategy",
+            choices=sorted(STRATEGIES),
+            default="greedy",
+            help="Estrategia de compra del bot en el modo demo.",
+        )
+        parser.add_argument(
+            "--bench",
+            action="store_true",
+            help="Mide el rendimiento de la demo sin ventana y sin límite de FPS.",
+        )
+        parser.add_argument(
+            "--frames",
+            type=int,
+            default=BENCH_FRAMES,
+            help="Fotogramas que se ejecutan en el modo benchmark.",
+        )
+        parser.add_argument(
+            "--json",
+            metavar="RUTA",
+            help="Guarda además el resultado del benchmark en JSON en RUTA.",
+        )
+        parser.add_argument(
+            "--fast-start",
+            action="store_true",
+            help="Arranca directamente en el menú, sin la intro.",
+        )
+        parser.add_argument(
+            "--startup-trace",
+            action="store_true",
+            help="Muestra la duración de cada fase del arranque hasta el primer fotograma.",
+        )
         self.args = parser.parse_args()
 
 
@@ -6,17 +6,14 @@ Muestra los logros desbloqueados o pendientes del jugador con interfaz visual in
 """
 
 import pygame
+from menu.panel import Panel
+from text_cache import render_text
 
 
-# --- FUNCIÓN PRINCIPAL ---
-def show_achievements_panel(screen, achievements, state):
+# --- CLASE PRINCIPAL: ACHIEVEMENTSPANEL ---
+class AchievementsPanel(Panel):
     """
-    Muestra el panel de logros del jugador.
-
-    Args:
-        screen (pygame.Surface): Ventana principal donde se dibuja el panel.
-        achievements (Achievements): Instancia del gestor de logros del juego.
-        state (dict): Estado actual del jugador para actualizar logros antes de mostrarlos.
+    Panel de logros del jugador.
 
     Descripción:
         Este panel muestra todos los logros existentes, destacando en verde los completados
@@ -26,90 +23,87 @@ def show_achievements_panel(screen, achievements, state):
     Controles:
         - **ESC**: Cierra el panel.
         - **Click en X**: Cierra el panel.
+
+    Atributos:
+        achievements (Achievements): Gestor de logros del juego.
+        player (Player): Jugador cuyas métricas se comprueban al abrir el panel.
+        backdrop (pygame.Surface | None): Copia de la pantalla anterior, para
+            borrar el tooltip al moverlo.
     """
 
-    # --- ACTUALIZACIÓN DE LOGROS ---
-    achievements.update_achievements(state)
-
-    # --- CONFIGURACIÓN INICIAL ---
-    clock = pygame.time.Clock()
-    font = pygame.font.SysFont(None, 24)
-    big_font = pygame.font.SysFont(None, 32)
-
-    # --- PANEL PRINCIPAL ---
-    panel_width = screen.get_width() * 0.7
-    panel_height = screen.get_height() * 0.7
-    panel_x = (screen.get_width() - panel_width) // 2
-    panel_y = (screen.get_height() - panel_height) // 2
-    panel_rect = pygame.Rect(panel_x, panel_y, panel_width, panel_height)
-
-    # --- BOTÓN DE CIERRE ---
-    close_rect = pygame.Rect(panel_rect.right - 40, panel_rect.top + 10, 30, 30)
-
-    # --- BUCLE PRINCIPAL DEL PANEL ---
-    running = True
-    while running:
-        clock.tick(60)
-        mouse_pos = pygame.mouse.get_pos()
-
-        # --- EVENTOS ---
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                exit()
-            if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
-                running = False
-            if event.type == pygame.MOUSEBUTTONDOWN and close_rect.collidepoint(
-                event.pos
-            ):
-                running = False
-
-        # --- DIBUJO DEL PANEL BASE ---
-        pygame.draw.rect(screen, (210, 180, 140), panel_rect, border_radius=12)
-        pygame.draw.rect(screen, (50, 50, 50), panel_rect, 3, border_radius=12)
-
-        # --- TÍTULO DEL PANEL ---
-        title = big_font.render("LOGROS", True, (0, 0, 0))
-        screen.blit(
-            title, (panel_rect.centerx - title.get_width() // 2, panel_rect.y + 15)
-        )
-
-        # --- BOTÓN DE CIERRE ---
-        pygame.draw.rect(screen, (220, 80, 80), close_rect, border_radius=6)
-        pygame.draw.rect(screen, (0, 0, 0), close_rect, 2, border_radius=6)
-        x_txt = font.render("X", True, (255, 255, 255))
-        screen.blit(
-            x_txt,
-            (
-                close_rect.centerx - x_txt.get_width() // 2,
-                close_rect.centery - x_txt.get_height() // 2,
-            ),
-        )
-
-        # --- LISTA DE LOGROS ---
+    title = "LOGROS"
+    color = (210, 180, 140)
+    font_size = 24
+    title_size = 32
+
+    def __init__(self, surface, achievements, player):
+        """
+        Construye el panel.
+
+        Args:
+            surface (pygame.Surface): Ventana donde se dibuja.
+            achievements (Achievements): Gestor de logros del juego.
+            player (Player): Jugador actual.
+        """
+        super().__init__(surface)
+        self.achievements = achievements
+        self.player = player
+        self.backdrop = None
+        self._last_mouse = None
+
+    def enter(self):
+        """Actualiza los logros y guarda la pantalla anterior al abrir el panel."""
+        super().enter()
+        self.achievements.update_achievements(self.player.stats())
+        self.backdrop = self.surface.copy()
+
+    def leave(self):
+        """Libera la copia de la pantalla anterior."""
+        self.backdrop = None
+
+    def draw(self, mouse_pos):
+        """
+        Redibuja el panel cuando hace falta o cuando el ratón se mueve (tooltip).
+
+        Args:
+            mouse_pos (tuple[int, int]): Posición del ratón.
+        """
+        if mouse_pos != self._last_mouse:
+            self._last_mouse = mouse_pos
+            self.needs_redraw = True
+        if self.needs_redraw and self.backdrop is not None:
+            self.surface.blit(self.backdrop, (0, 0))
+        super().draw(mouse_pos)
+
+    def draw_content(self, mouse_pos):
+        """Dibuja la lista de logros y el tooltip del logro bajo el ratón."""
+        screen = self.surface
+        panel_rect = self.panel_rect
+        tooltip = None
         y = panel_rect.y + 60
-        for ach in achievements.achievements:
-            rect = pygame.Rect(panel_rect.x + 20, y, panel_width - 40, 50)
+        for ach in self.achievements.achievements:
+            rect = pygame.Rect(panel_rect.x + 20, y, panel_rect.width - 40, 50)
             color = (100, 220, 100) if ach["completed"] else (220, 100, 100)
             pygame.draw.rect(screen, color, rect, border_radius=6)
             pygame.draw.rect(screen, (0, 0, 0), rect, 2, border_radius=6)
-
-            # --- TOOLTIP ---
             if rect.collidepoint(mouse_pos):
-                info_surf = font.render(ach["desc"], True, (0, 0, 0))
-                info_bg = pygame.Surface(
-                    (info_surf.get_width() + 20, info_surf.get_height() + 10)
-                )
-                info_bg.fill((255, 255, 200))
-                screen.blit(info_bg, (mouse_pos[0] + 10, mouse_pos[1] - 30))
-                screen.blit(info_surf, (mouse_pos[0] + 20, mouse_pos[1] - 25))
+                tooltip = ach["desc"]
 
             # --- ESTADO DEL LOGRO ---
             status = "COMPLETADO" if ach["completed"] else "NO COMPLETADO"
-            text_surf = font.render(f"{ach['name']} - {status}", True, (0, 0, 0))
+            text_surf = render_text(self.font, f"{ach['name']} - {status}", (0, 0, 0))
             screen.blit(text_surf, (rect.x + 10, rect.y + 12))
 
             y += 60
 
-        # --- ACTUALIZACIÓN DE PANTALLA ---
-        pygame.display.flip()
+        # --- TOOLTIP (encima de la lista) ---
+        if tooltip is not None:
+            info_surf = render_text(self.font, tooltip, (0, 0, 0))
+            info_rect = pygame.Rect(
+                mouse_pos[0] + 10,
+                mouse_pos[1] - 30,
+                info_surf.get_width() + 20,
+                info_surf.get_height() + 10,
+            )
+            screen.fill((255, 255, 200), info_rect)
+            screen.blit(info_surf, (mouse_pos[0] + 20, mouse_pos[1] - 25))
@@ -6,20 +6,18 @@ Permite al jugador confirmar o cancelar la salida del juego.
 """
 
 import pygame
-import sys
+from menu.panel import Panel
+from text_cache import render_text
 
 
-# --- FUNCIÓN PRINCIPAL ---
-def show_exit_panel(screen):
+# --- CLASE PRINCIPAL: EXITPANEL ---
+class ExitPanel(Panel):
     """
-    Muestra un panel centrado con las opciones "Yes" y "No" para confirmar salida.
-
-    Args:
-        screen (pygame.Surface): Superficie principal donde se dibuja el panel.
+    Panel centrado con las opciones "Yes" y "No" para confirmar salida.
 
     Descripción:
         Este panel bloquea la interacción del juego y solicita confirmación antes de salir.
-        Al hacer clic en "Yes" se cierra completamente el juego.
+        Al hacer clic en "Yes" se termina el bucle principal (el juego guarda y se cierra).
         Al hacer clic en "No" se cierra solo el panel y se regresa al juego.
 
     Controles:
@@ -28,76 +26,54 @@ def show_exit_panel(screen):
         - Cerrar ventana: Cierra el juego directamente.
     """
 
-    # --- CONFIGURACIÓN INICIAL ---
-    clock = pygame.time.Clock()
-    font = pygame.font.SysFont(None, 28)
-    big_font = pygame.font.SysFont(None, 36)
-
-    # --- PANEL PRINCIPAL ---
-    panel_width, panel_height = 400, 200
-    panel_x = (screen.get_width() - panel_width) // 2
-    panel_y = (screen.get_height() - panel_height) // 2
-    panel_rect = pygame.Rect(panel_x, panel_y, panel_width, panel_height)
-
-    # --- BOTONES ---
-    yes_rect = pygame.Rect(panel_rect.x + 60, panel_rect.bottom - 60, 100, 40)
-    no_rect = pygame.Rect(panel_rect.right - 160, panel_rect.bottom - 60, 100, 40)
-
-    # --- BUCLE PRINCIPAL DEL PANEL ---
-    running = True
-    while running:
-        clock.tick(60)
-
-        # --- EVENTOS ---
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                if yes_rect.collidepoint(event.pos):
-                    pygame.quit()
-                    sys.exit()
-                elif no_rect.collidepoint(event.pos):
-                    running = False
-
-        # --- FONDO SEMITRANSPARENTE ---
-        overlay = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 0))
-        screen.blit(overlay, (0, 0))
-
-        # --- DIBUJO DEL PANEL ---
-        pygame.draw.rect(screen, (255, 240, 180), panel_rect, border_radius=12)
-        pygame.draw.rect(screen, (50, 50, 50), panel_rect, 3, border_radius=12)
-
-        # --- TÍTULO ---
-        title = big_font.render("Exit game?", True, (0, 0, 0))
-        screen.blit(
-            title, (panel_rect.centerx - title.get_width() // 2, panel_rect.y + 40)
-        )
-
-        # --- BOTÓN "YES" ---
-        pygame.draw.rect(screen, (100, 200, 100), yes_rect, border_radius=8)
-        pygame.draw.rect(screen, (0, 0, 0), yes_rect, 2, border_radius=8)
-        txt_yes = font.render("Yes", True, (0, 0, 0))
-        screen.blit(
-            txt_yes,
-            (
-                yes_rect.centerx - txt_yes.get_width() // 2,
-                yes_rect.centery - txt_yes.get_height() // 2,
-            ),
-        )
-
-        # --- BOTÓN "NO" ---
-        pygame.draw.rect(screen, (200, 100, 100), no_rect, border_radius=8)
-        pygame.draw.rect(screen, (0, 0, 0), no_rect, 2, border_radius=8)
-        txt_no = font.render("No", True, (0, 0, 0))
-        screen.blit(
-            txt_no,
-            (
-                no_rect.centerx - txt_no.get_width() // 2,
-                no_rect.centery - txt_no.get_height() // 2,
-            ),
-        )
-
-        # --- ACTUALIZACIÓN DE PANTALLA ---
-        pygame.display.flip()
+    title = "Exit game?"
+    title_y = 40
+    closable = False
+
+    def __init__(self, surface):
+        """
+        Construye el panel y sus botones.
+
+        Args:
+            surface (pygame.Surface): Ventana donde se dibuja.
+        """
+        super().__init__(surface)
+        panel_rect = self.panel_rect
+        self.yes_rect = pygame.Rect(panel_rect.x + 60, panel_rect.bottom - 60, 100, 40)
+        self.no_rect = pygame.Rect(panel_rect.right - 160, panel_rect.bottom - 60, 100, 40)
+
+    def panel_size(self):
+        """Devuelve el tamaño fijo del panel de confirmación."""
+        return 400, 200
+
+    def handle_event(self, event, mouse_pos):
+        """
+        Sale del juego con "Yes" o cierra el panel con "No".
+
+        Args:
+            event (pygame.event.Event): Evento recibido.
+            mouse_pos (tuple[int, int]): Posición del ratón.
+        """
+        super().handle_event(event, mouse_pos)
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            if self.yes_rect.collidepoint(event.pos):
+                self.manager.quit()
+            elif self.no_rect.collidepoint(event.pos):
+                self.close()
+
+    def draw_content(self, mouse_pos):
+        """Dibuja los botones "Yes" y "No"."""
+        for rect, label, color in (
+            (self.yes_rect, "Yes", (100, 200, 100)),
+            (self.no_rect, "No", (200, 100, 100)),
+        ):
+            pygame.draw.rect(self.surface, color, rect, border_radius=8)
+            pygame.draw.rect(self.surface, (0, 0, 0), rect, 2, border_radius=8)
+            txt = render_text(self.font, label, (0, 0, 0))
+            self.surface.blit(
+                txt,
+                (
+                    rect.centerx - txt.get_width() // 2,
+                    rect.centery - txt.get_height() // 2,
+                ),
+            )
@@ -4,157 +4,267 @@ menu/main_menu.py
 Menú principal de Click & Hide.
 Muestra opciones como JUGAR, OPCIONES, ABOUT US, LOGROS y SALIR,
 y permite navegar entre submenús o iniciar/continuar la partida.
+
+El menú y sus paneles se construyen una sola vez y se muestran con la pila
+de pantallas (`screens.ScreenManager`): abrir un panel lo apila encima del
+menú y cerrarlo vuelve al menú sin reconstruir nada. Cada panel se importa y
+se construye la primera vez que se abre, para no retrasar el arranque.
 """
 
 import pygame
-import os
-from entities.achievements import Achievements
-from menu.achievements_menu import show_achievements_panel
-from menu.aboutus_menu import show_about_us_panel
-from menu.options_menu import show_options_panel
-from menu.exit_menu import show_exit_panel
-
+from assets import load_image, load_font
+from config import FONT_PATH
+from screens import Screen
+from text_cache import render_text
+from core.bignum import format_short
+from render import DirtyRenderer
 
-# --- FUNCIÓN PRINCIPAL ---
-def show_main_menu(screen, font, big_font, game_started, player, achievements_manager):
-    """
-    Muestra el menú principal y gestiona la interacción del usuario.
+# Botones del menú según haya o no una partida empezada
+NEW_GAME_BUTTONS = ["JUGAR", "OPCIONES", "ABOUT US", "LOGROS", "SALIR"]
+STARTED_GAME_BUTTONS = ["CONTINUAR", "OPCIONES", "LOGROS", "SALIR"]
 
-    Args:
-        screen (pygame.Surface): Superficie principal donde se dibuja el menú.
-        font (pygame.font.Font): Fuente base para los botones.
-        big_font (pygame.font.Font): Fuente grande para el título.
-        game_started (bool): Indica si la partida ya ha comenzado.
-        player (Player): Instancia actual del jugador.
-        achievements_manager (Achievements): Gestor de logros global.
 
-    Returns:
-        str | None: Opción seleccionada por el jugador (por ejemplo "JUGAR", "CONTINUAR" o "SALIR").
+# --- CLASE PRINCIPAL: MAINMENU ---
+class MainMenu(Screen):
+    """
+    Menú principal del juego.
 
     Descripción:
         Este menú es la puerta de entrada principal del juego. Muestra las opciones disponibles
         dependiendo de si el jugador ya tiene una partida activa o no, y permite navegar hacia
         paneles secundarios como "Logros", "Opciones", "About Us" o el panel de salida.
+
+    Atributos:
+        surface (pygame.Surface): Ventana donde se dibuja el menú.
+        font (pygame.font.Font): Fuente base para los botones.
+        game_started (bool): Indica si la partida ya ha comenzado (cambia los botones).
+        offline_summary (dict | None): Resumen del progreso sin conexión; se
+            muestra hasta que se sale del menú por primera vez.
+        on_play (callable): Función `on_play(choice)` que se llama con "JUGAR" o "CONTINUAR".
+        panels (dict[str, Panel]): Paneles ya abiertos alguna vez, por opción.
     """
 
-    # --- CONFIGURACIÓN INICIAL ---
-    clock = pygame.time.Clock()
-    running = True
-    choice = None
-    WIDTH, HEIGHT = screen.get_size()
-
-    # --- PANEL IZQUIERDO ---
-    panel_width = WIDTH // 3
-    panel_color = (210, 180, 140, 180)
-    panel_surf = pygame.Surface((panel_width, HEIGHT), pygame.SRCALPHA)
-    panel_surf.fill(panel_color)
-
-    # --- BOTONES DEL MENÚ ---
-    if not game_started:
-        button_texts = ["JUGAR", "OPCIONES", "ABOUT US", "LOGROS", "SALIR"]
-    else:
-        button_texts = ["CONTINUAR", "OPCIONES", "LOGROS", "SALIR"]
-
-    button_height = 80
-    button_margin = 20
-    buttons = []
-    start_y = 150
-    for i, text in enumerate(button_texts):
-        rect = pygame.Rect(
-            20,
-            start_y + i * (button_height + button_margin),
-            panel_width - 40,
-            button_height,
-        )
-        buttons.append((rect, text))
-
-    # --- FONDO DEL MENÚ ---
-    bg_image = None
-    try:
-        base_path = os.path.dirname(os.path.dirname(__file__))
-        bg_path = os.path.join(base_path, "assets", "images", "clase.png")
-        bg_image = pygame.image.load(bg_path).convert()
-        bg_image = pygame.transform.smoothscale(bg_image, (WIDTH, HEIGHT))
-    except Exception as e:
-        print(f"[MENU] No se pudo cargar fondo: {e}")
-
-    # --- TÍTULO DEL MENÚ ---
-    title_text = "CLICK & HIDE"
-    title_color = (255, 255, 255)
-    base_font_path = os.path.join(
-        os.path.dirname(__file__), "..", "assets", "fonts", "PressStart2P.ttf"
-    )
-    title_font = pygame.font.Font(base_font_path, 35)
-    title_surf = title_font.render(title_text, True, title_color)
-    title_rect = title_surf.get_rect(center=(panel_width // 2, 80))
-
-    # --- BUCLE PRINCIPAL ---
-    while running:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                choice = "SALIR"
-                running = False
-            elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                mx, my = pygame.mouse.get_pos()
-                for rect, text in buttons:
-                    if rect.collidepoint(mx, my):
-                        choice = text
-                        running = False
-
-        # --- DIBUJO DEL FONDO ---
-        if bg_image:
-            screen.blit(bg_image, (0, 0))
+    def __init__(
+        self,
+        surface,
+        font,
+        player,
+        achievements_manager,
+        on_play,
+        game_started=False,
+        offline_summary=None,
+    ):
+        """
+        Construye el menú y sus paneles.
+
+        Args:
+            surface (pygame.Surface): Superficie principal donde se dibuja el menú.
+            font (pygame.font.Font): Fuente base para los botones.
+            player (Player): Instancia actual del jugador.
+            achievements_manager (Achievements): Gestor de logros global.
+            on_play (callable): Se llama con la opción elegida al pulsar JUGAR o CONTINUAR.
+            game_started (bool): Indica si la partida ya ha comenzado.
+            offline_summary (dict, opcional): Resumen del progreso sin conexión
+                devuelto por `save.load_game`; si se pasa, se muestra en un recuadro.
+        """
+        self.surface = surface
+        self.font = font
+        self.player = player
+        self.achievements_manager = achievements_manager
+        self.on_play = on_play
+        self.game_started = game_started
+        self.offline_summary = offline_summary
+        width, height = surface.get_size()
+
+        # --- PANEL IZQUIERDO ---
+        self.panel_width = width // 3
+        self.panel_surf = pygame.Surface((self.panel_width, height), pygame.SRCALPHA)
+        self.panel_surf.fill((210, 180, 140, 180))
+
+        # --- FONDO DEL MENÚ ---
+        self.bg_image = None
+        try:
+            self.bg_image = load_image("clase.png", (width, height))
+        except Exception as e:
+            print(f"[MENU] No se pudo cargar fondo: {e}")
+
+        # --- TÍTULO DEL MENÚ ---
+        title_font = load_font(FONT_PATH, 35)
+        self.title_surf = render_text(title_font, "CLICK & HIDE", (255, 255, 255))
+        self.title_rect = self.title_surf.get_rect(center=(self.panel_width // 2, 80))
+
+        # --- PANELES SECUNDARIOS (se crean al abrirlos) ---
+        self.panels = {}
+
+        self.background = self._compose_background()
+        self._layouts = {}  # game_started -> (botones, renderizador)
+
+    # --- CONSTRUCCIÓN ---
+    def _compose_background(self):
+        """Compone una sola vez el fondo estático (imagen + panel + título + resumen)."""
+        background = pygame.Surface(self.surface.get_size())
+        if self.bg_image:
+            background.blit(self.bg_image, (0, 0))
         else:
-            screen.fill((50, 50, 50))
+            background.fill((50, 50, 50))
+        background.blit(self.panel_surf, (0, 0))
+        background.blit(self.title_surf, self.title_rect)
+        if self.offline_summary:
+            _draw_offline_summary(background, self.font, self.offline_summary)
+        return background
 
-        # --- DIBUJO DEL PANEL IZQUIERDO ---
-        screen.blit(panel_surf, (0, 0))
+    def _layout(self):
+        """Devuelve los botones y el renderizador del estado actual, creándolos la primera vez."""
+        layout = self._layouts.get(self.game_started)
+        if layout is not None:
+            return layout
 
-        # --- DIBUJO DE LOS BOTONES ---
-        mouse_pos = pygame.mouse.get_pos()
-        for rect, text in buttons:
-            color = (180, 140, 80) if rect.collidepoint(mouse_pos) else (160, 120, 60)
-            pygame.draw.rect(screen, color, rect, border_radius=8)
-            pygame.draw.rect(screen, (0, 0, 0), rect, 2, border_radius=8)
-            text_surf = font.render(text, True, (255, 255, 255))
-            text_rect = text_surf.get_rect(center=rect.center)
-            screen.blit(text_surf, text_rect)
-
-        # --- DIBUJO DEL TÍTULO ---
-        screen.blit(title_surf, title_rect)
-
-        # --- ACTUALIZACIÓN DE PANTALLA ---
-        pygame.display.flip()
-        clock.tick(60)
-
-    # --- ACCIONES SEGÚN BOTÓN ---
-    if choice == "LOGROS":
-        game_state = {
-            "money": player.money,
-            "total_clicks": player.total_clicks,
-            "upgrades_bought": getattr(player, "upgrades_bought", 0),
-        }
-        show_achievements_panel(screen, achievements_manager, game_state)
-        return show_main_menu(
-            screen, font, big_font, game_started, player, achievements_manager
-        )
+        button_texts = STARTED_GAME_BUTTONS if self.game_started else NEW_GAME_BUTTONS
+        button_height = 80
+        button_margin = 20
+        start_y = 150
+        buttons = []
+        for i, text in enumerate(button_texts):
+            rect = pygame.Rect(
+                20,
+                start_y + i * (button_height + button_margin),
+                self.panel_width - 40,
+                button_height,
+            )
+            buttons.append((rect, text))
 
-    elif choice == "OPCIONES":
-        show_options_panel(screen)
-        return show_main_menu(
-            screen, font, big_font, game_started, player, achievements_manager
+        # --- BOTONES COMO ELEMENTOS DEL RENDERIZADO PARCIAL ---
+        renderer = DirtyRenderer(
+            self.surface, lambda surface: surface.blit(self.background, (0, 0))
         )
+        for rect, text in buttons:
+            renderer.add(
+                text,
+                lambda surface, mouse_pos, rect=rect, text=text: _draw_button(
+                    surface, self.font, rect, text, mouse_pos
+                ),
+                lambda rect=rect: rect,
+                lambda mouse_pos, rect=rect: rect.collidepoint(mouse_pos),
+            )
+        layout = self._layouts[self.game_started] = (buttons, renderer)
+        return layout
 
-    elif choice == "ABOUT US":
-        show_about_us_panel(screen)
-        return show_main_menu(
-            screen, font, big_font, game_started, player, achievements_manager
-        )
+    def _panel(self, choice):
+        """
+        Devuelve el panel de una opción, importándolo y creándolo la primera vez.
 
-    elif choice == "SALIR":
-        show_exit_panel(screen)
-        return show_main_menu(
-            screen, font, big_font, game_started, player, achievements_manager
-        )
+        Args:
+            choice (str): Texto del botón pulsado.
+
+        Returns:
+            Panel | None: Panel de la opción, o None si la opción no abre un panel.
+        """
+        panel = self.panels.get(choice)
+        if panel is not None:
+            return panel
+
+        if choice == "LOGROS":
+            from menu.achievements_menu import AchievementsPanel
+
+            panel = AchievementsPanel(self.surface, self.achievements_manager, self.player)
+        elif choice == "OPCIONES":
+            from menu.options_menu import OptionsPanel
+
+            panel = OptionsPanel(self.surface)
+        elif choice == "ABOUT US":
+            from menu.aboutus_menu import AboutUsPanel
+
+            panel = AboutUsPanel(self.surface)
+        elif choice == "SALIR":
+            from menu.exit_menu import ExitPanel
+
+            panel = ExitPanel(self.surface)
+        else:
+            return None
+        self.panels[choice] = panel
+        return panel
+
+    # --- PILA DE PANTALLAS ---
+    def enter(self):
+        """Redibuja el menú completo al mostrarlo o al volver de un panel."""
+        self._layout()[1].invalidate()
+
+    def leave(self):
+        """Retira el resumen sin conexión la primera vez que se sale del menú."""
+        if self.offline_summary:
+            self.offline_summary = None
+            self.background = self._compose_background()
+
+    def handle_event(self, event, mouse_pos):
+        """
+        Procesa los clics en los botones del menú.
+
+        Args:
+            event (pygame.event.Event): Evento recibido.
+            mouse_pos (tuple[int, int]): Posición del ratón.
+        """
+        if event.type == pygame.VIDEOEXPOSE:
+            self._layout()[1].invalidate()
+        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            for rect, text in self._layout()[0]:
+                if rect.collidepoint(event.pos):
+                    self.select(text)
+                    break
+
+    def select(self, choice):
+        """
+        Ejecuta la opción elegida: abre su panel o empieza/continúa la partida.
+
+        Args:
+            choice (str): Texto del botón pulsado.
+        """
+        panel = self._panel(choice)
+        if panel is not None:
+            self.manager.push(panel)
+        else:
+            self.on_play(choice)
+
+    def draw(self, mouse_pos):
+        """
+        Dibuja solo los botones cuyo estado cambia.
+
+        Args:
+            mouse_pos (tuple[int, int]): Posición del ratón.
+        """
+        self._layout()[1].render(mouse_pos)
+
+
+# --- DIBUJO DE UN BOTÓN ---
+def _draw_button(screen, font, rect, text, mouse_pos):
+    """Dibuja un botón del menú, resaltado si el cursor está encima."""
+    color = (180, 140, 80) if rect.collidepoint(mouse_pos) else (160, 120, 60)
+    pygame.draw.rect(screen, color, rect, border_radius=8)
+    pygame.draw.rect(screen, (0, 0, 0), rect, 2, border_radius=8)
+    text_surf = render_text(font, text, (255, 255, 255))
+    text_rect = text_surf.get_rect(center=rect.center)
+    screen.blit(text_surf, text_rect)
+
+
+# --- RESUMEN DEL PROGRESO SIN CONEXIÓN ---
+def _draw_offline_summary(surface, font, summary):
+    """Dibuja en la esquina inferior derecha el dinero ganado mientras no se jugaba."""
+    hours, rest = divmod(summary["seconds"], 3600)
+    lines = [
+        "BIENVENIDO DE NUEVO",
+        f"Fuera: {hours}h {rest // 60:02d}m",
+        f"Ganaste: +${format_short(summary['earned'])}",
+    ]
+    surfaces = [render_text(font, line, (255, 255, 255)) for line in lines]
+    width = max(s.get_width() for s in surfaces) + 40
+    height = sum(s.get_height() + 12 for s in surfaces) + 28
+
+    box = pygame.Surface((width, height), pygame.SRCALPHA)
+    box.fill((60, 40, 20, 200))
+    rect = box.get_rect(bottomright=(surface.get_width() - 30, surface.get_height() - 30))
+    surface.blit(box, rect)
+    pygame.draw.rect(surface, (255, 215, 120), rect, 2, border_radius=8)
 
-    return choice
+    y = rect.y + 20
+    for text_surf in surfaces:
+        surface.blit(text_surf, (rect.x + 20, y))
+        y += text_surf.get_height() + 12
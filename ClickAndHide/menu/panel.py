@@ -0,0 +1,152 @@
+"""
+menu/panel.py
+
+Base de los paneles emergentes de Click & Hide (logros, opciones, about us, salir).
+
+Un panel es una pantalla (`screens.Screen`) que se dibuja centrada encima de
+la pantalla anterior, con un título y un botón de cierre (X). Se construye
+una sola vez; cada vez que se abre solo se vuelve a dibujar.
+"""
+
+import pygame
+from assets import load_font
+from screens import Screen
+from text_cache import render_text
+
+
+# --- CLASE BASE: PANEL ---
+class Panel(Screen):
+    """
+    Panel centrado con título y botón de cierre.
+
+    Las subclases definen el título y los atributos de clase que cambien, y
+    dibujan su contenido en `draw_content`.
+
+    Atributos:
+        surface (pygame.Surface): Ventana donde se dibuja.
+        font (pygame.font.Font): Fuente de los textos.
+        big_font (pygame.font.Font): Fuente del título.
+        panel_rect (pygame.Rect): Área del panel.
+        close_rect (pygame.Rect | None): Botón de cierre (None si el panel no se cierra con X).
+        needs_redraw (bool): True si hay que volver a dibujar el panel.
+
+    Métodos:
+        panel_size(): Tamaño del panel.
+        close(): Cierra el panel y vuelve a la pantalla anterior.
+        draw_frame(): Dibuja el fondo, el título y el botón de cierre.
+        draw_content(mouse_pos): Dibuja el contenido propio del panel.
+    """
+
+    title = ""
+    color = (255, 240, 180)  # Color de fondo del panel
+    font_size = 28
+    title_size = 36
+    title_y = 15  # Distancia del título al borde superior
+    closable = True  # Si se cierra con la X y con ESC
+
+    def __init__(self, surface):
+        """
+        Construye el panel centrado en la ventana.
+
+        Args:
+            surface (pygame.Surface): Ventana donde se dibuja.
+        """
+        self.surface = surface
+        self.font = load_font(None, self.font_size)
+        self.big_font = load_font(None, self.title_size)
+
+        panel_width, panel_height = self.panel_size()
+        panel_x = (surface.get_width() - panel_width) // 2
+        panel_y = (surface.get_height() - panel_height) // 2
+        self.panel_rect = pygame.Rect(panel_x, panel_y, panel_width, panel_height)
+        self.close_rect = None
+        if self.closable:
+            self.close_rect = pygame.Rect(
+                self.panel_rect.right - 40, self.panel_rect.top + 10, 30, 30
+            )
+        self.needs_redraw = True
+
+    def panel_size(self):
+        """
+        Devuelve el tamaño del panel (por defecto, el 70% de la ventana).
+
+        Returns:
+            tuple[float, float]: Ancho y alto.
+        """
+        return self.surface.get_width() * 0.7, self.surface.get_height() * 0.7
+
+    def close(self):
+        """Cierra el panel y vuelve a la pantalla anterior."""
+        self.manager.pop()
+
+    # --- EVENTOS ---
+    def enter(self):
+        """Dibuja el panel al abrirlo."""
+        self.needs_redraw = True
+
+    def handle_event(self, event, mouse_pos):
+        """
+        Cierra el panel con ESC o clic en la X y lo redibuja si la ventana se vuelve a mostrar.
+
+        Args:
+            event (pygame.event.Event): Evento recibido.
+            mouse_pos (tuple[int, int]): Posición del ratón.
+        """
+        if event.type == pygame.VIDEOEXPOSE:
+            self.needs_redraw = True  # La ventana se ha vuelto a mostrar
+        elif not self.closable:
+            return
+        elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            self.close()
+        elif event.type == pygame.MOUSEBUTTONDOWN and self.close_rect.collidepoint(event.pos):
+            self.close()
+
+    # --- DIBUJO ---
+    def draw(self, mouse_pos):
+        """
+        Dibuja el panel solo cuando hace falta (su contenido es estático).
+
+        Args:
+            mouse_pos (tuple[int, int]): Posición del ratón.
+        """
+        if not self.needs_redraw:
+            return
+        self.needs_redraw = False
+        self.draw_frame()
+        self.draw_content(mouse_pos)
+        pygame.display.flip()
+
+    def draw_frame(self):
+        """Dibuja el fondo del panel, el título y el botón de cierre."""
+        screen = self.surface
+        panel_rect = self.panel_rect
+        pygame.draw.rect(screen, self.color, panel_rect, border_radius=12)
+        pygame.draw.rect(screen, (50, 50, 50), panel_rect, 3, border_radius=12)
+
+        # --- TÍTULO ---
+        title = render_text(self.big_font, self.title, (0, 0, 0))
+        screen.blit(
+            title, (panel_rect.centerx - title.get_width() // 2, panel_rect.y + self.title_y)
+        )
+
+        # --- BOTÓN DE CIERRE (X) ---
+        if self.close_rect is not None:
+            close_rect = self.close_rect
+            pygame.draw.rect(screen, (220, 80, 80), close_rect, border_radius=6)
+            pygame.draw.rect(screen, (0, 0, 0), close_rect, 2, border_radius=6)
+            x_txt = render_text(self.font, "X", (255, 255, 255))
+            screen.blit(
+                x_txt,
+                (
+                    close_rect.centerx - x_txt.get_width() // 2,
+                    close_rect.centery - x_txt.get_height() // 2,
+                ),
+            )
+
+    def draw_content(self, mouse_pos):
+        """
+        Dibuja el contenido propio del panel (las subclases lo sobrescriben).
+
+        Args:
+            mouse_pos (tuple[int, int]): Posición del ratón.
+        """
@@ -0,0 +1,318 @@
+"""
+profiler.py — Perfilador de fotogramas de Click & Hide (F3).
+
+Mide en qué se va el tiempo de cada fotograma. El bucle principal
+(`screens.ScreenManager`) y las pantallas marcan el final de cada fase con
+`profiler.mark(nombre)`; el tiempo transcurrido desde la marca anterior se
+atribuye a esa fase. Por ejemplo, en la partida:
+  - "espera": tiempo que `clock.tick` duerme para no pasar de FPS,
+  - "eventos": reparto de los eventos (clics, compras...),
+  - "reloj", "ingresos", "guardado", "logros": lógica de la partida,
+  - "fondo", "header", "shop"...: dibujo de cada elemento de `DirtyRenderer`,
+  - "pantalla": envío de las zonas cambiadas a la ventana.
+
+De cada fase se guardan los milisegundos y los bloques de memoria reservados
+(variación de `sys.getallocatedblocks()`, es decir, reservas netas; los
+números que crea el propio perfilador pueden sumar o restar un bloque) en un
+historial de PROFILER_WINDOW fotogramas, junto con la duración total de cada
+fotograma (percentiles p50/p95/p99) y los fotogramas perdidos respecto a FPS.
+El panel muestra además el uso de la caché de textos (`text_cache`).
+
+Mientras está desactivado, `mark` y `begin_frame` no hacen nada, así que las
+marcas pueden quedarse en el código sin coste apreciable.
+"""
+
+import math
+import sys
+import time
+from collections import deque
+
+import pygame
+
+from assets import load_font
+from config import FPS, PROFILER_WINDOW, PROFILER_REFRESH, PROFILER_DROP_FACTOR
+from text_cache import text_cache
+
+OVERLAY_POS = (10, 70)  # Esquina superior izquierda del panel (bajo la cabecera)
+OVERLAY_COLOR = (0, 0, 0)  # Fondo del panel (opaco: se vuelve a pegar cada fotograma)
+OVERLAY_TEXT = (120, 255, 120)  # Color del texto
+OVERLAY_FONT_SIZE = 18
+
+
+# --- CLASE PRINCIPAL: FRAMEPROFILER ---
+class FrameProfiler:
+    """
+    Historial de tiempos y reservas de memoria por fase de cada fotograma.
+
+    Atributos:
+        enabled (bool): Si se están midiendo los fotogramas.
+        visible (bool): Si se dibuja el panel (F3).
+        fps (int): Fotogramas por segundo objetivo.
+        budget_ms (float): Milisegundos por fotograma a FPS.
+        frames (deque): Historial de (duración en ms, {fase: [ms, bloques]}, perdido).
+        total_frames (int): Fotogramas medidos desde que se activó.
+        total_dropped (int): Fotogramas perdidos desde que se activó.
+
+    Métodos:
+        enable() / disable(): Empieza o deja de medir.
+        toggle(): Muestra u oculta el panel (y activa la medición con él).
+        set_target_fps(fps): Cambia los fotogramas por segundo esperados.
+        begin_frame(): Cierra el fotograma anterior y empieza uno nuevo.
+        mark(name): Atribuye el tiempo desde la última marca a la fase `name`.
+        summary(): Estadísticas del historial.
+        draw(surface): Dibuja el panel y actualiza su zona de la ventana.
+    """
+
+    def __init__(self, fps=FPS, window=PROFILER_WINDOW):
+        """
+        Inicializa el perfilador desactivado y con el historial vacío.
+
+        Args:
+            fps (int): Fotogramas por segundo objetivo.
+            window (int): Fotogramas que se guardan en el historial.
+        """
+        self.enabled = False
+        self.visible = False
+        self.fps = fps
+        self.budget_ms = 1000.0 / fps
+        self.frames = deque(maxlen=window)
+        self.total_frames = 0
+        self.total_dropped = 0
+        self._frame_start = None
+        self._last = 0.0
+        self._blocks = 0
+        self._phases = {}
+        self._lines = []
+        self._panel = None
+
+    # --- ACTIVACIÓN ---
+    def enable(self):
+        """Empieza a medir (el primer fotograma empieza en el siguiente `begin_frame`)."""
+        self.enabled = True
+        self._frame_start = None
+
+    def disable(self):
+        """Deja de medir; el historial se conserva."""
+        self.enabled = False
+        self._frame_start = None
+
+    def reset(self, window=None):
+        """
+        Vacía el historial y los contadores.
+
+        Args:
+            window (int, opcional): Nuevo tamaño del historial, en fotogramas.
+        """
+        if window is not None:
+            self.frames = deque(maxlen=window)
+        self.frames.clear()
+        self.total_frames = 0
+        self.total_dropped = 0
+        self._frame_start = None
+        self._lines = []
+
+    def toggle(self):
+        """
+        Muestra u oculta el panel; la medición se activa y desactiva con él.
+
+        Returns:
+            bool: True si el panel queda visible.
+        """
+        self.visible = not self.visible
+        if self.visible:
+            self.reset()
+            self.enable()
+        else:
+            self.disable()
+            self._panel = None
+        return self.visible
+
+    def set_target_fps(self, fps):
+        """
+        Cambia los fotogramas por segundo esperados (el bucle los baja sin actividad).
+
+        Args:
+            fps (int): Fotogramas por segundo del fotograma actual.
+        """
+        self.fps = fps
+        self.budget_ms = 1000.0 / fps
+
+    # --- MEDICIÓN ---
+    def begin_frame(self):
+        """Cierra el fotograma anterior (si lo hay) y empieza a medir uno nuevo."""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        if self._frame_start is not None:
+            frame_ms = (now - self._frame_start) * 1000
+            dropped = frame_ms > self.budget_ms * PROFILER_DROP_FACTOR
+            self.frames.append((frame_ms, self._phases, dropped))
+            self.total_frames += 1
+            self.total_dropped += dropped
+            if self.total_frames % PROFILER_REFRESH == 0:
+                self._lines = []  # El panel se recalcula con el nuevo historial
+        self._phases = {}
+        self._frame_start = now
+        self._last = now
+        self._blocks = sys.getallocatedblocks()
+
+    def mark(self, name):
+        """
+        Atribuye a la fase `name` el tiempo y las reservas desde la última marca.
+
+        Args:
+            name (str): Nombre de la fase que acaba de terminar.
+        """
+        if not self.enabled or self._frame_start is None:
+            return
+        # Lo que reserva el propio perfilador queda entre las dos lecturas de
+        # bloques y no se atribuye a ninguna fase
+        blocks = sys.getallocatedblocks()
+        now = time.perf_counter()
+        phase = self._phases.get(name)
+        if phase is None:
+            phase = self._phases[name] = [0.0, 0]
+        phase[0] += (now - self._last) * 1000
+        phase[1] += blocks - self._blocks
+        self._last = now
+        self._blocks = sys.getallocatedblocks()
+
+    # --- ESTADÍSTICAS ---
+    def summary(self):
+        """
+        Calcula las estadísticas del historial.
+
+        Returns:
+            dict: Estadísticas con:
+                - "frames": fotogramas en el historial.
+                - "fps": fotogramas por segundo medios.
+                - "frame_ms": {"mean", "p50", "p95", "p99", "max"} de la duración
+                  de los fotogramas.
+                - "dropped": fotogramas perdidos en el historial (y "total_dropped"
+                  desde el inicio).
+                - "phases": {fase: {"ms": media por fotograma, "max": máximo,
+                  "blocks": reservas medias}}, ordenadas de más a menos costosa.
+        """
+        count = len(self.frames)
+        if not count:
+            return {
+                "frames": 0,
+                "fps": 0.0,
+                "frame_ms": {},
+                "dropped": 0,
+                "total_dropped": 0,
+                "phases": {},
+            }
+
+        durations = sorted(frame_ms for frame_ms, _, _ in self.frames)
+        total_ms = sum(durations)
+
+        totals = {}
+        for _, phases, _ in self.frames:
+            for name, (ms, blocks) in phases.items():
+                stats = totals.get(name)
+                if stats is None:
+                    stats = totals[name] = [0.0, 0.0, 0]
+                stats[0] += ms
+                stats[1] = max(stats[1], ms)
+                stats[2] += blocks
+
+        phases = {
+            name: {"ms": ms / count, "max": peak, "blocks": blocks / count}
+            for name, (ms, peak, blocks) in sorted(totals.items(), key=lambda kv: -kv[1][0])
+        }
+        return {
+            "frames": count,
+            "fps": 1000.0 * count / total_ms if total_ms else 0.0,
+            "frame_ms": {
+                "mean": total_ms / count,
+                "p50": percentile(durations, 50),
+                "p95": percentile(durations, 95),
+                "p99": percentile(durations, 99),
+                "max": durations[-1],
+            },
+            "dropped": sum(dropped for _, _, dropped in self.frames),
+            "total_dropped": self.total_dropped,
+            "phases": phases,
+        }
+
+    # --- PANEL (F3) ---
+    def _build_lines(self):
+        """Prepara las líneas de texto del panel a partir del historial."""
+        stats = self.summary()
+        if not stats["frames"]:
+            return ["PERFIL (F3): midiendo..."]
+        frame = stats["frame_ms"]
+        lines = [
+            f"PERFIL (F3)  {stats['fps']:.0f} fps  objetivo {self.fps}",
+            f"fotograma p50 {frame['p50']:.1f}  p95 {frame['p95']:.1f}  p99 {frame['p99']:.1f} ms",
+            f"perdidos {stats['dropped']}/{stats['frames']}  (total {stats['total_dropped']})",
+            "fase              ms/fot   máx   bloques",
+        ]
+        for name, phase in stats["phases"].items():
+            lines.append(
+                f"{name[:16]:<16} {phase['ms']:7.2f} {phase['max']:6.1f} {phase['blocks']:+8.1f}"
+            )
+        cache = text_cache.stats()
+        lines.append(
+            f"textos {cache['size']}  aciertos {cache['hits']}  fallos {cache['misses']}"
+            f"  expulsados {cache['evictions']}  ({cache['hit_rate']:.0%})"
+        )
+        return lines
+
+    def draw(self, surface):
+        """
+        Dibuja el panel sobre la ventana y actualiza solo su zona.
+
+        El texto se recalcula cada PROFILER_REFRESH fotogramas; entre medias se
+        reutiliza la superficie del panel.
+
+        Args:
+            surface (pygame.Surface): Ventana del juego.
+        """
+        if not self.visible:
+            return
+        if not self._lines or self._panel is None:
+            self._lines = self._build_lines()
+            # El panel solo crece, para tapar siempre el texto anterior
+            min_size = self._panel.get_size() if self._panel is not None else (0, 0)
+            self._panel = _render_panel(self._lines, min_size)
+        rect = surface.blit(self._panel, OVERLAY_POS)
+        pygame.display.update(rect)
+
+
+def percentile(sorted_values, q):
+    """
+    Devuelve el percentil `q` de una lista ya ordenada (método del rango más cercano).
+
+    Args:
+        sorted_values (list[float]): Valores ordenados de menor a mayor.
+        q (float): Percentil entre 0 y 100.
+
+    Returns:
+        float: Valor del percentil (0.0 si la lista está vacía).
+    """
+    if not sorted_values:
+        return 0.0
+    index = max(0, min(len(sorted_values) - 1, math.ceil(q / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def _render_panel(lines, min_size=(0, 0)):
+    """Renderiza las líneas del panel sobre un fondo opaco de al menos `min_size`."""
+    font = load_font(None, OVERLAY_FONT_SIZE)
+    # Texto que cambia en cada actualización: no se guarda en la caché de textos
+    surfaces = [font.render(line, True, OVERLAY_TEXT) for line in lines]
+    width = max(max(s.get_width() for s in surfaces) + 16, min_size[0])
+    height = max(sum(s.get_height() for s in surfaces) + 12, min_size[1])
+    panel = pygame.Surface((width, height))
+    panel.fill(OVERLAY_COLOR)
+    y = 6
+    for text_surf in surfaces:
+        panel.blit(text_surf, (8, y))
+        y += text_surf.get_height()
+    return panel
+
+
+# Instancia compartida por el bucle principal, las pantallas y el renderizador
+profiler = FrameProfiler()
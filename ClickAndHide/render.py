@@ -0,0 +1,192 @@
+"""
+render.py — Renderizado por rectángulos sucios de Click & Hide.
+
+En lugar de redibujar toda la ventana y llamar a `pygame.display.flip()`
+en cada fotograma, cada elemento de la interfaz (cabecera, tienda, botón de
+clic, notificaciones...) se registra como un `Widget` que informa de:
+  - su área en pantalla (`bounds`),
+  - una clave de estado (`state`) que cambia cuando cambia lo que dibuja.
+
+`DirtyRenderer` compara esos datos con los del fotograma anterior y solo
+redibuja (fondo + widgets afectados) las zonas dañadas, que se envían a la
+pantalla con `pygame.display.update(rects)`.
+
+Con la superposición de depuración activa (F4) se dibuja el contorno de
+las zonas actualizadas en cada fotograma.
+"""
+
+import pygame
+
+from profiler import profiler
+
+DEBUG_COLOR = (255, 0, 0)  # Color del contorno de las zonas dañadas
+
+
+# --- ELEMENTO DE LA ESCENA ---
+class Widget:
+    """
+    Elemento de la interfaz gestionado por `DirtyRenderer`.
+
+    Atributos:
+        name (str): Nombre del elemento (para depuración).
+        draw (callable): Función `draw(screen, mouse_pos)` que dibuja el elemento.
+        bounds (callable): Función que devuelve el `pygame.Rect` que ocupa, o None si no se ve.
+        state (callable): Función `state(mouse_pos)` que devuelve una clave comparable;
+            el elemento se redibuja cuando cambia.
+        last_bounds (pygame.Rect | None): Área del fotograma anterior.
+        last_state (object): Clave de estado del fotograma anterior.
+    """
+
+    def __init__(self, name, draw, bounds, state):
+        """Inicializa el elemento sin estado previo (se dibujará en el primer fotograma)."""
+        self.name = name
+        self.draw = draw
+        self.bounds = bounds
+        self.state = state
+        self.last_bounds = None
+        self.last_state = None
+
+
+# --- CLASE PRINCIPAL: DIRTYRENDERER ---
+class DirtyRenderer:
+    """
+    Compositor que solo redibuja y actualiza las zonas de pantalla que cambian.
+
+    Atributos:
+        screen (pygame.Surface): Superficie de la ventana.
+        background (callable): Función `background(screen)` que dibuja el fondo estático.
+        widgets (list[Widget]): Elementos en orden de dibujo (de atrás hacia delante).
+        debug (bool): Si es True, se dibuja el contorno de las zonas dañadas.
+        last_damage (list[pygame.Rect]): Zonas actualizadas en el último fotograma.
+
+    Métodos:
+        add(name, draw, bounds, state): Registra un elemento.
+        invalidate(): Fuerza el redibujado completo en el siguiente fotograma.
+        toggle_debug(): Activa o desactiva la superposición de depuración.
+        render(mouse_pos): Redibuja las zonas dañadas y las envía a la pantalla.
+    """
+
+    def __init__(self, screen, background):
+        """
+        Inicializa el compositor.
+
+        Args:
+            screen (pygame.Surface): Superficie de la ventana.
+            background (callable): Función que dibuja el fondo estático completo.
+        """
+        self.screen = screen
+        self.background = background
+        self.widgets = []
+        self.debug = False
+        self.last_damage = []
+        self._full_redraw = True
+
+    def add(self, name, draw, bounds, state):
+        """
+        Registra un elemento al final del orden de dibujo.
+
+        Args:
+            name (str): Nombre del elemento.
+            draw (callable): Función de dibujo `draw(screen, mouse_pos)`.
+            bounds (callable): Función que devuelve el área ocupada.
+            state (callable): Función `state(mouse_pos)` con la clave de estado.
+
+        Returns:
+            Widget: Elemento creado.
+        """
+        widget = Widget(name, draw, bounds, state)
+        self.widgets.append(widget)
+        return widget
+
+    def invalidate(self):
+        """Fuerza el redibujado de toda la pantalla en el siguiente fotograma."""
+        self._full_redraw = True
+
+    def toggle_debug(self):
+        """Activa o desactiva el contorno de las zonas dañadas."""
+        self.debug = not self.debug
+        self._full_redraw = True
+
+    # --- CÁLCULO DE ZONAS DAÑADAS ---
+    def _collect_damage(self, mouse_pos):
+        """Devuelve las zonas que han cambiado desde el fotograma anterior."""
+        damage = []
+        for widget in self.widgets:
+            bounds = widget.bounds()
+            state = widget.state(mouse_pos)
+            if state != widget.last_state or bounds != widget.last_bounds:
+                if widget.last_bounds is not None:
+                    damage.append(widget.last_bounds)
+                if bounds is not None:
+                    damage.append(bounds)
+            widget.last_bounds = bounds
+            widget.last_state = state
+
+        if self._full_redraw:
+            self._full_redraw = False
+            return [self.screen.get_rect()]
+
+        if self.debug:
+            # Borra los contornos dibujados en el fotograma anterior
+            damage.extend(self.last_damage)
+        return _merge_rects(damage, self.screen.get_rect())
+
+    # --- DIBUJO ---
+    def render(self, mouse_pos):
+        """
+        Redibuja las zonas dañadas y actualiza solo esas zonas en la ventana.
+
+        Args:
+            mouse_pos (tuple[int, int]): Posición actual del ratón.
+
+        Returns:
+            list[pygame.Rect]: Zonas actualizadas en este fotograma.
+        """
+        damage = self._collect_damage(mouse_pos)
+        profiler.mark("zonas")
+        for rect in damage:
+            self.screen.set_clip(rect)
+            self.background(self.screen)
+            profiler.mark("fondo")
+            for widget in self.widgets:
+                if widget.last_bounds is not None and widget.last_bounds.colliderect(rect):
+                    widget.draw(self.screen, mouse_pos)
+                    profiler.mark(widget.name)
+        self.screen.set_clip(None)
+
+        if self.debug:
+            for rect in damage:
+                pygame.draw.rect(self.screen, DEBUG_COLOR, rect, 1)
+
+        if damage:
+            pygame.display.update(damage)
+        profiler.mark("pantalla")
+        self.last_damage = damage
+        return damage
+
+
+def _merge_rects(rects, screen_rect):
+    """
+    Une los rectángulos que se solapan para no redibujar dos veces la misma zona.
+
+    Args:
+        rects (list[pygame.Rect]): Zonas dañadas.
+        screen_rect (pygame.Rect): Área de la pantalla (las zonas se recortan a ella).
+
+    Returns:
+        list[pygame.Rect]: Zonas sin solapamientos, dentro de la pantalla.
+    """
+    merged = []
+    for rect in rects:
+        rect = rect.clip(screen_rect)
+        if not rect.width or not rect.height:
+            continue
+        i = 0
+        while i < len(merged):
+            if merged[i].colliderect(rect):
+                rect = rect.union(merged.pop(i))
+                i = 0
+            else:
+                i += 1
+        merged.append(rect)
+    return merged
@@ -2,93 +2,253 @@
 save.py — Gestión de guardado y carga de partidas de Click & Hide.
 
 Incluye funciones para:
-  - Guardar automáticamente el estado del jugador y la tienda.
-  - Cargar partidas existentes al iniciar el juego.
-El archivo de guardado será `savegame.json` en la carpeta raíz del proyecto.
+  - Construir y escribir el estado del jugador y la tienda
+    (el guardado periódico lo gestiona `autosave.AutoSaver`).
+  - Cargar partidas existentes al iniciar el juego, aplicando después
+    los eventos del diario (`journal.SaveJournal`) si se usa.
+  - Migrar partidas del antiguo formato JSON al formato binario.
+  - Calcular los ingresos obtenidos mientras no se jugaba (progreso sin conexión).
+Las escrituras son atómicas: se escribe un archivo temporal, se fuerza a
+disco y se renombra sobre el guardado anterior, que nunca queda truncado.
+El archivo de guardado será `savegame.dat` (formato en `save_format.py`)
+en la carpeta raíz del proyecto.
 """
 
 import json
 import os
+import time
+
+import save_format
+from core.bignum import BigNumber
+from core.rules import offline_earnings
 
 # Archivo de guardado en la carpeta donde se ejecuta el juego
-SAVE_FILE = os.path.join(os.getcwd(), "savegame.json")
+SAVE_FILE = os.path.join(os.getcwd(), "savegame.dat")
+# Guardado JSON de versiones anteriores (solo se lee para migrarlo)
+LEGACY_SAVE_FILE = os.path.join(os.getcwd(), "savegame.json")
 
 
-def save_game(player, shop):
+def build_save_data(player, shop):
     """
-    Guarda automáticamente el estado actual del jugador y la tienda en disco.
+    Construye un diccionario con el estado guardable del jugador y la tienda.
+
+    Solo copia valores simples, por lo que el resultado puede serializarse
+    en otro hilo sin compartir objetos del juego. Los datos fijos del
+    catálogo no se incluyen, los ítems se indexan por nombre y solo se
+    guarda su cantidad (el precio se deriva de ella). También se
+    guarda la hora del sistema, para el progreso sin conexión.
 
     Args:
         player (Player): Instancia del jugador con dinero, clics e ingresos.
         shop (Shop): Instancia de la tienda con los ítems y sus cantidades.
+
+    Returns:
+        dict: Datos listos para escribirse con `write_save_data`.
     """
-    data = {
+    return {
         "player": {
             "money": player.money,
             "total_clicks": player.total_clicks,
             "click_income": player.click_income,
             "auto_income": player.auto_income,
-            "total_money": player.money,  # 🔹 guarda el dinero actual también como total
         },
-        "shop": [
-            {
-                "name": getattr(item, "name", ""),
-                "cost": getattr(item, "cost", 0),
-                "base_income": getattr(item, "base_income", 0),
-                "tipo": getattr(item, "tipo", ""),
-                "amount": getattr(item, "amount", 0),
-            }
-            for item in getattr(shop, "items", [])
-        ],
+        "items": {item.name: item.amount for item in shop.items},
+        "journal_seq": 0,
+        "saved_at": time.time(),
     }
 
+
+def write_save_data(data):
+    """
+    Escribe en disco los datos generados por `build_save_data`.
+
+    Args:
+        data (dict): Estado de la partida a guardar.
+
+    Returns:
+        int: Número de bytes escritos (0 si falló la escritura).
+    """
+    tmp_path = SAVE_FILE + ".tmp"
     try:
-        with open(SAVE_FILE, "w") as f:
-            json.dump(data, f, indent=4)
+        payload = save_format.encode(data)
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, SAVE_FILE)
+        return len(payload)
     except Exception as e:
         print(f"[ERROR] No se pudo guardar la partida: {e}")
+        return 0
+
+
+def save_game(player, shop):
+    """
+    Guarda el estado actual del jugador y la tienda en disco de forma inmediata.
+
+    Args:
+        player (Player): Instancia del jugador con dinero, clics e ingresos.
+        shop (Shop): Instancia de la tienda con los ítems y sus cantidades.
+
+    Returns:
+        int: Número de bytes escritos.
+    """
+    return write_save_data(build_save_data(player, shop))
+
+
+def read_save_data():
+    """
+    Lee el guardado del disco, migrando el formato JSON antiguo si es necesario.
+
+    Returns:
+        tuple[dict | None, str | None]: Estado leído y ruta de origen,
+        o (None, None) si no hay partida guardada.
+    """
+    if os.path.exists(SAVE_FILE):
+        with open(SAVE_FILE, "rb") as f:
+            return save_format.decode(f.read()), SAVE_FILE
+    if os.path.exists(LEGACY_SAVE_FILE):
+        with open(LEGACY_SAVE_FILE, "r") as f:
+            return save_format.from_legacy_json(json.load(f)), LEGACY_SAVE_FILE
+    return None, None
 
 
-def load_game(player, shop):
+def apply_save_data(player, shop, data):
+    """
+    Restaura en el jugador y la tienda un estado leído con `read_save_data`.
+
+    Los ítems se buscan por nombre; los que ya no existen en el catálogo se ignoran.
+
+    Args:
+        player (Player): Instancia del jugador a actualizar.
+        shop (Shop): Instancia de la tienda a actualizar.
+        data (dict): Estado de la partida.
+    """
+    player_data = data["player"]
+    player.money = BigNumber(player_data["money"])
+    player.total_clicks = int(player_data["total_clicks"])
+    player.click_income = _number(player_data["click_income"])
+    player.auto_income = _number(player_data["auto_income"])
+    player.total_money = player.money
+
+    items_by_name = shop.items_by_name
+    for name, amount in data["items"].items():
+        item = items_by_name.get(name)
+        if item is not None:
+            item.amount = amount
+    player.upgrades_bought = sum(item.amount for item in shop.items)
+
+
+def load_game(player, shop, journal=None):
     """
     Carga la partida guardada si existe y actualiza el jugador y la tienda.
 
+    Después de cargarla suma los ingresos automáticos del tiempo pasado
+    fuera del juego (ver `apply_offline_progress`).
+
     Args:
         player (Player): Instancia del jugador que se actualizará con los datos guardados.
         shop (Shop): Instancia de la tienda cuyos ítems se actualizarán según la partida guardada.
+        journal (SaveJournal, opcional): Diario cuyos eventos posteriores
+            a la instantánea se aplican tras cargarla.
+
+    Returns:
+        dict | None: Resumen del progreso sin conexión, o None si no hubo.
     """
-    if not os.path.exists(SAVE_FILE):
+    if journal is not None:
+        # Antes que nada: aunque la instantánea falle, la secuencia sigue a la del diario
+        journal.resume()
+
+    try:
+        data, path = read_save_data()
+    except Exception as e:
+        print(f"[ERROR] No se pudo cargar la partida: {e}")
+        return None
+
+    if data is None:
         print(f"[LOAD] No se encontró partida guardada en: {SAVE_FILE}")
-        return
+        if journal is not None:
+            _replay_journal(player, shop, journal, 0)
+        return None
 
     try:
-        with open(SAVE_FILE, "r") as f:
-            data = json.load(f)
-
-        player_data = data.get("player", {})
-
-        # Restaurar datos básicos
-        player.money = player_data.get("money", getattr(player, "money", 0))
-        player.total_clicks = player_data.get(
-            "total_clicks", getattr(player, "total_clicks", 0)
-        )
-        player.click_income = player_data.get(
-            "click_income", getattr(player, "click_income", 0)
-        )
-        player.auto_income = player_data.get(
-            "auto_income", getattr(player, "auto_income", 0)
-        )
-
-        # 🔹 Guardar también el dinero total dinámicamente
-        player.total_money = player_data.get("total_money", player.money)
-
-        # Restaurar datos de la tienda
-        shop_data = data.get("shop", [])
-        for item, saved_item in zip(getattr(shop, "items", []), shop_data):
-            item.amount = saved_item.get("amount", getattr(item, "amount", 0))
-            item.cost = saved_item.get("cost", getattr(item, "cost", 0))
-
-        print(f"[LOAD] Partida cargada correctamente desde: {SAVE_FILE}")
+        apply_save_data(player, shop, data)
+        print(f"[LOAD] Partida cargada correctamente desde: {path}")
+        if path == LEGACY_SAVE_FILE:
+            # El siguiente guardado se escribirá ya en formato binario
+            player.dirty = True
+
+        last_seen = data.get("saved_at")
+        if journal is not None:
+            journal_time = _modified_time(journal.path)
+            if _replay_journal(player, shop, journal, data.get("journal_seq", 0)):
+                # Los eventos del diario son posteriores a la instantánea
+                last_seen = max(last_seen or 0, journal_time or 0) or None
+
+        return apply_offline_progress(player, last_seen)
 
     except Exception as e:
         print(f"[ERROR] No se pudo cargar la partida: {e}")
+        return None
+
+
+def apply_offline_progress(player, last_seen, now=None):
+    """
+    Suma al jugador el ingreso automático del tiempo pasado sin jugar.
+
+    El cálculo es directo (`core.rules.offline_earnings`), sin simular cada
+    segundo, con el límite `OFFLINE_MAX_SECONDS` y la eficiencia
+    `OFFLINE_EFFICIENCY` de config.py.
+
+    Args:
+        player (Player): Instancia del jugador ya cargada.
+        last_seen (float | None): Hora del sistema de la última partida guardada.
+        now (float, opcional): Hora actual. Si no se pasa, se usa time.time().
+
+    Returns:
+        dict | None: Segundos fuera ("elapsed"), segundos contabilizados ("seconds")
+        y dinero ganado ("earned"), o None si no se ganó nada.
+    """
+    if last_seen is None:
+        return None
+    if now is None:
+        now = time.time()
+    elapsed = now - last_seen
+    seconds, earned = offline_earnings(player.auto_income, elapsed)
+    if earned <= 0:
+        return None
+
+    player.money += earned
+    player.total_money = player.money
+    player.dirty = True
+    print(f"[LOAD] Ingresos sin conexión: +{earned}$ ({seconds} s de {int(elapsed)} s)")
+    return {"elapsed": elapsed, "seconds": seconds, "earned": earned}
+
+
+def _replay_journal(player, shop, journal, after_seq):
+    """
+    Aplica los eventos del diario posteriores a la instantánea cargada.
+
+    Returns:
+        int: Número de eventos aplicados.
+    """
+    applied = journal.replay(player, shop, after_seq)
+    if applied:
+        player.total_money = player.money
+        player.upgrades_bought = sum(item.amount for item in shop.items)
+        player.dirty = True  # La siguiente instantánea compacta el diario
+        print(f"[LOAD] {applied} eventos recuperados del diario: {journal.path}")
+    return applied
+
+
+def _modified_time(path):
+    """Devuelve la hora de la última modificación de `path`, o None si no existe."""
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return None
+
+
+def _number(value):
+    """Devuelve `value` como int si no tiene parte decimal."""
+    return int(value) if float(value).is_integer() else value
@@ -0,0 +1,187 @@
+"""
+save_format.py — Formato binario versionado de las partidas de Click & Hide.
+
+El guardado solo contiene el estado que cambia durante la partida. Los datos
+fijos del catálogo (ingreso base, tipo, color) no se guardan, y los ítems se
+identifican por nombre en lugar de por su posición en la tienda.
+
+Estructura (little-endian):
+  - Cabecera: b"CHSV" + versión (u8)
+  - Jugador: money (f64 mantisa + i64 exponente binario), total_clicks (u64),
+    click_income (f64), auto_income (f64), journal_seq (u64), saved_at (f64)
+  - Ítems en columnas:
+      número de ítems (u32),
+      longitud (u32) + nombres en UTF-8 separados por "\\n",
+      cantidades (u32 × n)
+  - CRC32 (u32) de todo lo anterior
+
+Guardar los ítems por columnas permite decodificar las cantidades de golpe
+con `array.frombytes`, de modo que la carga sigue siendo rápida aunque el
+catálogo crezca a cientos de ítems. El precio de cada ítem se deriva de su
+coste base y su cantidad, por lo que no se guarda.
+
+`saved_at` es la hora del sistema (time.time()) del guardado; se usa para
+calcular los ingresos obtenidos sin jugar.
+
+El dinero se guarda como el par (mantisa, exponente) de
+`core.bignum.BigNumber`, sin pérdidas aunque supere el rango de un float.
+
+Solo se lee la versión actual (VERSION); los guardados JSON antiguos se
+convierten con `from_legacy_json`.
+"""
+
+import struct
+import sys
+import zlib
+from array import array
+
+from core.bignum import BigNumber
+
+MAGIC = b"CHSV"
+VERSION = 4
+
+_HEADER = struct.Struct("<4sB")
+_PLAYER = struct.Struct("<dqQddQd")
+_U32 = struct.Struct("<I")
+
+
+class SaveFormatError(ValueError):
+    """Error al decodificar un guardado binario corrupto o de versión desconocida."""
+
+
+# --- CODIFICACIÓN ---
+def encode(data):
+    """
+    Codifica el estado de la partida en el formato binario actual.
+
+    Args:
+        data (dict): Estado con las claves "player", "items", "journal_seq"
+            y "saved_at", tal como lo genera `save.build_save_data`.
+
+    Returns:
+        bytes: Guardado binario listo para escribir en disco.
+    """
+    player = data["player"]
+    items = data["items"]
+    names = list(items)
+    if any("\n" in name for name in names):
+        raise ValueError("Los nombres de ítem no pueden contener saltos de línea")
+
+    amounts = array("I", (items[name] for name in names))
+    if sys.byteorder != "little":
+        amounts.byteswap()
+    names_blob = "\n".join(names).encode("utf-8")
+    money = BigNumber(player["money"])
+
+    body = b"".join(
+        (
+            _HEADER.pack(MAGIC, VERSION),
+            _PLAYER.pack(
+                money.mantissa,
+                money.exponent,
+                int(player["total_clicks"]),
+                float(player["click_income"]),
+                float(player["auto_income"]),
+                int(data.get("journal_seq", 0)),
+                float(data.get("saved_at") or 0.0),
+            ),
+            _U32.pack(len(names)),
+            _U32.pack(len(names_blob)),
+            names_blob,
+            amounts.tobytes(),
+        )
+    )
+    return body + _U32.pack(zlib.crc32(body))
+
+
+# --- DECODIFICACIÓN ---
+def decode(blob):
+    """
+    Decodifica un guardado binario de la versión actual.
+
+    Args:
+        blob (bytes): Contenido del archivo de guardado.
+
+    Returns:
+        dict: Estado con el mismo formato que acepta `encode`.
+
+    Raises:
+        SaveFormatError: Si el archivo está corrupto o su versión no es soportada.
+    """
+    if len(blob) < _HEADER.size + _U32.size:
+        raise SaveFormatError("Guardado demasiado corto")
+    body, (crc,) = blob[:-_U32.size], _U32.unpack(blob[-_U32.size:])
+    if zlib.crc32(body) != crc:
+        raise SaveFormatError("CRC incorrecto")
+
+    magic, version = _HEADER.unpack_from(body, 0)
+    if magic != MAGIC:
+        raise SaveFormatError("Cabecera desconocida")
+    if version != VERSION:
+        raise SaveFormatError(f"Versión de guardado no soportada: {version}")
+
+    mantissa, exponent, total_clicks, click_income, auto_income, journal_seq, saved_at = (
+        _PLAYER.unpack_from(body, _HEADER.size)
+    )
+    return {
+        "player": {
+            "money": BigNumber(mantissa, exponent),
+            "total_clicks": total_clicks,
+            "click_income": click_income,
+            "auto_income": auto_income,
+        },
+        "items": _decode_items(body, _HEADER.size + _PLAYER.size),
+        "journal_seq": journal_seq,
+        "saved_at": saved_at or None,
+    }
+
+
+def _decode_items(body, offset):
+    """
+    Decodifica la tabla de ítems por columnas que empieza en `offset`.
+
+    Returns:
+        dict[str, int]: Cantidad comprada de cada ítem, por nombre.
+    """
+    (count,) = _U32.unpack_from(body, offset)
+    (names_len,) = _U32.unpack_from(body, offset + 4)
+    offset += 8
+
+    names_blob = body[offset:offset + names_len]
+    names = names_blob.decode("utf-8").split("\n") if count else []
+    offset += names_len
+
+    amounts = array("I")
+    amounts.frombytes(body[offset:offset + 4 * count])
+    if sys.byteorder != "little":
+        amounts.byteswap()
+    if len(names) != count or len(amounts) != count:
+        raise SaveFormatError("Tabla de ítems incompleta")
+    return dict(zip(names, amounts))
+
+
+# --- MIGRACIÓN DESDE JSON ---
+def from_legacy_json(data):
+    """
+    Convierte un guardado JSON antiguo (`savegame.json`) al estado actual.
+
+    Args:
+        data (dict): Contenido del JSON antiguo, con "player" y la lista "shop".
+
+    Returns:
+        dict: Estado con el mismo formato que acepta `encode`.
+    """
+    player = data.get("player", {})
+    return {
+        "player": {
+            "money": BigNumber(player.get("money", 0)),
+            "total_clicks": player.get("total_clicks", 0),
+            "click_income": player.get("click_income", 1),
+            "auto_income": player.get("auto_income", 0),
+        },
+        "items": {
+            entry.get("name", ""): entry.get("amount", 0) for entry in data.get("shop", [])
+        },
+        "journal_seq": data.get("journal_seq", 0),
+        "saved_at": data.get("saved_at"),
+    }
@@ -0,0 +1,367 @@
+"""
+screens.py — Pila de pantallas de Click & Hide.
+
+Cada pantalla (menú principal, paneles, partida, demo) es un `Screen` que se
+construye una sola vez y se apila en un `ScreenManager`:
+  - `push(screen)` muestra una pantalla encima de la actual (por ejemplo,
+    un panel sobre el menú),
+  - `pop()` la quita y vuelve a la anterior,
+  - `quit()` termina el bucle.
+
+El gestor tiene el único bucle principal y el único reloj del juego: en cada
+fotograma reparte los eventos a la pantalla de arriba, la actualiza y la
+dibuja. `F3` muestra el perfilador de fotogramas (`profiler.py`) en
+cualquier pantalla.
+
+Ritmo de fotogramas: el bucle va a FPS mientras hay entrada del jugador o
+la pantalla de arriba tiene una animación en curso (`animating`). Tras
+IDLE_DELAY segundos sin entrada, o con la ventana sin foco, baja a IDLE_FPS,
+y con la ventana minimizada a MINIMIZED_FPS. Mientras va lento espera con
+`pygame.event.wait`, así que cualquier evento lo despierta al momento. El
+tiempo de juego, los ingresos y el guardado siguen al reloj real, así que
+no dependen del ritmo de fotogramas.
+
+Entrada: la cola de Pygame solo admite los tipos de evento que usa el juego
+(`ALLOWED_EVENTS`), los movimientos seguidos del ratón de un fotograma se
+funden en uno solo (`coalesce_motion`) y cada pantalla recibe únicamente los
+tipos que declara en `handled_events`, con la posición del propio evento.
+Así un ratón de 1000 Hz o un arrastre del deslizador cuestan lo mismo que un
+movimiento por fotograma.
+
+Ir y volver entre pantallas no crea bucles anidados ni llamadas recursivas,
+y no vuelve a construir nada: solo se llama a `enter`/`leave`.
+"""
+
+import time
+
+import pygame
+
+from config import FPS, IDLE_FPS, MINIMIZED_FPS, IDLE_DELAY
+from profiler import profiler
+from startup import startup_trace
+
+
+# Eventos que cuentan como actividad del jugador
+INPUT_EVENTS = frozenset(
+    (
+        pygame.KEYDOWN,
+        pygame.KEYUP,
+        pygame.MOUSEBUTTONDOWN,
+        pygame.MOUSEBUTTONUP,
+        pygame.MOUSEMOTION,
+        pygame.MOUSEWHEEL,
+    )
+)
+
+
+# Eventos que admite la cola: entrada, cierre, volver a mostrar la ventana y
+# los cambios de foco o minimizado que marcan el ritmo de fotogramas. El
+# resto (texto, joystick, audio, arrastrar archivos...) no llega a encolarse.
+ALLOWED_EVENTS = INPUT_EVENTS | frozenset(
+    (
+        pygame.QUIT,
+        pygame.VIDEOEXPOSE,
+        pygame.WINDOWFOCUSLOST,
+        pygame.WINDOWFOCUSGAINED,
+        pygame.WINDOWMINIMIZED,
+        pygame.WINDOWHIDDEN,
+        pygame.WINDOWRESTORED,
+        pygame.WINDOWSHOWN,
+        pygame.WINDOWMAXIMIZED,
+    )
+)
+
+
+# --- FILTRADO DE EVENTOS ---
+def allow_events(types=ALLOWED_EVENTS):
+    """
+    Restringe la cola de Pygame a los tipos de evento indicados.
+
+    Requiere la pantalla de Pygame iniciada; puede llamarse varias veces.
+
+    Args:
+        types (Iterable[int]): Tipos de evento admitidos.
+    """
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed(list(types))
+
+
+def coalesce_motion(events):
+    """
+    Funde los MOUSEMOTION seguidos en uno solo con la última posición.
+
+    Solo se funden movimientos consecutivos: un clic o una tecla entre medias
+    separa los movimientos de antes y de después, así que el orden y la
+    posición de cada clic se conservan. El desplazamiento (`rel`) se suma.
+
+    Args:
+        events (list[pygame.event.Event]): Eventos del fotograma, en orden.
+
+    Returns:
+        list[pygame.event.Event]: Eventos con los movimientos redundantes fundidos.
+    """
+    merged = []
+    for event in events:
+        if event.type == pygame.MOUSEMOTION and merged and merged[-1].type == pygame.MOUSEMOTION:
+            previous = merged[-1]
+            rel = (previous.rel[0] + event.rel[0], previous.rel[1] + event.rel[1])
+            merged[-1] = pygame.event.Event(pygame.MOUSEMOTION, event.dict, rel=rel)
+        else:
+            merged.append(event)
+    return merged
+
+
+# --- CLASE BASE: SCREEN ---
+class Screen:
+    """
+    Pantalla gestionada por `ScreenManager`.
+
+    Las subclases sobrescriben los métodos que necesiten; los de esta clase
+    no hacen nada.
+
+    Atributos:
+        manager (ScreenManager | None): Gestor en el que está apilada.
+        handled_events (frozenset[int]): Tipos de evento que recibe `handle_event`.
+
+    Métodos:
+        enter(): Se llama cada vez que la pantalla queda arriba de la pila.
+        leave(): Se llama cada vez que deja de estar arriba (se quita o se tapa).
+        handle_event(event, mouse_pos): Procesa un evento de Pygame.
+        update(dt): Actualiza la lógica del fotograma.
+        draw(mouse_pos): Dibuja la pantalla y actualiza la ventana.
+        animating(): Indica si hay una animación que necesita FPS completos.
+    """
+
+    manager = None
+    # Lo que usan casi todas las pantallas: teclas, clics y volver a mostrarse
+    handled_events = frozenset((pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN, pygame.VIDEOEXPOSE))
+
+    def enter(self):
+        """Se llama al apilar la pantalla y al volver a ella tras quitar la de encima."""
+
+    def leave(self):
+        """Se llama al quitar la pantalla o al apilar otra encima."""
+
+    def handle_event(self, event, mouse_pos):
+        """
+        Procesa un evento de Pygame de uno de los tipos de `handled_events`.
+
+        Args:
+            event (pygame.event.Event): Evento recibido.
+            mouse_pos (tuple[int, int]): Posición del ratón en el evento (o en el fotograma,
+                si el evento no la trae).
+        """
+
+    def update(self, dt):
+        """
+        Actualiza la lógica de la pantalla.
+
+        Args:
+            dt (float): Segundos reales desde el fotograma anterior.
+        """
+
+    def draw(self, mouse_pos):
+        """
+        Dibuja la pantalla (y envía a la ventana lo que haya cambiado).
+
+        Args:
+            mouse_pos (tuple[int, int]): Posición del ratón en este fotograma.
+        """
+
+    def animating(self):
+        """
+        Indica si la pantalla se está animando sola (sin entrada del jugador).
+
+        Returns:
+            bool: True para mantener FPS completos aunque no haya entrada.
+        """
+        return False
+
+
+# --- CLASE PRINCIPAL: SCREENMANAGER ---
+class ScreenManager:
+    """
+    Pila de pantallas con un único bucle principal.
+
+    Atributos:
+        surface (pygame.Surface): Ventana del juego.
+        clock (pygame.time.Clock): Reloj compartido por todas las pantallas.
+        fps (int): Fotogramas por segundo máximos (0: sin límite ni esperas).
+        target_fps (int): Fotogramas por segundo elegidos para el último fotograma.
+        focused (bool): Si la ventana tiene el foco.
+        minimized (bool): Si la ventana está minimizada.
+        stack (list[Screen]): Pantallas apiladas (la última es la visible).
+        running (bool): False cuando se ha pedido salir.
+        dt (float): Segundos reales del último fotograma.
+        frames (int): Fotogramas dibujados desde que se creó.
+
+    Métodos:
+        push(screen): Apila una pantalla.
+        pop(): Quita la pantalla de arriba.
+        quit(): Termina el bucle principal.
+        toggle_profiler(): Muestra u oculta el perfilador de fotogramas (F3).
+        pace(): Elige los fotogramas por segundo del siguiente fotograma.
+        run(): Ejecuta el bucle hasta que se vacía la pila o se sale.
+    """
+
+    def __init__(self, surface, fps=FPS):
+        """
+        Inicializa el gestor con la pila vacía.
+
+        Args:
+            surface (pygame.Surface): Ventana del juego.
+            fps (int): Fotogramas por segundo máximos (0: sin límite ni esperas).
+        """
+        allow_events()
+        self.surface = surface
+        self.clock = pygame.time.Clock()
+        self.fps = fps
+        self.target_fps = fps
+        self.focused = True
+        self.minimized = False
+        self._last_input = time.perf_counter()
+        self.stack = []
+        self.running = False
+        self.dt = 0.0
+        self.frames = 0
+
+    @property
+    def top(self):
+        """Screen | None: Pantalla visible (la de arriba de la pila)."""
+        return self.stack[-1] if self.stack else None
+
+    def push(self, screen):
+        """
+        Apila una pantalla encima de la actual.
+
+        Args:
+            screen (Screen): Pantalla ya construida.
+        """
+        if self.stack:
+            self.stack[-1].leave()
+        screen.manager = self
+        self.stack.append(screen)
+        screen.enter()
+
+    def pop(self):
+        """
+        Quita la pantalla de arriba y vuelve a la anterior.
+
+        Returns:
+            Screen | None: Pantalla quitada.
+        """
+        if not self.stack:
+            return None
+        screen = self.stack.pop()
+        screen.leave()
+        if self.stack:
+            self.stack[-1].enter()
+        return screen
+
+    def quit(self):
+        """Termina el bucle principal al acabar el fotograma actual."""
+        self.running = False
+
+    def toggle_profiler(self):
+        """Muestra u oculta el perfilador de fotogramas (F3)."""
+        if not profiler.toggle():
+            # La pantalla de arriba se redibuja entera para borrar el panel
+            pygame.event.post(pygame.event.Event(pygame.VIDEOEXPOSE))
+
+    # --- RITMO DE FOTOGRAMAS ---
+    def pace(self):
+        """
+        Elige los fotogramas por segundo según la actividad y el estado de la ventana.
+
+        Returns:
+            int: FPS, IDLE_FPS o MINIMIZED_FPS (nunca más que `fps`; 0 si no hay límite).
+        """
+        if not self.fps:
+            return 0
+        if self.minimized:
+            return min(self.fps, MINIMIZED_FPS)
+        if self.stack[-1].animating():
+            return self.fps
+        if not self.focused or time.perf_counter() - self._last_input > IDLE_DELAY:
+            return min(self.fps, IDLE_FPS)
+        return self.fps
+
+    def _wait(self):
+        """
+        Espera hasta el siguiente fotograma y devuelve los eventos pendientes.
+
+        A ritmo completo duerme con `clock.tick`; a ritmo reducido espera con
+        `pygame.event.wait`, que vuelve en cuanto llega un evento.
+
+        Returns:
+            list[pygame.event.Event]: Eventos del fotograma (con los movimientos fundidos).
+        """
+        fps = self.target_fps = self.pace()
+        profiler.set_target_fps(fps or FPS)
+        if not fps or fps == self.fps:
+            self.dt = self.clock.tick(fps) / 1000.0
+            return coalesce_motion(pygame.event.get())
+
+        event = pygame.event.wait(1000 // fps)
+        self.dt = self.clock.tick() / 1000.0
+        if event.type == pygame.NOEVENT:
+            return coalesce_motion(pygame.event.get())
+        return coalesce_motion([event] + pygame.event.get())
+
+    def _track_window(self, event):
+        """Anota la actividad del jugador y los cambios de foco o minimizado de la ventana."""
+        kind = event.type
+        if kind in INPUT_EVENTS:
+            self._last_input = time.perf_counter()
+        elif kind == pygame.WINDOWFOCUSLOST:
+            self.focused = False
+        elif kind == pygame.WINDOWFOCUSGAINED:
+            self.focused = True
+            self._last_input = time.perf_counter()
+        elif kind in (pygame.WINDOWMINIMIZED, pygame.WINDOWHIDDEN):
+            self.minimized = True
+        elif kind in (pygame.WINDOWRESTORED, pygame.WINDOWSHOWN, pygame.WINDOWMAXIMIZED):
+            self.minimized = False
+
+    # --- BUCLE PRINCIPAL ---
+    def run(self):
+        """Ejecuta el bucle principal hasta que se vacía la pila o se llama a `quit`."""
+        self.running = True
+        while self.running and self.stack:
+            profiler.begin_frame()
+            events = self._wait()
+            profiler.mark("espera")
+            mouse_pos = pygame.mouse.get_pos()
+
+            # --- Eventos (siempre para la pantalla de arriba, aunque cambie) ---
+            for event in events:
+                kind = event.type
+                if kind == pygame.QUIT:
+                    self.quit()
+                    break
+                self._track_window(event)
+                if kind == pygame.KEYDOWN and event.key == pygame.K_F3:
+                    self.toggle_profiler()
+                    continue
+                screen = self.stack[-1]
+                if kind not in screen.handled_events:
+                    continue
+                # Los eventos del ratón traen su posición; el resto usa la del fotograma
+                screen.handle_event(event, getattr(event, "pos", mouse_pos))
+                if not (self.running and self.stack):
+                    break
+            if not (self.running and self.stack):
+                break
+            profiler.mark("eventos")
+
+            # --- Actualización y dibujo ---
+            screen = self.stack[-1]
+            screen.update(self.dt)
+            profiler.mark("lógica")
+            screen.draw(mouse_pos)
+            profiler.mark("dibujo")
+            profiler.draw(self.surface)
+            profiler.mark("perfilador")
+            self.frames += 1
+            if self.frames == 1:
+                startup_trace.finish()
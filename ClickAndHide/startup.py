@@ -0,0 +1,94 @@
+"""
+startup.py — Línea de tiempo del arranque de Click & Hide.
+
+Anota cuánto tarda cada fase del arranque (importaciones, inicialización de
+Pygame, carga de recursos y partida, intro...) hasta que se dibuja el primer
+fotograma, para poder comparar el tiempo de arranque entre versiones
+(`python main.py --startup-trace`).
+
+Este módulo solo usa la biblioteca estándar para poder importarse antes que
+Pygame: el tiempo se cuenta desde que se importa por primera vez.
+"""
+
+import time
+
+# Instante en que empezó el arranque (primera importación de este módulo)
+_START = time.perf_counter()
+
+
+# --- CLASE PRINCIPAL: STARTUPTRACE ---
+class StartupTrace:
+    """
+    Registro de las fases del arranque.
+
+    Mientras está desactivada, `mark` y `finish` no hacen nada, así que las
+    llamadas pueden quedarse en el código sin coste.
+
+    Atributos:
+        enabled (bool): Si se anotan las fases.
+        start (float): Instante de inicio (`time.perf_counter`).
+        phases (list[tuple[str, float]]): Fases anotadas y el instante en que terminaron.
+        finished (bool): True cuando ya se mostró la línea de tiempo.
+
+    Métodos:
+        enable(): Empieza a anotar fases.
+        mark(name): Anota el final de una fase.
+        finish(name): Anota la última fase y muestra la línea de tiempo (una sola vez).
+        report(): Muestra la línea de tiempo.
+    """
+
+    def __init__(self, start=_START):
+        """
+        Args:
+            start (float): Instante de inicio del arranque.
+        """
+        self.enabled = False
+        self.start = start
+        self.phases = []
+        self.finished = False
+
+    def enable(self):
+        """Empieza a anotar fases (las anteriores se miden desde `start`)."""
+        self.enabled = True
+
+    def mark(self, name):
+        """
+        Anota que la fase `name` acaba de terminar.
+
+        Args:
+            name (str): Nombre de la fase.
+        """
+        if self.enabled and not self.finished:
+            self.phases.append((name, time.perf_counter()))
+
+    def finish(self, name="primer fotograma"):
+        """
+        Anota la última fase y muestra la línea de tiempo, solo la primera vez.
+
+        Args:
+            name (str): Nombre de la última fase.
+        """
+        if self.enabled and not self.finished:
+            self.mark(name)
+            self.finished = True
+            self.report()
+
+    def report(self):
+        """
+        Muestra por consola la duración de cada fase y el tiempo acumulado.
+
+        Returns:
+            float: Segundos desde el inicio hasta la última fase anotada.
+        """
+        print("[STARTUP] Fase                          duración   acumulado")
+        previous = self.start
+        for name, instant in self.phases:
+            duration = (instant - previous) * 1000
+            total = (instant - self.start) * 1000
+            print(f"[STARTUP] {name:<28} {duration:8.1f} ms {total:8.1f} ms")
+            previous = instant
+        return previous - self.start
+
+
+# Instancia compartida por todo el juego
+startup_trace = StartupTrace()
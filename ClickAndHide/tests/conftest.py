@@ -0,0 +1,6 @@
+"""Permite importar los módulos del juego (`core`, `entities`...) desde las pruebas."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
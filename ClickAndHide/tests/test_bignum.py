@@ -0,0 +1,35 @@
+"""
+tests/test_bignum.py
+
+Pruebas del formato corto de `core.bignum`: las cifras se truncan y nunca
+muestran más dinero del que hay.
+"""
+
+import pytest
+
+from core.bignum import BigNumber, format_short
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (950, "950"),
+        (1234, "1.23K"),
+        (4500000, "4.5M"),
+        (78 * 10**41, "7.8e42"),
+        (999999, "999K"),
+        (10**6, "1M"),
+        (999 * 10**33, "999Dc"),
+        (10**36 - 1, "999Dc"),
+        (10**33, "1Dc"),
+        (10**200 - 1, "9.99e199"),
+    ],
+)
+def test_format_short(value, expected):
+    assert format_short(value) == expected
+    assert format_short(BigNumber(value)) == expected
+
+
+def test_big_integers_convert_without_rounding_up():
+    assert int(BigNumber(10**36 - 1)) <= 10**36 - 1
+    assert int(BigNumber(2**600 - 1)) <= 2**600 - 1
@@ -0,0 +1,57 @@
+"""
+tests/test_catalog.py
+
+Pruebas de la validación del catálogo de la tienda (`core.catalog`): toda
+definición incorrecta se rechaza con ValueError.
+"""
+
+import pytest
+
+from core.catalog import Catalog
+
+
+def make_definition(**changes):
+    definition = {
+        "name": "Ratón",
+        "cost": 15,
+        "income": 1,
+        "tipo": "click",
+        "color": [230, 200, 150],
+    }
+    definition.update(changes)
+    return definition
+
+
+def test_valid_definition_compiles():
+    catalog = Catalog.from_definitions([make_definition(), make_definition(name="Teclado")])
+    assert len(catalog) == 2
+    assert catalog.entries[0].color == (230, 200, 150)
+
+
+@pytest.mark.parametrize(
+    "definition",
+    [
+        ["Ratón", 15, 1, "click", [0, 0, 0]],
+        "Ratón",
+        None,
+        make_definition(cost=True),
+        make_definition(cost=0),
+        make_definition(cost=float("inf")),
+        make_definition(income=False),
+        make_definition(income=-1),
+        make_definition(tipo="otro"),
+        make_definition(color=[True, 0, 0]),
+        make_definition(color=[0, 0]),
+        make_definition(color=[0, 0, 256]),
+        make_definition(color=5),
+        make_definition(name=""),
+    ],
+)
+def test_invalid_definitions_raise_value_error(definition):
+    with pytest.raises(ValueError):
+        Catalog.from_definitions([definition])
+
+
+def test_repeated_names_raise_value_error():
+    with pytest.raises(ValueError):
+        Catalog.from_definitions([make_definition(), make_definition()])
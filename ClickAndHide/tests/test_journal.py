@@ -0,0 +1,97 @@
+"""
+tests/test_journal.py
+
+Pruebas del diario de guardado (`journal.SaveJournal`): líneas cortadas,
+reproducción tras una instantánea y compactación.
+"""
+
+import json
+
+import pytest
+
+from core.bignum import BigNumber
+from core.player import PlayerModel
+from core.shop import ShopModel
+from journal import SaveJournal
+
+
+@pytest.fixture
+def journal(tmp_path):
+    journal = SaveJournal(str(tmp_path / "savegame.log"))
+    yield journal
+    journal.close()
+
+
+def read_seqs(journal):
+    with open(journal.path, "r", encoding="utf-8") as f:
+        return [json.loads(line)["s"] for line in f]
+
+
+def write_clicks(journal, count, amount=5):
+    for _ in range(count):
+        journal.record_click(amount)
+
+
+def test_torn_last_line_is_dropped(journal):
+    write_clicks(journal, 2)
+    journal.close()
+    with open(journal.path, "a", encoding="utf-8") as f:
+        f.write('{"e":"click","m":5,"s"')
+
+    reloaded = SaveJournal(journal.path)
+    player = PlayerModel()
+    money = player.money
+    assert reloaded.replay(player, ShopModel()) == 2
+    assert player.money == money + 10
+    assert read_seqs(reloaded) == [1, 2]
+
+    reloaded.record_click(5)
+    reloaded.close()
+    assert read_seqs(reloaded) == [1, 2, 3]
+
+
+def test_replay_applies_only_records_after_snapshot(journal):
+    shop = ShopModel()
+    item = shop.items[0]
+    write_clicks(journal, 2)
+    journal.record_purchase(item.name, BigNumber(30), 3)
+    journal.record_click(7)
+    journal.close()
+
+    player = PlayerModel()
+    money = player.money
+    reloaded = SaveJournal(journal.path)
+    assert reloaded.replay(player, shop, after_seq=2) == 2
+    assert player.money == money - 30 + 7
+    assert player.total_clicks == 1
+    assert item.amount == 3
+    assert reloaded.seq == 4
+
+
+def test_sequence_continues_after_snapshot_or_failed_load(journal):
+    write_clicks(journal, 2)
+    journal.close()
+
+    # Instantánea más nueva que el diario: la secuencia sigue a la instantánea
+    reloaded = SaveJournal(journal.path)
+    assert reloaded.replay(PlayerModel(), ShopModel(), after_seq=10) == 0
+    assert reloaded.seq == 10
+
+    # Instantánea ilegible: sin replay, la secuencia sigue al diario
+    fresh = SaveJournal(journal.path)
+    fresh.resume()
+    fresh.record_click(5)
+    fresh.close()
+    assert read_seqs(fresh) == [1, 2, 3]
+
+
+def test_compact_keeps_only_later_records(journal):
+    write_clicks(journal, 5)
+    journal.compact(3)
+    assert read_seqs(journal) == [4, 5]
+    assert journal.pending == 2
+
+    journal.record_click(5)
+    journal.compact(6)
+    assert read_seqs(journal) == []
+    assert journal.pending == 0
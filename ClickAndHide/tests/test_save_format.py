@@ -0,0 +1,86 @@
+"""
+tests/test_save_format.py
+
+Pruebas del formato binario de guardado (`save_format`): ida y vuelta,
+guardados dañados y migración desde el JSON antiguo.
+"""
+
+import struct
+import zlib
+
+import pytest
+
+import save_format
+from core.bignum import BigNumber
+
+
+def make_data():
+    return {
+        "player": {
+            "money": BigNumber(10**400 + 123),
+            "total_clicks": 42,
+            "click_income": 3,
+            "auto_income": 2.5,
+        },
+        "items": {"Ratón": 3, "Teclado": 0, "Monitor": 70000},
+        "journal_seq": 17,
+        "saved_at": 1700000000.5,
+    }
+
+
+def test_encode_decode_round_trip():
+    data = make_data()
+    decoded = save_format.decode(save_format.encode(data))
+    assert decoded["player"]["money"] == data["player"]["money"]
+    assert decoded["player"]["total_clicks"] == 42
+    assert decoded["player"]["click_income"] == 3
+    assert decoded["player"]["auto_income"] == 2.5
+    assert decoded["items"] == data["items"]
+    assert decoded["journal_seq"] == 17
+    assert decoded["saved_at"] == 1700000000.5
+
+
+def test_round_trip_without_items_or_save_time():
+    data = make_data()
+    data["items"] = {}
+    data["saved_at"] = None
+    decoded = save_format.decode(save_format.encode(data))
+    assert decoded["items"] == {}
+    assert decoded["saved_at"] is None
+
+
+def test_corrupt_or_unknown_saves_are_rejected():
+    blob = bytearray(save_format.encode(make_data()))
+    with pytest.raises(save_format.SaveFormatError):
+        save_format.decode(bytes(blob[:3]))
+
+    flipped = bytearray(blob)
+    flipped[10] ^= 0xFF
+    with pytest.raises(save_format.SaveFormatError):
+        save_format.decode(bytes(flipped))
+
+    # Versión distinta con un CRC válido
+    body = bytes(blob[:-4])
+    body = body[:4] + bytes([save_format.VERSION + 1]) + body[5:]
+    other = body + struct.pack("<I", zlib.crc32(body))
+    with pytest.raises(save_format.SaveFormatError, match="Versión"):
+        save_format.decode(other)
+
+
+def test_legacy_json_migration():
+    legacy = {
+        "player": {"money": 1500, "total_clicks": 9, "click_income": 2, "auto_income": 1},
+        "shop": [
+            {"name": "Ratón", "cost": 23, "amount": 2},
+            {"name": "Teclado", "cost": 100, "amount": 0},
+        ],
+    }
+    data = save_format.from_legacy_json(legacy)
+    assert data["player"]["money"] == BigNumber(1500)
+    assert data["player"]["total_clicks"] == 9
+    assert data["items"] == {"Ratón": 2, "Teclado": 0}
+    assert data["journal_seq"] == 0
+    assert data["saved_at"] is None
+
+    # Lo migrado se puede volver a guardar en el formato binario
+    assert save_format.decode(save_format.encode(data))["items"] == data["items"]
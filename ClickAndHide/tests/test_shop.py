@@ -0,0 +1,53 @@
+"""
+tests/test_shop.py
+
+Pruebas de los precios de la tienda (`core.shop`): comprar en bloque cuesta
+lo mismo que comprar las unidades de una en una.
+"""
+
+import pytest
+
+from core.bignum import BigNumber
+from core.player import PlayerModel
+from core.shop import ShopModel
+
+
+@pytest.fixture
+def item():
+    return ShopModel().items[0]
+
+
+@pytest.mark.parametrize("start", [0, 1, 7, 40, 150])
+@pytest.mark.parametrize("count", [2, 10, 100])
+def test_bulk_price_equals_sum_of_single_prices(item, start, count):
+    item.amount = start
+    bulk = item.price(count)
+    total = BigNumber(0)
+    for i in range(count):
+        item.amount = start + i
+        total += item.price(1)
+    assert bulk == total
+
+
+def test_first_unit_costs_base_cost(item):
+    assert item.price(1) == item.base_cost
+    assert item.price(0) == 0
+
+
+def test_max_affordable_matches_price(item):
+    for money in (0, item.base_cost, 1000, 10**6, 10**30):
+        count = item.max_affordable(money)
+        if count:
+            assert item.price(count) <= money
+        assert item.price(count + 1) > money
+
+
+def test_buying_in_bulk_or_one_by_one_spends_the_same():
+    bulk_shop, single_shop = ShopModel(), ShopModel()
+    bulk_player, single_player = PlayerModel(), PlayerModel()
+    bulk_player.money = single_player.money = BigNumber(10**9)
+
+    assert bulk_shop.buy(bulk_shop.items[0], bulk_player, 25) is not None
+    for _ in range(25):
+        assert single_shop.buy(single_shop.items[0], single_player) is not None
+    assert bulk_player.money == single_player.money
@@ -0,0 +1,115 @@
+"""
+text_cache.py — Caché compartida de textos renderizados de Click & Hide.
+
+La mayoría de los textos del juego (etiquetas de menús, nombres de ítems,
+títulos) no cambian entre fotogramas, pero `font.render` crea una superficie
+nueva cada vez. Este módulo guarda las superficies ya renderizadas indexadas
+por (fuente, texto, color, antialias) y descarta las menos usadas cuando se
+supera el límite (LRU).
+
+Las superficies devueltas se comparten: no deben modificarse
+(por ejemplo con `set_alpha`); para eso, usar `font.render` directamente.
+"""
+
+from collections import OrderedDict
+
+from config import TEXT_CACHE_SIZE
+
+
+# --- CLASE PRINCIPAL: TEXTCACHE ---
+class TextCache:
+    """
+    Caché LRU de superficies de texto renderizadas.
+
+    Atributos:
+        max_size (int): Número máximo de superficies guardadas.
+        hits (int): Veces que el texto ya estaba en la caché.
+        misses (int): Veces que hubo que renderizar el texto.
+        evictions (int): Superficies descartadas por superar el límite.
+
+    Métodos:
+        render(font, text, color, antialias): Devuelve la superficie del texto.
+        clear(): Vacía la caché.
+        stats(): Devuelve las estadísticas de uso.
+    """
+
+    def __init__(self, max_size=TEXT_CACHE_SIZE):
+        """
+        Inicializa la caché vacía.
+
+        Args:
+            max_size (int): Número máximo de superficies guardadas.
+        """
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._surfaces = OrderedDict()
+
+    def render(self, font, text, color, antialias=True):
+        """
+        Devuelve el texto renderizado, reutilizando la superficie si ya existe.
+
+        Args:
+            font (pygame.font.Font): Fuente con la que se renderiza.
+            text (str): Texto a renderizar.
+            color (tuple): Color RGB del texto.
+            antialias (bool): Si se suavizan los bordes.
+
+        Returns:
+            pygame.Surface: Superficie con el texto (compartida, no modificar).
+        """
+        key = (font, text, tuple(color), antialias)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_size:
+            self._surfaces.popitem(last=False)
+            self.evictions += 1
+        return surface
+
+    def clear(self):
+        """Vacía la caché sin reiniciar las estadísticas."""
+        self._surfaces.clear()
+
+    def stats(self):
+        """
+        Devuelve las estadísticas de uso de la caché.
+
+        Returns:
+            dict: Tamaño actual, aciertos, fallos, expulsiones y tasa de acierto.
+        """
+        total = self.hits + self.misses
+        return {
+            "size": len(self._surfaces),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+
+# Instancia compartida por todas las pantallas del juego
+text_cache = TextCache()
+
+
+def render_text(font, text, color, antialias=True):
+    """
+    Renderiza un texto usando la caché compartida del juego.
+
+    Args:
+        font (pygame.font.Font): Fuente con la que se renderiza.
+        text (str): Texto a renderizar.
+        color (tuple): Color RGB del texto.
+        antialias (bool): Si se suavizan los bordes.
+
+    Returns:
+        pygame.Surface: Superficie con el texto (compartida, no modificar).
+    """
+    return text_cache.render(font, text, color, antialias)